@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+import sys
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from rfmo_ingest_pipeline import IngestionEngine
+from rfmo_ingest_pipeline.models import RetentionPolicy
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Delete old document versions under a retention policy.")
+    parser.add_argument("--db-path", default=str(ROOT / "rfmo_ingestion.db"))
+    parser.add_argument("--storage-root", default=str(ROOT / "rfmo"))
+    parser.add_argument("--storage-backend", choices=["directory", "segments"], default="directory")
+    parser.add_argument("--keep-last", type=int, default=None, help="Keep only the newest K versions of a document")
+    parser.add_argument(
+        "--collapse-metadata-only-days",
+        type=int,
+        default=None,
+        help="Delete versions older than N days whose extracted text did not change",
+    )
+    parser.add_argument("--max-documents", type=int, default=None, help="Documents per run; later runs resume")
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--dry-run", action="store_true", help="Only count the versions that would be deleted")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    engine = IngestionEngine(
+        db_path=args.db_path,
+        storage_root=args.storage_root,
+        storage_backend=args.storage_backend,
+    )
+    policy = RetentionPolicy(keep_last=args.keep_last, metadata_only_max_age_days=args.collapse_metadata_only_days)
+    try:
+        stats = engine.apply_retention(
+            policy, max_documents=args.max_documents, workers=args.workers, dry_run=args.dry_run
+        )
+    finally:
+        engine.close()
+
+    print(f"documents_scanned={stats.documents_scanned}")
+    print(f"versions_deleted={stats.versions_deleted}{' (dry run)' if args.dry_run else ''}")
+    print(f"versions_rebased={stats.versions_rebased}")
+    print(f"bytes_reclaimed={stats.bytes_reclaimed}")
+    print(f"bytes_rewritten={stats.bytes_rewritten}")
+    print(f"pass_completed={stats.completed}")
+
+
+if __name__ == "__main__":
+    main()
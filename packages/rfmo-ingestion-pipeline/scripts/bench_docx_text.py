@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+from io import BytesIO
+from pathlib import Path
+import re
+import sys
+import time
+import tracemalloc
+import zipfile
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from rfmo_ingest_pipeline.docx_text import iter_docx_text
+
+NS = 'xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"'
+
+
+def legacy_docx_text(body: BytesIO) -> str:
+    with zipfile.ZipFile(body) as zf:
+        xml_data = zf.read("word/document.xml").decode("utf-8", errors="replace")
+    text = re.sub(r"</w:p>", "\n", xml_data)
+    text = re.sub(r"<[^>]+>", " ", text)
+    return re.sub(r"\s+", " ", text).strip()
+
+
+def streaming_docx_text(body: BytesIO) -> str:
+    return "\n".join(iter_docx_text(body))
+
+
+def synthesize(paragraphs: int, rows: int) -> bytes:
+    run = '<w:r><w:rPr><w:b/><w:sz w:val="20"/></w:rPr><w:t xml:space="preserve">{}</w:t></w:r>'
+    parts = [f"<w:document {NS}><w:body>"]
+    for i in range(paragraphs):
+        parts.append(
+            "<w:p><w:pPr><w:pStyle w:val=\"Normal\"/></w:pPr>"
+            + run.format(f"Paragraph {i}: CPCs shall report catches of bigeye tuna ")
+            + run.format("by the deadline set out in Annex 1.")
+            + "</w:p>"
+        )
+    parts.append("<w:tbl>")
+    for i in range(rows):
+        cells = "".join(f"<w:tc><w:p>{run.format(value)}</w:p></w:tc>" for value in (f"CPC {i}", f"{i * 17} t", "2024"))
+        parts.append(f"<w:tr>{cells}</w:tr>")
+    parts.append("</w:tbl></w:body></w:document>")
+    buffer = BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr("word/document.xml", "".join(parts))
+    return buffer.getvalue()
+
+
+def bench(name: str, fn, data: bytes, repeat: int, xml_bytes: int) -> float:
+    started = time.perf_counter()
+    for _ in range(repeat):
+        fn(BytesIO(data))
+    elapsed = time.perf_counter() - started
+    tracemalloc.start()
+    fn(BytesIO(data))
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{name:>9}: {elapsed / repeat:.3f}s/doc  {xml_bytes * repeat / elapsed / 1_000_000:.1f} MB/s  peak={peak / 1_000_000:.1f} MB")
+    return elapsed
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark DOCX text extraction on a synthesized document.")
+    parser.add_argument("--paragraphs", type=int, default=20_000)
+    parser.add_argument("--rows", type=int, default=20_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    data = synthesize(args.paragraphs, args.rows)
+    with zipfile.ZipFile(BytesIO(data)) as zf:
+        xml_bytes = zf.getinfo("word/document.xml").file_size
+    print(f"docx={len(data)} bytes document.xml={xml_bytes} bytes repeat={args.repeat}")
+
+    bench("legacy", legacy_docx_text, data, args.repeat, xml_bytes)
+    bench("iterparse", streaming_docx_text, data, args.repeat, xml_bytes)
+
+
+if __name__ == "__main__":
+    main()
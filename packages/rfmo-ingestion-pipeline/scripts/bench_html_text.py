@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+import re
+import sys
+import time
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from rfmo_ingest_pipeline.html_text import visible_text
+
+
+def legacy_visible_text(html: str) -> str:
+    html = re.sub(r"<script[\s\S]*?</script>", " ", html, flags=re.IGNORECASE)
+    html = re.sub(r"<style[\s\S]*?</style>", " ", html, flags=re.IGNORECASE)
+    html = re.sub(r"<nav[\s\S]*?</nav>", " ", html, flags=re.IGNORECASE)
+    html = re.sub(r"<header[\s\S]*?</header>", " ", html, flags=re.IGNORECASE)
+    html = re.sub(r"<footer[\s\S]*?</footer>", " ", html, flags=re.IGNORECASE)
+    html = re.sub(r"<[^>]+>", " ", html)
+    return re.sub(r"\s+", " ", html).strip()
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark HTML-to-text extraction on stored snapshots.")
+    parser.add_argument("--snapshots", default=str(ROOT / "rfmo" / "wcpfc"))
+    parser.add_argument("--repeat", type=int, default=5)
+    return parser.parse_args()
+
+
+def bench(name: str, fn, pages: list[str], repeat: int) -> float:
+    total_chars = sum(len(page) for page in pages) * repeat
+    started = time.perf_counter()
+    for _ in range(repeat):
+        for page in pages:
+            fn(page)
+    elapsed = time.perf_counter() - started
+    print(f"{name:>8}: {elapsed:.3f}s  {total_chars / elapsed / 1_000_000:.1f} MB/s")
+    return elapsed
+
+
+def main() -> None:
+    args = parse_args()
+    paths = sorted(Path(args.snapshots).rglob("snapshot.html"))
+    if not paths:
+        raise SystemExit(f"no snapshot.html files under {args.snapshots}")
+    pages = [path.read_text(encoding="utf-8", errors="replace") for path in paths]
+    print(f"pages={len(pages)} chars={sum(len(page) for page in pages)} repeat={args.repeat}")
+
+    legacy = bench("legacy", legacy_visible_text, pages, args.repeat)
+    single = bench("single", visible_text, pages, args.repeat)
+    print(f"speedup={legacy / single:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -12,6 +12,7 @@ if str(SRC) not in sys.path:
     sys.path.insert(0, str(SRC))
 
 from rfmo_ingest_pipeline import IngestionEngine
+from rfmo_ingest_pipeline.pdf_text import PdfBudget
 
 
 def parse_args() -> argparse.Namespace:
@@ -24,6 +25,36 @@ def parse_args() -> argparse.Namespace:
         default="iccat,wcpfc,iotc",
         help="Comma-separated adapter names",
     )
+    parser.add_argument("--workers", type=int, default=1, help="Concurrent fetch workers (1 = sequential)")
+    parser.add_argument(
+        "--parse-workers",
+        type=int,
+        default=1,
+        help="Sandboxed PDF/DOCX parser processes (0 = in-process, no timeout or memory limit)",
+    )
+    parser.add_argument("--parse-timeout", type=float, default=120.0, help="Seconds before a parser process is killed")
+    parser.add_argument("--parse-memory-mb", type=int, default=1024, help="Address-space limit per parser process")
+    parser.add_argument("--pdf-max-pages", type=int, default=None, help="Stop PDF text extraction after N pages")
+    parser.add_argument("--pdf-max-chars", type=int, default=2_000_000, help="Truncate PDF text at N characters")
+    parser.add_argument("--pdf-max-seconds", type=float, default=None, help="Wall-clock budget per PDF")
+    parser.add_argument(
+        "--storage-compression",
+        choices=["none", "gzip", "zstd", "auto"],
+        default="none",
+        help="Compress stored artifacts (auto = zstd when installed, else gzip)",
+    )
+    parser.add_argument(
+        "--storage-backend",
+        choices=["directory", "segments"],
+        default="directory",
+        help="One directory per version, or append-only pack files with a SQLite offset index",
+    )
+    parser.add_argument(
+        "--keyframe-interval",
+        type=int,
+        default=8,
+        help="Store text artifacts whole every N versions and as deltas against the previous version in between",
+    )
     return parser.parse_args()
 
 
@@ -31,8 +62,26 @@ def main() -> None:
     args = parse_args()
     adapter_names = [a.strip() for a in args.adapters.split(",") if a.strip()]
 
-    engine = IngestionEngine(db_path=args.db_path, storage_root=args.storage_root)
-    result = engine.run_once(adapter_names=adapter_names)
+    engine = IngestionEngine(
+        db_path=args.db_path,
+        storage_root=args.storage_root,
+        max_workers=args.workers,
+        parse_workers=args.parse_workers,
+        parse_timeout_seconds=args.parse_timeout,
+        parse_memory_limit_mb=args.parse_memory_mb,
+        pdf_budget=PdfBudget(
+            max_pages=args.pdf_max_pages,
+            max_chars=args.pdf_max_chars,
+            max_seconds=args.pdf_max_seconds,
+        ),
+        storage_compression=args.storage_compression,
+        storage_backend=args.storage_backend,
+        keyframe_interval=args.keyframe_interval,
+    )
+    try:
+        result = engine.run_once(adapter_names=adapter_names)
+    finally:
+        engine.close()
 
     payload = {
         "run": result.model_dump(mode="json"),
@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+import sys
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from rfmo_ingest_pipeline.services import ArtifactStorage
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Move an existing artifact tree into the blob store under the chosen compression."
+    )
+    parser.add_argument("--storage-root", default=str(ROOT / "rfmo"))
+    parser.add_argument(
+        "--compression",
+        choices=["none", "gzip", "zstd", "auto"],
+        default="gzip",
+        help="Target encoding for stored artifacts (auto = zstd when installed, else gzip)",
+    )
+    parser.add_argument("--dry-run", action="store_true", help="Only count the artifacts that would change")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    storage = ArtifactStorage(args.storage_root, compression=args.compression)
+    stats = storage.migrate(dry_run=args.dry_run)
+
+    print(f"compression={storage.compression or 'none'}")
+    print(f"artifacts_migrated={stats.artifacts_migrated}{' (dry run)' if args.dry_run else ''}")
+    print(f"blobs_pruned={stats.blobs_pruned}")
+    print(f"bytes_before={stats.bytes_before}")
+    print(f"bytes_after={stats.bytes_after}")
+
+
+if __name__ == "__main__":
+    main()
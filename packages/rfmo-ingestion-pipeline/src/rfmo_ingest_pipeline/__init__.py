@@ -1,7 +1,16 @@
 from rfmo_ingest_pipeline.alerts import AlertGenerator
+from rfmo_ingest_pipeline.async_engine import AsyncIngestionEngine, AsyncRFMOAdapter
 from rfmo_ingest_pipeline.connectors import AdapterRegistry, RFMOAdapter
 from rfmo_ingest_pipeline.engine import IngestionEngine
 from rfmo_ingest_pipeline.scheduler import SyncScheduler
 
-__all__ = ["IngestionEngine", "AdapterRegistry", "RFMOAdapter", "SyncScheduler", "AlertGenerator"]
+__all__ = [
+    "IngestionEngine",
+    "AsyncIngestionEngine",
+    "AdapterRegistry",
+    "RFMOAdapter",
+    "AsyncRFMOAdapter",
+    "SyncScheduler",
+    "AlertGenerator",
+]
 __version__ = "0.2.0"
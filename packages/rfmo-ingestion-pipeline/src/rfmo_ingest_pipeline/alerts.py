@@ -1,27 +1,35 @@
 from __future__ import annotations
 
 import json
-import re
 from datetime import date, datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any, Optional
 
+from rfmo_ingest_pipeline.entities import first_entity, iter_entities
+from rfmo_ingest_pipeline.keywords import KeywordMatcher
 from rfmo_ingest_pipeline.models import DocumentCategory
+from rfmo_ingest_pipeline.segments import segment_reader
 
 
-DEADLINE_RE = re.compile(
-    r"\b(?:deadline|due(?:\s+date)?|submit(?:\s+\w+){0,4}\s+by)\D{0,16}([0-3]?\d/[0-1]?\d/20\d{2}|20\d{2}-\d{2}-\d{2})\b",
-    re.IGNORECASE,
-)
+ALERT_KEYWORD_RULES: dict[str, tuple[str, ...]] = {
+    "mandatory_reporting": ("mandatory reporting",),
+    "reporting": ("reporting",),
+    "deadline": ("deadline",),
+    "quota": ("quota", "allocated catch limits", "allocation", "catch limit", "tac"),
+    "meeting": ("meeting", "session", "intersessional", "review of cmm"),
+    "compliance_system": ("dfad register", "vms", "observer", "transshipment", "compliance monitoring", "labour standards"),
+}
+ALERT_KEYWORDS = KeywordMatcher(ALERT_KEYWORD_RULES)
 
 
 class AlertGenerator:
     def __init__(self, storage_root: str = "./rfmo") -> None:
         self.storage_root = Path(storage_root)
+        self.reader = segment_reader(self.storage_root)
 
     def generate(self, days: int = 7) -> list[dict[str, Any]]:
         alerts: list[dict[str, Any]] = []
-        metadata_files = sorted(self.storage_root.glob("**/metadata.json"))
+        metadata_files = self.reader.find(self.storage_root, "metadata.json")
         since_date: Optional[date] = None
         if days > 0:
             since_date = (datetime.now(timezone.utc) - timedelta(days=days)).date()
@@ -37,8 +45,8 @@ class AlertGenerator:
 
             extracted_path = meta_path.with_name("extracted.txt")
             extracted_text = ""
-            if extracted_path.exists():
-                extracted_text = extracted_path.read_text(encoding="utf-8", errors="ignore")
+            if self.reader.exists(extracted_path):
+                extracted_text = self.reader.read_text(extracted_path, errors="ignore")
 
             alert = self._build_alert(metadata, extracted_text, str(extracted_path), meta_path.parent)
             if alert:
@@ -56,7 +64,7 @@ class AlertGenerator:
     ) -> Optional[dict[str, Any]]:
         title = (metadata.get("title") or "").strip()
         body = extracted_text or ""
-        lowered = f"{title}\n{body}".lower()
+        found = ALERT_KEYWORDS.categories(f"{title}\n{body}".lower())
         doc_type = metadata.get("document_type") or DocumentCategory.other.value
         published_date = metadata.get("published_date")
         document_number = metadata.get("document_number")
@@ -68,16 +76,16 @@ class AlertGenerator:
         severity = "medium"
         due_date = self._extract_due_date(title, body)
 
-        if due_date or ("mandatory reporting" in lowered) or ("reporting" in lowered and "deadline" in lowered):
+        if due_date or "mandatory_reporting" in found or {"reporting", "deadline"} <= found:
             alert_type = "REPORTING_DEADLINE"
             severity = "high"
-        elif any(t in lowered for t in ["quota", "allocated catch limits", "allocation", "catch limit", "tac"]):
+        elif "quota" in found:
             alert_type = "QUOTA_OR_ALLOCATION_NOTICE"
             severity = "high"
-        elif doc_type == DocumentCategory.meeting_decisions.value or any(t in lowered for t in ["meeting", "session", "intersessional", "review of cmm"]):
+        elif doc_type == DocumentCategory.meeting_decisions.value or "meeting" in found:
             alert_type = "MEETING_DECISION_OR_PROCESS_UPDATE"
             severity = "medium"
-        elif any(t in lowered for t in ["dfad register", "vms", "observer", "transshipment", "compliance monitoring", "labour standards"]):
+        elif "compliance_system" in found:
             alert_type = "COMPLIANCE_SYSTEM_CHANGE"
             severity = "medium"
         elif doc_type in {
@@ -138,18 +146,8 @@ class AlertGenerator:
         return "Review legal text, map impacted fleets/species/areas, and issue implementation guidance."
 
     def _extract_due_date(self, title: str, body: str) -> Optional[str]:
-        combined = f"{title}\n{body}"
-        match = DEADLINE_RE.search(combined)
-        if not match:
-            return None
-        raw = match.group(1)
-        if "/" in raw:
-            try:
-                d, m, y = raw.split("/")
-                return date(int(y), int(m), int(d)).isoformat()
-            except Exception:
-                return None
-        return raw
+        due = first_entity(iter_entities(f"{title}\n{body}", ("due_date",)), "due_date")
+        return due.value.isoformat() if due is not None else None
 
     def _safe_date(self, value: Any) -> Optional[date]:
         if not value or not isinstance(value, str):
@@ -161,7 +159,7 @@ class AlertGenerator:
 
     def _safe_load_json(self, path: Path) -> Optional[dict[str, Any]]:
         try:
-            return json.loads(path.read_text(encoding="utf-8"))
+            return json.loads(self.reader.read_text(path))
         except Exception:
             return None
 
@@ -169,6 +167,6 @@ class AlertGenerator:
         candidates = [".pdf", ".html", ".docx", ".bin"]
         for ext in candidates:
             candidate = artifact_dir / f"raw{ext}"
-            if candidate.exists():
+            if self.reader.exists(candidate):
                 return str(candidate)
         return None
@@ -0,0 +1,212 @@
+from __future__ import annotations
+
+import asyncio
+from abc import ABC, abstractmethod
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Any
+
+from rfmo_ingest_pipeline.connectors import AdapterRegistry, RFMOAdapter
+from rfmo_ingest_pipeline.deltas import KEYFRAME_INTERVAL
+from rfmo_ingest_pipeline.engine import IngestionEngine
+from rfmo_ingest_pipeline.models import (
+    DocumentRef,
+    IngestionRunResult,
+    ParsedDocument,
+    RawDocument,
+    RunMetrics,
+    SourceHealth,
+)
+from rfmo_ingest_pipeline.ocr import OcrBackend
+from rfmo_ingest_pipeline.pdf_text import PdfBudget
+from rfmo_ingest_pipeline.services import RetryPolicy
+
+
+class AsyncRFMOAdapter(ABC):
+    name: str
+    rfmo: str
+
+    @abstractmethod
+    async def list_documents(self) -> list[DocumentRef]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def fetch_document(self, ref: DocumentRef) -> RawDocument:
+        raise NotImplementedError
+
+    @abstractmethod
+    def extract_metadata(self, raw: RawDocument, ref: DocumentRef) -> ParsedDocument:
+        raise NotImplementedError
+
+
+class SyncAdapterWrapper(AsyncRFMOAdapter):
+    def __init__(self, adapter: RFMOAdapter) -> None:
+        self.adapter = adapter
+        self.name = adapter.name
+        self.rfmo = adapter.rfmo
+
+    async def list_documents(self) -> list[DocumentRef]:
+        return await asyncio.to_thread(self.adapter.list_documents)
+
+    async def fetch_document(self, ref: DocumentRef) -> RawDocument:
+        return await asyncio.to_thread(self.adapter.fetch_document, ref)
+
+    def extract_metadata(self, raw: RawDocument, ref: DocumentRef) -> ParsedDocument:
+        return self.adapter.extract_metadata(raw, ref)
+
+    def __getattr__(self, item: str) -> Any:
+        if item == "adapter":
+            raise AttributeError(item)
+        return getattr(self.adapter, item)
+
+
+class AsyncIngestionEngine(IngestionEngine):
+    def __init__(
+        self,
+        db_path: str = "./rfmo_ingestion.db",
+        storage_root: str = "./rfmo",
+        adapters: AdapterRegistry | None = None,
+        max_concurrency: int = 16,
+        parse_executor: Executor | None = None,
+        parse_workers: int = 0,
+        pdf_budget: PdfBudget | None = None,
+        parse_timeout_seconds: float = 120.0,
+        parse_memory_limit_mb: int | None = 1024,
+        ocr_backend: OcrBackend | None = None,
+        ocr_workers: int = 2,
+        storage_compression: str | None = None,
+        storage_backend: str = "directory",
+        keyframe_interval: int = KEYFRAME_INTERVAL,
+    ) -> None:
+        super().__init__(
+            db_path=db_path,
+            storage_root=storage_root,
+            adapters=adapters,
+            parse_workers=parse_workers,
+            pdf_budget=pdf_budget,
+            parse_timeout_seconds=parse_timeout_seconds,
+            parse_memory_limit_mb=parse_memory_limit_mb,
+            ocr_backend=ocr_backend,
+            ocr_workers=ocr_workers,
+            storage_compression=storage_compression,
+            storage_backend=storage_backend,
+            keyframe_interval=keyframe_interval,
+        )
+        self.max_concurrency = max_concurrency
+        self.retry_policy = RetryPolicy()
+        self.parse_executor = parse_executor
+        self._wrappers: dict[int, AsyncRFMOAdapter] = {}
+
+    def run_once(self, adapter_names: list[str] | None = None) -> IngestionRunResult:
+        return asyncio.run(self.run_once_async(adapter_names))
+
+    async def run_once_async(self, adapter_names: list[str] | None = None) -> IngestionRunResult:
+        metrics = RunMetrics()
+        errors: list[str] = []
+        selected = self._select_adapters(adapter_names)
+        await asyncio.to_thread(self._prepare_run, selected)
+        adapters = [self._as_async(adapter) for adapter in selected]
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        owned_executor = None
+        executor = self.parse_executor
+        if executor is None:
+            owned_executor = executor = ThreadPoolExecutor(
+                max_workers=self.max_concurrency,
+                thread_name_prefix="rfmo-parse",
+            )
+        try:
+            health_updates = list(
+                await asyncio.gather(
+                    *(self._run_adapter_async(adapter, metrics, errors, semaphore, executor) for adapter in adapters)
+                )
+            )
+        finally:
+            if owned_executor is not None:
+                owned_executor.shutdown(wait=True)
+
+        for health in health_updates:
+            await asyncio.to_thread(self.store.upsert_source_health, health)
+        return await asyncio.to_thread(self._finish_run, metrics, health_updates, errors)
+
+    async def _run_adapter_async(
+        self,
+        adapter: AsyncRFMOAdapter,
+        metrics: RunMetrics,
+        errors: list[str],
+        semaphore: asyncio.Semaphore,
+        executor: Executor,
+    ) -> SourceHealth:
+        try:
+            refs = await adapter.list_documents()
+        except Exception as exc:  # noqa: BLE001
+            return await asyncio.to_thread(self._discovery_failed, adapter, exc, metrics, errors)
+
+        unique = await asyncio.to_thread(self._accept_discovered, adapter, refs, metrics)
+        await asyncio.gather(
+            *(self._process_document_ref_async(adapter, ref, metrics, errors, semaphore, executor) for ref in unique)
+        )
+        return self._healthy_source(adapter)
+
+    async def _process_document_ref_async(
+        self,
+        adapter: AsyncRFMOAdapter,
+        ref: DocumentRef,
+        metrics: RunMetrics,
+        errors: list[str],
+        semaphore: asyncio.Semaphore,
+        executor: Executor,
+    ) -> None:
+        attempt = 1
+        while True:
+            async with semaphore:
+                delay = await self._attempt_document_ref_async(adapter, ref, attempt, metrics, errors, executor)
+            if delay is None:
+                return
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def _attempt_document_ref_async(
+        self,
+        adapter: AsyncRFMOAdapter,
+        ref: DocumentRef,
+        attempt: int,
+        metrics: RunMetrics,
+        errors: list[str],
+        executor: Executor,
+    ) -> float | None:
+        document = await asyncio.to_thread(self.store.upsert_document_discovered, ref)
+        raw: RawDocument | None = None
+        try:
+            latest = await asyncio.to_thread(self.store.get_latest_version, document.id)
+            try:
+                raw = await adapter.fetch_document(self._conditional_ref(ref, latest))
+            except Exception as exc:  # noqa: BLE001
+                delay = self.retry_policy.next_delay(exc, ref, attempt)
+                self._count(metrics, "fetch_retries", "rfmo_fetch_retries_total")
+                return delay
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(
+                executor,
+                self._complete_document,
+                adapter,
+                ref,
+                document,
+                latest,
+                raw,
+                metrics,
+            )
+        except Exception as exc:  # noqa: BLE001
+            await asyncio.to_thread(self._document_failed, adapter, ref, document, exc, metrics, errors)
+        finally:
+            if raw is not None:
+                raw.release_body()
+        return None
+
+    def _as_async(self, adapter: RFMOAdapter | AsyncRFMOAdapter) -> AsyncRFMOAdapter:
+        if isinstance(adapter, AsyncRFMOAdapter):
+            return adapter
+        wrapper = self._wrappers.get(id(adapter))
+        if wrapper is None:
+            wrapper = SyncAdapterWrapper(adapter)
+            self._wrappers[id(adapter)] = wrapper
+        return wrapper
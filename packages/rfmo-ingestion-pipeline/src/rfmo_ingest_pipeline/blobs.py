@@ -0,0 +1,269 @@
+from __future__ import annotations
+
+import hashlib
+import io
+import os
+import tempfile
+from pathlib import Path
+from typing import BinaryIO, Iterable, Iterator, NamedTuple, Protocol
+
+from rfmo_ingest_pipeline.compression import SUFFIXES, compression_for, open_compressed_writer, open_decompressed
+from rfmo_ingest_pipeline.deltas import DELTA_SUFFIX, MAX_CHAIN, Hunk, TextDelta, delta_path, reconstruct
+
+
+REF_SUFFIX = ".blob"
+ENCODED_SUFFIXES = ("", *SUFFIXES.values())
+
+
+class StoredBlob(NamedTuple):
+    digest: str
+    size: int
+    physical_bytes: int
+
+
+class BlobStore:
+    # Content-addressed, write-once files keyed by the sha256 of their uncompressed content. Version
+    # directories get a hardlink to the blob (or, where the filesystem cannot link, a small reference
+    # file), so identical bodies across versions, URLs and RFMOs occupy disk once.
+    def __init__(self, root: str | Path, compression: str | None = None) -> None:
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.compression = compression
+
+    def path_for(self, digest: str, compression: str | None = None) -> Path:
+        suffix = SUFFIXES[compression] if compression else ""
+        return self.root / digest[:2] / f"{digest}{suffix}"
+
+    def find(self, digest: str) -> Path | None:
+        # A blob written under another compression setting is still the same content.
+        for suffix in ENCODED_SUFFIXES:
+            candidate = self.root / digest[:2] / f"{digest}{suffix}"
+            if candidate.exists():
+                return candidate
+        return None
+
+    def put(
+        self,
+        target: Path,
+        chunks: Iterable[bytes | memoryview],
+        digest: str | None = None,
+        size: int | None = None,
+    ) -> StoredBlob:
+        # With a known digest an existing blob is linked without consuming the chunks at all.
+        existing = self.find(digest) if digest is not None else None
+        if digest is not None and existing is not None:
+            size = size if size is not None else self._content_size(existing)
+            return StoredBlob(digest, size, self._link(existing, target))
+
+        temp_path, digest, size = _write_encoded(self.root, chunks, self.compression)
+        blob = self.path_for(digest, self.compression)
+        blob.parent.mkdir(exist_ok=True)
+        physical = 0
+        try:
+            os.chmod(temp_path, 0o444)
+            # Linking (not renaming) the temp file fails if a concurrent writer published the same blob first.
+            os.link(temp_path, blob)
+            physical = blob.stat().st_size
+        except FileExistsError:
+            pass
+        except OSError:
+            os.replace(temp_path, blob)
+            physical = blob.stat().st_size
+        finally:
+            if os.path.exists(temp_path):
+                os.unlink(temp_path)
+        return StoredBlob(digest, size, physical + self._link(blob, target))
+
+    def prune(self, referenced: set[Path] | None = None) -> PruneStats:
+        # Deletes blobs no version directory links to (link count 1) or references.
+        referenced = referenced or set()
+        removed = freed = 0
+        for blob in self.root.glob("*/*"):
+            if not blob.is_file():
+                continue
+            stat = blob.stat()
+            if stat.st_nlink == 1 and blob.resolve() not in referenced:
+                blob.unlink()
+                removed += 1
+                freed += stat.st_size
+        return PruneStats(removed, freed)
+
+    def _content_size(self, blob: Path) -> int:
+        if compression_for(blob.name) is None:
+            return blob.stat().st_size
+        with open_decompressed(str(blob)) as handle:
+            return sum(len(chunk) for chunk in iter(lambda: handle.read(1024 * 1024), b""))
+
+    def _link(self, blob: Path, target: Path) -> int:
+        # The link carries the blob's compression suffix, so readers know the encoding from the name.
+        compression = compression_for(blob.name)
+        link = target.with_name(target.name + (SUFFIXES[compression] if compression else ""))
+        _remove_variants(target)
+        try:
+            os.link(blob, link)
+        except OSError:
+            ref = target.with_name(target.name + REF_SUFFIX)
+            ref.write_text(os.path.relpath(blob, target.parent), encoding="utf-8")
+            return ref.stat().st_size
+        return 0
+
+
+class PruneStats(NamedTuple):
+    blobs_removed: int
+    bytes_freed: int
+
+
+class WrittenArtifact(NamedTuple):
+    size: int
+    physical_bytes: int
+
+
+def write_artifact(target: Path, chunks: Iterable[bytes | memoryview], compression: str | None = None) -> WrittenArtifact:
+    # A per-version file outside the blob store, replaced atomically under its encoded name.
+    temp_path, _, size = _write_encoded(target.parent, chunks, compression)
+    _remove_variants(target)
+    final = target.with_name(target.name + (SUFFIXES[compression] if compression else ""))
+    os.replace(temp_path, final)
+    return WrittenArtifact(size, final.stat().st_size)
+
+
+class ArtifactLocator(Protocol):
+    # Storage that holds artifacts somewhere other than at their recorded path (e.g. pack segments).
+    def open(self, path: Path) -> BinaryIO | None:
+        ...
+
+    def contains(self, path: Path) -> bool:
+        ...
+
+    def find(self, name: str) -> list[Path]:
+        ...
+
+
+class ArtifactReader:
+    # The one way to read stored artifacts: recorded paths name the logical file, and whether it is a
+    # plain file, a compressed variant, a blob hardlink, a reference file, an entry in a locator such
+    # as a segment pack, or a delta against an earlier version is resolved here.
+    def __init__(self, chunk_size: int = 64 * 1024, locators: Iterable[ArtifactLocator] = ()) -> None:
+        self.chunk_size = chunk_size
+        self.locators = list(locators)
+
+    def resolve(self, path: str | Path) -> Path:
+        path = Path(path)
+        for suffix in ENCODED_SUFFIXES:
+            candidate = path.with_name(path.name + suffix)
+            if candidate.exists():
+                return candidate
+        ref = path.with_name(path.name + REF_SUFFIX)
+        if ref.exists():
+            return (path.parent / ref.read_text(encoding="utf-8").strip()).resolve()
+        raise FileNotFoundError(str(path))
+
+    def exists(self, path: str | Path) -> bool:
+        return self._stored(path) or self._stored(delta_path(path))
+
+    def open(self, path: str | Path) -> BinaryIO:
+        try:
+            return self._open_stored(path)
+        except FileNotFoundError:
+            if not self._stored(delta_path(path)):
+                raise
+        return io.BytesIO(self.reconstruct(path))  # type: ignore[return-value]
+
+    def iter_chunks(self, path: str | Path) -> Iterator[bytes]:
+        with self.open(path) as handle:
+            while chunk := handle.read(self.chunk_size):
+                yield chunk
+
+    def read_bytes(self, path: str | Path) -> bytes:
+        with self.open(path) as handle:
+            return handle.read()
+
+    def read_text(self, path: str | Path, errors: str = "strict") -> str:
+        return self.read_bytes(path).decode("utf-8", errors=errors)
+
+    def delta(self, path: str | Path) -> TextDelta | None:
+        try:
+            with self._open_stored(delta_path(path)) as handle:
+                return TextDelta.from_bytes(handle.read())
+        except FileNotFoundError:
+            return None
+
+    def changes(self, path: str | Path) -> list[Hunk] | None:
+        # What changed in this artifact since the previous version, as recorded when it was stored;
+        # None for a first version, a wholesale rewrite, or content stored before deltas existed.
+        delta = self.delta(path)
+        return delta.hunks() if delta is not None else None
+
+    def reconstruct(self, path: str | Path) -> bytes:
+        # Walks deltas back to the nearest whole copy, then replays them forward.
+        chain: list[TextDelta] = []
+        current = Path(path)
+        while True:
+            try:
+                with self._open_stored(current) as handle:
+                    base = handle.read()
+                break
+            except FileNotFoundError:
+                delta = self.delta(current)
+                if delta is None or len(chain) >= MAX_CHAIN:
+                    raise FileNotFoundError(str(path)) from None
+                chain.append(delta)
+                current = delta.base_path(current)
+        return reconstruct(base, chain)
+
+    def find(self, root: str | Path, name: str) -> list[Path]:
+        # Logical paths of every artifact called `name` under root, whatever its on-disk encoding.
+        stems = (name, name + DELTA_SUFFIX)
+        names = {stem + suffix for stem in stems for suffix in (*ENCODED_SUFFIXES, REF_SUFFIX)}
+        found = {candidate.with_name(name) for candidate in Path(root).rglob(f"{name}*") if candidate.name in names}
+        for locator in self.locators:
+            for stem in stems:
+                found.update(path.with_name(name) for path in locator.find(stem))
+        return sorted(found)
+
+    def _stored(self, path: str | Path) -> bool:
+        try:
+            self.resolve(path)
+        except FileNotFoundError:
+            return any(locator.contains(Path(path)) for locator in self.locators)
+        return True
+
+    def _open_stored(self, path: str | Path) -> BinaryIO:
+        try:
+            return open_decompressed(str(self.resolve(path)))
+        except FileNotFoundError:
+            for locator in self.locators:
+                handle = locator.open(Path(path))
+                if handle is not None:
+                    return handle
+            raise
+
+
+def _write_encoded(
+    directory: Path, chunks: Iterable[bytes | memoryview], compression: str | None
+) -> tuple[str, str, int]:
+    hasher = hashlib.sha256()
+    size = 0
+    with tempfile.NamedTemporaryFile(prefix="blob-", dir=directory, delete=False) as handle:
+        try:
+            with open_compressed_writer(handle, compression) as writer:
+                for chunk in chunks:
+                    hasher.update(chunk)
+                    writer.write(chunk)
+                    size += len(chunk)
+        except BaseException:
+            handle.close()
+            os.unlink(handle.name)
+            raise
+    return handle.name, hasher.hexdigest(), size
+
+
+def stored_variants(target: Path) -> list[Path]:
+    # The files on disk that hold the logical artifact `target`.
+    candidates = (target.with_name(target.name + suffix) for suffix in (*ENCODED_SUFFIXES, REF_SUFFIX))
+    return [candidate for candidate in candidates if candidate.exists()]
+
+
+def _remove_variants(target: Path) -> None:
+    for stale in stored_variants(target):
+        stale.unlink()
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import codecs
+import re
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Iterator
+
+if TYPE_CHECKING:
+    from rfmo_ingest_pipeline.models import RawDocument
+
+
+CHARSET_RE = re.compile(r"""charset\s*=\s*["']?([\w.:-]+)""", re.IGNORECASE)
+DEFAULT_ENCODING = "utf-8"
+
+
+def charset_from_content_type(content_type: str | None) -> str | None:
+    match = CHARSET_RE.search(content_type or "")
+    if not match:
+        return None
+    try:
+        return codecs.lookup(match.group(1)).name
+    except LookupError:
+        return None
+
+
+class DocumentBuffer:
+    # Per-document decode shared by metadata extraction, parsing and storage: the body is decoded
+    # at most once, from a view of the fetched bytes rather than a copy of them.
+    def __init__(self, raw: RawDocument) -> None:
+        self._raw = raw
+        self.encoding = charset_from_content_type(raw.content_type) or DEFAULT_ENCODING
+        self._text: str | None = None
+        self.decodes = 0
+
+    @contextmanager
+    def view(self, limit: int = -1) -> Iterator[memoryview]:
+        spool = self._raw.spool
+        if spool is not None and spool.in_memory:
+            source = spool.view()
+        else:
+            source = memoryview(spool.read_bytes(limit) if spool is not None else self._raw.body)
+        # Released on exit: an exported in-memory spool buffer cannot be closed.
+        with source, (source if limit < 0 else source[:limit]) as view:
+            yield view
+
+    def text(self) -> str:
+        if self._text is None:
+            with self.view() as view:
+                self._text = str(view, self.encoding, "replace")
+            self.decodes += 1
+        return self._text
+
+    def text_prefix(self, max_chars: int) -> str:
+        if self._text is not None:
+            return self._text[:max_chars]
+        # Enough bytes for max_chars characters in any supported encoding (at most 4 bytes each).
+        with self.view(max_chars * 4) as view:
+            return str(view, self.encoding, "replace")[:max_chars]
+
+    def release(self) -> None:
+        self._text = None
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import gzip
+from typing import Any, BinaryIO
+
+
+SUFFIXES = {"gzip": ".gz", "zstd": ".zst"}
+GZIP_LEVEL = 6
+ZSTD_LEVEL = 3
+
+
+def zstd_available() -> bool:
+    try:
+        import zstandard  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def resolve_compression(name: str | None) -> str | None:
+    if name in (None, "", "none"):
+        return None
+    if name == "auto":
+        return "zstd" if zstd_available() else "gzip"
+    if name not in SUFFIXES:
+        raise ValueError(f"Unknown compression {name!r}; expected none, gzip, zstd or auto")
+    if name == "zstd" and not zstd_available():
+        raise ValueError("zstd compression requires the optional 'zstandard' package")
+    return name
+
+
+def compression_for(path: str) -> str | None:
+    for name, suffix in SUFFIXES.items():
+        if path.endswith(suffix):
+            return name
+    return None
+
+
+def open_compressed_writer(handle: BinaryIO, compression: str | None) -> Any:
+    # The returned stream must be closed before `handle` to flush the codec's trailer.
+    if compression == "gzip":
+        # mtime=0 keeps the output a pure function of the content.
+        return gzip.GzipFile(fileobj=handle, mode="wb", compresslevel=GZIP_LEVEL, mtime=0)
+    if compression == "zstd":
+        import zstandard
+
+        return zstandard.ZstdCompressor(level=ZSTD_LEVEL).stream_writer(handle, closefd=False)
+    return _Unclosable(handle)
+
+
+def open_decompressed(path: str) -> BinaryIO:
+    return decompressed_stream(open(path, "rb"), compression_for(path))
+
+
+def decompressed_stream(stream: BinaryIO, compression: str | None) -> BinaryIO:
+    # Takes ownership of `stream`: closing the returned reader closes it.
+    if compression == "gzip":
+        return _Owning(gzip.GzipFile(fileobj=stream, mode="rb"), stream)  # type: ignore[return-value]
+    if compression == "zstd":
+        import zstandard
+
+        return zstandard.ZstdDecompressor().stream_reader(stream, closefd=True)
+    return stream
+
+
+class _Owning:
+    # GzipFile leaves a caller-supplied fileobj open; this closes both.
+    def __init__(self, reader: BinaryIO, stream: BinaryIO) -> None:
+        self._reader = reader
+        self._stream = stream
+
+    def read(self, size: int = -1) -> bytes:
+        return self._reader.read(size)
+
+    def close(self) -> None:
+        self._reader.close()
+        self._stream.close()
+
+    def __enter__(self) -> _Owning:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+
+class _Unclosable:
+    def __init__(self, handle: BinaryIO) -> None:
+        self._handle = handle
+
+    def write(self, data: bytes | memoryview) -> int:
+        return self._handle.write(data)
+
+    def close(self) -> None:
+        pass
+
+    def __enter__(self) -> _Unclosable:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        pass
@@ -1,35 +1,155 @@
 from __future__ import annotations
 
 import re
+import threading
 import time
 from abc import ABC, abstractmethod
-from datetime import date
+from dataclasses import dataclass
+from datetime import date, datetime, timezone
 from html import unescape
-from typing import Iterable
-from urllib.error import HTTPError, URLError
+from typing import Iterable, NamedTuple, Protocol
 from urllib.parse import urldefrag, urljoin, urlparse
-from urllib.request import Request, urlopen
-from urllib.robotparser import RobotFileParser
 
-from rfmo_ingest_pipeline.models import DocumentCategory, DocumentRef, ParsedDocument, RawDocument
+from rfmo_ingest_pipeline.entities import (
+    DATE_CONFIDENCE,
+    Entity,
+    best_entity,
+    entity_value,
+    extract_entities,
+    first_entity,
+    iter_entities,
+)
+from rfmo_ingest_pipeline.html_text import index_anchors
+from rfmo_ingest_pipeline.keywords import KeywordMatcher
+from rfmo_ingest_pipeline.models import DocumentCategory, DocumentRef, IndexPageRecord, ParsedDocument, RawDocument
+from rfmo_ingest_pipeline.robots import RobotsCache
+from rfmo_ingest_pipeline.spool import SpoolPolicy
+from rfmo_ingest_pipeline.transport import (
+    HttpTransport,
+    PermanentFetchError,
+    RetryableFetchError,
+    TransportError,
+    parse_retry_after,
+)
 
 
-LINK_RE = re.compile(r'<a[^>]+href=["\'](?P<href>[^"\']+)["\'][^>]*>(?P<text>.*?)</a>', re.IGNORECASE | re.DOTALL)
 TAG_RE = re.compile(r"<[^>]+>")
-DATE_PATTERNS = [
-    re.compile(r"(20\d{2}-\d{2}-\d{2})"),
-    re.compile(r"([0-3]?\d/[0-1]?\d/20\d{2})"),
-    re.compile(
-        r"([0-3]?\d\s+(?:January|February|March|April|May|June|July|August|September|October|November|December)\s+20\d{2})",
-        re.IGNORECASE,
+THROTTLE_STATUSES = {429, 503}
+CANDIDATE_KEYWORD_RULES: dict[str, tuple[str, ...]] = {
+    "exclude": (
+        "news", "press", "newsletter", "manual", "guide", "brochure", "training", "faq", "photo",
+        "gallery", "video", "event", "workshop", "vacancy", "procurement", "tender", "media",
+        "twitter", "facebook",
     ),
-]
-DOC_NUMBER_RE = re.compile(r"\b(?:CMM|REC|RES|Recommendation|Resolution)\s*[-:]?\s*([0-9]{4}[-/][0-9]{1,3})\b", re.IGNORECASE)
-MEETING_REF_RE = re.compile(r"\b(?:COM|WCPFC|IOTC)[-_ ]?(?:\d{1,2}|20\d{2})\b", re.IGNORECASE)
-POLICY_ID_RE = re.compile(
-    r"\b(?:CMM|REC|RES|Recommendation|Resolution|Circular)\s*[-:]?\s*(?:\d{4}[-/]\d{1,3}|[A-Z]{1,4}-\d{2,4})\b",
-    re.IGNORECASE,
-)
+    "policy": (
+        "conservation and management measure", "management measure", "recommendation", "resolution",
+        "circular", "iuu", "quota", "allocation", "catch limit", "closure", "closed area", "prohibited",
+        "ban", "meeting", "decision",
+    ),
+    "compliance": (
+        "shall", "must", "required", "deadline", "reporting", "obligation", "compliance",
+        "entry into force", "effective", "implementation",
+    ),
+    "document_extension": (".pdf", ".doc", ".docx", ".xls", ".xlsx", ".htm", ".html"),
+}
+CANDIDATE_KEYWORDS = KeywordMatcher(CANDIDATE_KEYWORD_RULES)
+
+
+class ScanCounts(NamedTuple):
+    scanned: int
+    filtered_out: int
+    links_per_second: float
+
+
+class IndexPageCache(Protocol):
+    def get_index_page(self, adapter_name: str, category: DocumentCategory, index_url: str) -> IndexPageRecord | None:
+        ...
+
+    def save_index_page(self, record: IndexPageRecord) -> None:
+        ...
+
+
+@dataclass
+class _HostBucket:
+    rate: float
+    theoretical_arrival: float = 0.0
+    blocked_until: float = 0.0
+
+
+class HostRateLimiter:
+    def __init__(
+        self,
+        min_interval_seconds: float = 0.25,
+        burst: int = 1,
+        max_rate_per_second: float | None = None,
+        min_rate_per_second: float | None = None,
+        increase_per_success: float = 0.05,
+        decrease_factor: float = 0.5,
+        max_retry_after_seconds: float = 300.0,
+    ) -> None:
+        self.min_interval_seconds = min_interval_seconds
+        self.base_rate = 1.0 / min_interval_seconds if min_interval_seconds > 0 else 0.0
+        self.burst = max(1, burst)
+        self.max_rate = max_rate_per_second or self.base_rate * 2
+        self.min_rate = min_rate_per_second or self.base_rate / 8
+        self.increase_per_success = increase_per_success
+        self.decrease_factor = decrease_factor
+        self.max_retry_after_seconds = max_retry_after_seconds
+        self._lock = threading.Lock()
+        self._buckets: dict[str, _HostBucket] = {}
+        self._stats = {"throttled": 0}
+
+    def wait(self, url: str) -> None:
+        delay = self.reserve(url)
+        if delay > 0:
+            time.sleep(delay)
+
+    def reserve(self, url: str) -> float:
+        host = self._host(url)
+        with self._lock:
+            now = time.monotonic()
+            bucket = self._bucket(host)
+            if bucket.rate <= 0:
+                return max(0.0, bucket.blocked_until - now)
+            # Token bucket expressed as a theoretical arrival time (GCRA), so concurrent callers
+            # each reserve a future slot under the lock instead of polling for tokens.
+            interval = 1.0 / bucket.rate
+            slot = max(now, bucket.blocked_until, bucket.theoretical_arrival - (self.burst - 1) * interval)
+            bucket.theoretical_arrival = max(bucket.theoretical_arrival, slot) + interval
+        return slot - now
+
+    def record_success(self, url: str) -> None:
+        with self._lock:
+            bucket = self._bucket(self._host(url))
+            if bucket.rate > 0:
+                bucket.rate = min(self.max_rate, bucket.rate + self.increase_per_success * self.base_rate)
+
+    def record_throttle(self, url: str, retry_after_seconds: float | None = None) -> None:
+        with self._lock:
+            now = time.monotonic()
+            bucket = self._bucket(self._host(url))
+            if bucket.rate > 0:
+                bucket.rate = max(self.min_rate, bucket.rate * self.decrease_factor)
+            pause = retry_after_seconds if retry_after_seconds is not None else (1.0 / bucket.rate if bucket.rate > 0 else 0.0)
+            bucket.blocked_until = max(bucket.blocked_until, now + min(pause, self.max_retry_after_seconds))
+            self._stats["throttled"] += 1
+
+    def current_rate(self, url: str) -> float:
+        with self._lock:
+            return self._bucket(self._host(url)).rate
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return dict(self._stats)
+
+    def _bucket(self, host: str) -> _HostBucket:
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            bucket = self._buckets[host] = _HostBucket(rate=self.base_rate)
+        return bucket
+
+    def _host(self, url: str) -> str:
+        return urlparse(url).netloc.lower()
 
 
 class RFMOAdapter(ABC):
@@ -59,6 +179,10 @@ class HtmlRFMOAdapter(RFMOAdapter):
         timeout_seconds: int = 30,
         min_request_interval_seconds: float = 0.25,
         respect_robots: bool = True,
+        rate_limiter: HostRateLimiter | None = None,
+        transport: HttpTransport | None = None,
+        spool_policy: SpoolPolicy | None = None,
+        robots_cache: RobotsCache | None = None,
     ) -> None:
         self.name = name
         self.rfmo = rfmo
@@ -67,69 +191,151 @@ class HtmlRFMOAdapter(RFMOAdapter):
         self.timeout_seconds = timeout_seconds
         self.min_request_interval_seconds = min_request_interval_seconds
         self.respect_robots = respect_robots
-        self._robots_cache: dict[str, RobotFileParser] = {}
-        self._last_request_at = 0.0
+        self.rate_limiter = rate_limiter or HostRateLimiter(min_request_interval_seconds)
+        self.transport = transport or HttpTransport(timeout_seconds=timeout_seconds)
+        self.spool_policy = spool_policy
+        self.robots_cache = robots_cache or RobotsCache(
+            transport=self.transport,
+            user_agent=user_agent,
+            rate_limiter=self.rate_limiter,
+            timeout_seconds=timeout_seconds,
+        )
+        self.index_cache: IndexPageCache | None = None
         self._last_filtered_out = 0
         self._last_scanned = 0
+        self._last_indexes_unchanged = 0
+        self._last_links_per_second = 0.0
 
     def list_documents(self) -> list[DocumentRef]:
         refs: list[DocumentRef] = []
         seen_urls: set[str] = set()
         scanned_links = 0
         filtered_out = 0
+        indexes_unchanged = 0
+        scan_seconds = 0.0
 
         for category, index_urls in self.category_indexes.items():
             for index_url in index_urls:
                 try:
-                    raw = self._fetch(index_url)
-                    html_text = raw.body.decode("utf-8", errors="replace")
+                    index_refs, index_scanned, index_filtered, unchanged, seconds = self._scan_index(category, index_url)
                 except Exception:
                     continue
 
-                for href, link_text, context in self._extract_links(html_text):
-                    scanned_links += 1
-                    absolute = urldefrag(urljoin(index_url, href))[0]
-                    if absolute in seen_urls:
-                        continue
-                    if absolute == urldefrag(index_url)[0]:
-                        filtered_out += 1
-                        continue
-                    if not self._is_document_candidate(absolute, link_text, context):
-                        filtered_out += 1
+                scanned_links += index_scanned
+                filtered_out += index_filtered
+                indexes_unchanged += int(unchanged)
+                scan_seconds += seconds
+                for ref in index_refs:
+                    if ref.source_url in seen_urls:
                         continue
-
-                    seen_urls.add(absolute)
-                    refs.append(
-                        DocumentRef(
-                            rfmo=self.rfmo,
-                            source_url=absolute,
-                            document_type=category,
-                            index_url=index_url,
-                            title_hint=self._clean_text(link_text)[:240] or self._filename_from_url(absolute),
-                            published_date=self._extract_date(context),
-                            document_number=self._extract_document_number(f"{link_text} {context}"),
-                            meeting_reference=self._extract_meeting_reference(f"{link_text} {context}"),
-                            rfmo_region=self._default_region(),
-                            metadata={"queue": "hot"},
-                        )
-                    )
+                    seen_urls.add(ref.source_url)
+                    refs.append(ref)
 
         self._last_scanned = scanned_links
         self._last_filtered_out = filtered_out
+        self._last_indexes_unchanged = indexes_unchanged
+        self._last_links_per_second = scanned_links / scan_seconds if scan_seconds > 0 else 0.0
         return refs
 
+    def bind_index_cache(self, cache: IndexPageCache | None) -> None:
+        self.index_cache = cache
+
+    def last_index_stats(self) -> dict[str, int]:
+        return {"indexes_unchanged": self._last_indexes_unchanged}
+
+    def _scan_index(
+        self, category: DocumentCategory, index_url: str
+    ) -> tuple[list[DocumentRef], int, int, bool, float]:
+        cache = self.index_cache
+        cached = cache.get_index_page(self.name, category, index_url) if cache is not None else None
+        headers: dict[str, str] = {}
+        if cached is not None and cached.etag:
+            headers["If-None-Match"] = cached.etag
+        if cached is not None and cached.last_modified:
+            headers["If-Modified-Since"] = cached.last_modified
+
+        raw = self._fetch(index_url, headers=headers)
+        if raw.status_code == 304:
+            if cached is None:
+                return [], 0, 0, False, 0.0
+            return _replayed(cached.refs), 0, 0, True, 0.0
+
+        etag = raw.headers.get("ETag") or raw.headers.get("Etag")
+        last_modified = raw.headers.get("Last-Modified")
+        content_hash = raw.body_sha256()
+        if cache is not None and cached is not None and cached.content_hash == content_hash:
+            if (etag, last_modified) != (cached.etag, cached.last_modified):
+                cache.save_index_page(cached.model_copy(update={"etag": etag, "last_modified": last_modified}))
+            return _replayed(cached.refs), 0, 0, True, 0.0
+
+        started = time.perf_counter()
+        html_text = raw.buffer.text()
+        index_refs: list[DocumentRef] = []
+        seen_urls: set[str] = set()
+        scanned_links = 0
+        filtered_out = 0
+        for href, link_text, context in self._extract_links(html_text):
+            scanned_links += 1
+            absolute = urldefrag(urljoin(index_url, href))[0]
+            if absolute in seen_urls:
+                continue
+            if absolute == urldefrag(index_url)[0]:
+                filtered_out += 1
+                continue
+            # One entity scan per link feeds the candidate filter and every metadata field.
+            entities = extract_entities(f"{link_text} {context}")
+            if not self._is_document_candidate(absolute, link_text, context, entities):
+                filtered_out += 1
+                continue
+
+            seen_urls.add(absolute)
+            index_refs.append(
+                DocumentRef(
+                    rfmo=self.rfmo,
+                    source_url=absolute,
+                    document_type=category,
+                    index_url=index_url,
+                    title_hint=link_text[:240] or self._filename_from_url(absolute),
+                    published_date=entity_value(best_entity(entities, "date", min_start=len(link_text) + 1)),
+                    document_number=entity_value(first_entity(entities, "document_number")),
+                    meeting_reference=entity_value(first_entity(entities, "meeting_reference")),
+                    rfmo_region=self._default_region(),
+                    metadata={"queue": "hot"},
+                )
+            )
+        scan_seconds = time.perf_counter() - started
+
+        if cache is not None:
+            cache.save_index_page(
+                IndexPageRecord(
+                    adapter_name=self.name,
+                    category=category,
+                    index_url=index_url,
+                    etag=etag,
+                    last_modified=last_modified,
+                    content_hash=content_hash,
+                    refs=index_refs,
+                )
+            )
+        return index_refs, scanned_links, filtered_out, False, scan_seconds
+
     def fetch_document(self, ref: DocumentRef) -> RawDocument:
-        return self._fetch(ref.source_url)
+        headers: dict[str, str] = {}
+        if ref.if_none_match:
+            headers["If-None-Match"] = ref.if_none_match
+        if ref.if_modified_since:
+            headers["If-Modified-Since"] = ref.if_modified_since
+        return self._fetch(ref.source_url, headers=headers, spool_policy=self.spool_policy)
 
-    def last_scan_counts(self) -> tuple[int, int]:
-        return self._last_scanned, self._last_filtered_out
+    def last_scan_counts(self) -> ScanCounts:
+        return ScanCounts(self._last_scanned, self._last_filtered_out, self._last_links_per_second)
 
     def extract_metadata(self, raw: RawDocument, ref: DocumentRef) -> ParsedDocument:
         content_type = (raw.content_type or "").lower()
         text = ref.title_hint or self._filename_from_url(ref.source_url)
         publication_date = ref.published_date
         if "html" in content_type:
-            html_text = raw.body.decode("utf-8", errors="replace")
+            html_text = raw.buffer.text()
             page_title = self._extract_html_title(html_text)
             text = page_title or text
             publication_date = publication_date or self._extract_date(html_text)
@@ -143,124 +349,91 @@ class HtmlRFMOAdapter(RFMOAdapter):
             rfmo_region=ref.rfmo_region,
         )
 
-    def _fetch(self, url: str) -> RawDocument:
-        self._wait_for_rate_limit()
+    def _fetch(
+        self,
+        url: str,
+        headers: dict[str, str] | None = None,
+        spool_policy: SpoolPolicy | None = None,
+    ) -> RawDocument:
         self._assert_allowed_by_robots(url)
+        self._wait_for_rate_limit(url)
 
-        req = Request(url, headers={"User-Agent": self.user_agent})
         try:
-            with urlopen(req, timeout=self.timeout_seconds) as resp:
-                headers = {k: v for k, v in resp.headers.items()}
-                body = resp.read()
-                return RawDocument(
-                    source_url=url,
-                    status_code=getattr(resp, "status", 200),
-                    headers=headers,
-                    content_type=resp.headers.get("Content-Type"),
-                    body=body,
-                )
-        except (HTTPError, URLError) as exc:
-            raise RuntimeError(f"Failed to fetch URL: {url}") from exc
+            resp = self.transport.request(
+                url,
+                headers={"User-Agent": self.user_agent, **(headers or {})},
+                timeout=self.timeout_seconds,
+                spool_policy=spool_policy,
+            )
+        except TransportError as exc:
+            error_type = RetryableFetchError if exc.retryable else PermanentFetchError
+            raise error_type(f"Failed to fetch URL: {url}") from exc
+        if resp.status in THROTTLE_STATUSES:
+            retry_after = parse_retry_after(self._header(resp.headers, "Retry-After"))
+            self.rate_limiter.record_throttle(url, retry_after)
+            raise RetryableFetchError(f"Failed to fetch URL: {url} (HTTP {resp.status})", retry_after_seconds=retry_after)
+        if resp.status >= 500 or resp.status == 408:
+            raise RetryableFetchError(f"Failed to fetch URL: {url} (HTTP {resp.status})")
+        if resp.status >= 400:
+            raise PermanentFetchError(f"Failed to fetch URL: {url} (HTTP {resp.status})")
+        self.rate_limiter.record_success(url)
+
+        return RawDocument(
+            source_url=url,
+            status_code=resp.status,
+            headers=resp.headers,
+            content_type=resp.headers.get("Content-Type"),
+            body=resp.body,
+            spool=resp.spool,
+        )
 
-    def _wait_for_rate_limit(self) -> None:
-        elapsed = time.monotonic() - self._last_request_at
-        if elapsed < self.min_request_interval_seconds:
-            time.sleep(self.min_request_interval_seconds - elapsed)
-        self._last_request_at = time.monotonic()
+    def _header(self, headers: dict[str, str], name: str) -> str | None:
+        lowered = name.lower()
+        for key, value in headers.items():
+            if key.lower() == lowered:
+                return value
+        return None
+
+    def _wait_for_rate_limit(self, url: str) -> None:
+        self.rate_limiter.wait(url)
 
     def _assert_allowed_by_robots(self, url: str) -> None:
         if not self.respect_robots:
             return
-        parsed = urlparse(url)
-        host = f"{parsed.scheme}://{parsed.netloc}"
-        rp = self._robots_cache.get(host)
-        if rp is None:
-            robots_url = urljoin(host, "/robots.txt")
-            rp = RobotFileParser()
-            rp.set_url(robots_url)
-            try:
-                rp.read()
-            except Exception:
-                self._robots_cache[host] = rp
-                return
-            self._robots_cache[host] = rp
-
-        if not rp.can_fetch(self.user_agent, url):
-            raise RuntimeError(f"Blocked by robots.txt: {url}")
+        if not self.robots_cache.can_fetch(url, self.user_agent):
+            raise PermanentFetchError(f"Blocked by robots.txt: {url}")
+
+    def known_hosts(self) -> list[str]:
+        hosts: set[str] = set()
+        for index_urls in self.category_indexes.values():
+            for index_url in index_urls:
+                parsed = urlparse(index_url)
+                hosts.add(f"{parsed.scheme}://{parsed.netloc}")
+        return sorted(hosts)
 
     def _extract_links(self, html_doc: str) -> Iterable[tuple[str, str, str]]:
-        for match in LINK_RE.finditer(html_doc):
-            href = match.group("href").strip()
-            link_text = self._clean_text(match.group("text"))
-            start = max(0, match.start() - 240)
-            end = min(len(html_doc), match.end() + 240)
-            context = self._clean_text(html_doc[start:end])
-            yield href, link_text, context
-
-    def _is_document_candidate(self, url: str, link_text: str, context: str) -> bool:
+        index = index_anchors(html_doc)
+        for anchor in index.anchors:
+            yield anchor.href, anchor.text, index.context(anchor)
+
+    def _is_document_candidate(
+        self, url: str, link_text: str, context: str, entities: list[Entity] | None = None
+    ) -> bool:
         lowered = f"{url} {link_text} {context}".lower()
         if url.startswith("mailto:") or url.startswith("javascript:"):
             return False
 
+        found = CANDIDATE_KEYWORDS.categories(lowered, stop_on=("exclude",))
         # Drop obvious non-actionable pages before any expensive parsing.
-        exclude_terms = [
-            "news",
-            "press",
-            "newsletter",
-            "manual",
-            "guide",
-            "brochure",
-            "training",
-            "faq",
-            "photo",
-            "gallery",
-            "video",
-            "event",
-            "workshop",
-            "vacancy",
-            "procurement",
-            "tender",
-            "media",
-            "twitter",
-            "facebook",
-        ]
-        if any(t in lowered for t in exclude_terms):
+        if "exclude" in found:
             return False
 
-        policy_terms = [
-            "conservation and management measure",
-            "management measure",
-            "recommendation",
-            "resolution",
-            "circular",
-            "iuu",
-            "quota",
-            "allocation",
-            "catch limit",
-            "closure",
-            "closed area",
-            "prohibited",
-            "ban",
-            "meeting",
-            "decision",
-        ]
-
-        compliance_terms = [
-            "shall",
-            "must",
-            "required",
-            "deadline",
-            "reporting",
-            "obligation",
-            "compliance",
-            "entry into force",
-            "effective",
-            "implementation",
-        ]
-        has_policy_signal = any(t in lowered for t in policy_terms)
-        has_compliance_signal = any(t in lowered for t in compliance_terms)
-        has_policy_identifier = bool(POLICY_ID_RE.search(f"{link_text} {context}"))
-        has_actionable_extension = any(ext in lowered for ext in [".pdf", ".doc", ".docx", ".xls", ".xlsx", ".htm", ".html"])
+        has_policy_signal = "policy" in found
+        has_compliance_signal = "compliance" in found
+        if entities is None:
+            entities = extract_entities(f"{link_text} {context}", kinds=("policy_id",))
+        has_policy_identifier = first_entity(entities, "policy_id") is not None
+        has_actionable_extension = "document_extension" in found
 
         # High-signal policy filter:
         # - explicit policy ID, or
@@ -279,33 +452,14 @@ class HtmlRFMOAdapter(RFMOAdapter):
         return self._clean_text(m.group(1))[:240]
 
     def _extract_date(self, text: str) -> date | None:
-        for idx, pattern in enumerate(DATE_PATTERNS):
-            m = pattern.search(text)
-            if not m:
-                continue
-            raw = m.group(1)
-            try:
-                if idx == 0:
-                    return date.fromisoformat(raw)
-                if idx == 1:
-                    d, mth, y = raw.split("/")
-                    return date(int(y), int(mth), int(d))
-                return date.fromisoformat(time.strftime("%Y-%m-%d", time.strptime(raw, "%d %B %Y")))
-            except Exception:
-                continue
-        return None
+        # ISO dates carry the top confidence, so the lazy scan can stop at the first valid one.
+        return entity_value(best_entity(iter_entities(text, ("date",)), "date", good_enough=DATE_CONFIDENCE["iso_date"]))
 
     def _extract_document_number(self, text: str) -> str | None:
-        m = DOC_NUMBER_RE.search(text)
-        if not m:
-            return None
-        return m.group(1)
+        return entity_value(first_entity(iter_entities(text, ("document_number",)), "document_number"))
 
     def _extract_meeting_reference(self, text: str) -> str | None:
-        m = MEETING_REF_RE.search(text)
-        if not m:
-            return None
-        return m.group(0)
+        return entity_value(first_entity(iter_entities(text, ("meeting_reference",)), "meeting_reference"))
 
     def _filename_from_url(self, url: str) -> str:
         tail = urlparse(url).path.rstrip("/").split("/")[-1]
@@ -325,7 +479,14 @@ class HtmlRFMOAdapter(RFMOAdapter):
 
 
 class ICCATAdapter(HtmlRFMOAdapter):
-    def __init__(self, user_agent: str) -> None:
+    def __init__(
+        self,
+        user_agent: str,
+        rate_limiter: HostRateLimiter | None = None,
+        transport: HttpTransport | None = None,
+        spool_policy: SpoolPolicy | None = None,
+        robots_cache: RobotsCache | None = None,
+    ) -> None:
         super().__init__(
             name="iccat",
             rfmo="ICCAT",
@@ -345,11 +506,22 @@ class ICCATAdapter(HtmlRFMOAdapter):
                 ],
             },
             user_agent=user_agent,
+            rate_limiter=rate_limiter,
+            transport=transport,
+            spool_policy=spool_policy,
+            robots_cache=robots_cache,
         )
 
 
 class WCPFCAdapter(HtmlRFMOAdapter):
-    def __init__(self, user_agent: str) -> None:
+    def __init__(
+        self,
+        user_agent: str,
+        rate_limiter: HostRateLimiter | None = None,
+        transport: HttpTransport | None = None,
+        spool_policy: SpoolPolicy | None = None,
+        robots_cache: RobotsCache | None = None,
+    ) -> None:
         super().__init__(
             name="wcpfc",
             rfmo="WCPFC",
@@ -372,11 +544,22 @@ class WCPFCAdapter(HtmlRFMOAdapter):
                 ],
             },
             user_agent=user_agent,
+            rate_limiter=rate_limiter,
+            transport=transport,
+            spool_policy=spool_policy,
+            robots_cache=robots_cache,
         )
 
 
 class IOTCAdapter(HtmlRFMOAdapter):
-    def __init__(self, user_agent: str) -> None:
+    def __init__(
+        self,
+        user_agent: str,
+        rate_limiter: HostRateLimiter | None = None,
+        transport: HttpTransport | None = None,
+        spool_policy: SpoolPolicy | None = None,
+        robots_cache: RobotsCache | None = None,
+    ) -> None:
         super().__init__(
             name="iotc",
             rfmo="IOTC",
@@ -402,15 +585,39 @@ class IOTCAdapter(HtmlRFMOAdapter):
                 ],
             },
             user_agent=user_agent,
+            rate_limiter=rate_limiter,
+            transport=transport,
+            spool_policy=spool_policy,
+            robots_cache=robots_cache,
         )
 
 
 class AdapterRegistry:
-    def __init__(self, user_agent: str = "ocean-watch-rfmo-ingestion/1.0") -> None:
+    def __init__(
+        self,
+        user_agent: str = "ocean-watch-rfmo-ingestion/1.0",
+        rate_limiter: HostRateLimiter | None = None,
+        transport: HttpTransport | None = None,
+        spool_policy: SpoolPolicy | None = None,
+        robots_cache: RobotsCache | None = None,
+    ) -> None:
+        self.rate_limiter = rate_limiter or HostRateLimiter()
+        self.transport = transport or HttpTransport()
+        self.robots_cache = robots_cache or RobotsCache(
+            transport=self.transport,
+            user_agent=user_agent,
+            rate_limiter=self.rate_limiter,
+        )
+        shared = {
+            "rate_limiter": self.rate_limiter,
+            "transport": self.transport,
+            "spool_policy": spool_policy,
+            "robots_cache": self.robots_cache,
+        }
         adapters: list[RFMOAdapter] = [
-            ICCATAdapter(user_agent=user_agent),
-            WCPFCAdapter(user_agent=user_agent),
-            IOTCAdapter(user_agent=user_agent),
+            ICCATAdapter(user_agent=user_agent, **shared),
+            WCPFCAdapter(user_agent=user_agent, **shared),
+            IOTCAdapter(user_agent=user_agent, **shared),
         ]
         self._adapters = {a.name: a for a in adapters}
 
@@ -425,3 +632,9 @@ class AdapterRegistry:
         if adapter is None:
             raise KeyError(name)
         return adapter
+
+
+def _replayed(refs: list[DocumentRef]) -> list[DocumentRef]:
+    # Cached refs carry the first scan's discovered_at; a replay is a fresh discovery of them.
+    now = datetime.now(timezone.utc)
+    return [ref.model_copy(update={"from_cache": True, "discovered_at": now}) for ref in refs]
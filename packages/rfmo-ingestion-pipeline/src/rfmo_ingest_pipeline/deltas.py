@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import difflib
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, NamedTuple
+
+
+DELTA_SUFFIX = ".delta"
+DELTA_FORMAT = 1
+KEYFRAME_INTERVAL = 8
+MAX_CHAIN = 256
+# Larger contents are always stored whole: diffing them costs more than the space saved.
+MAX_DELTA_BYTES = 16 * 1024 * 1024
+DELTA_NAMES = frozenset({"extracted.txt", "snapshot.html", "raw.html"})
+
+
+class Hunk(NamedTuple):
+    base_line: int
+    line: int
+    removed: list[str]
+    added: list[str]
+
+
+class TextDelta(NamedTuple):
+    # Line-level edit script from the same artifact of an earlier version (`base`, the version directory
+    # relative to this one) to this one. depth counts deltas back to a whole copy; 0 means this version
+    # is itself stored whole (a keyframe) and the delta is kept only as its "what changed" record.
+    base: str
+    base_sha256: str
+    sha256: str
+    size: int
+    depth: int
+    ops: list[list[Any]]
+
+    def base_path(self, path: str | Path) -> Path:
+        path = Path(path)
+        return Path(os.path.normpath(path.parent / self.base / path.name))
+
+    def apply(self, base_lines: list[bytes]) -> list[bytes]:
+        lines: list[bytes] = []
+        position = 0
+        for op, value in self.ops:
+            if op == "=":
+                lines.extend(base_lines[position : position + value])
+                position += value
+            elif op == "-":
+                position += len(value)
+            else:
+                lines.extend(_encode(line) for line in value)
+        return lines
+
+    def hunks(self) -> list[Hunk]:
+        # Line numbers are 0-based and lines come without their line endings; a replacement (removal
+        # directly followed by insertion) is one hunk.
+        hunks: list[Hunk] = []
+        base_line = line = 0
+        previous_op = ""
+        for op, value in self.ops:
+            readable = [_encode(item).decode("utf-8", errors="replace").rstrip("\r\n") for item in value] if op != "=" else []
+            if op == "=":
+                base_line += value
+                line += value
+            elif op == "-":
+                hunks.append(Hunk(base_line, line, readable, []))
+                base_line += len(value)
+            else:
+                if previous_op == "-":
+                    hunks[-1] = hunks[-1]._replace(added=readable)
+                else:
+                    hunks.append(Hunk(base_line, line, [], readable))
+                line += len(value)
+            previous_op = op
+        return hunks
+
+    def to_bytes(self) -> bytes:
+        payload = {"format": DELTA_FORMAT, **self._asdict()}
+        # Lines that are not valid UTF-8 travel as lone surrogates, which only surrogatepass can encode.
+        return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8", "surrogatepass")
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> TextDelta:
+        payload = json.loads(data.decode("utf-8", "surrogatepass"))
+        if payload.get("format") != DELTA_FORMAT:
+            raise ValueError(f"Unsupported delta format {payload.get('format')!r}")
+        return cls(**{field: payload[field] for field in cls._fields})
+
+
+def encode_delta(
+    base: bytes,
+    content: bytes,
+    base_dir: str,
+    base_depth: int,
+    keyframe_interval: int = KEYFRAME_INTERVAL,
+) -> TextDelta | None:
+    # A keyframe is forced every keyframe_interval versions so reconstruction never replays a long
+    # chain. An edit script that is not clearly smaller than the content (a wholesale rewrite) gives
+    # None: the version is stored whole with no change record, which would otherwise cost more than
+    # the content itself.
+    base_lines = base.splitlines(keepends=True)
+    lines = content.splitlines(keepends=True)
+    ops: list[list[Any]] = []
+    matcher = difflib.SequenceMatcher(None, base_lines, lines)
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == "equal":
+            ops.append(["=", i2 - i1])
+            continue
+        if i2 > i1:
+            ops.append(["-", [_decode(line) for line in base_lines[i1:i2]]])
+        if j2 > j1:
+            ops.append(["+", [_decode(line) for line in lines[j1:j2]]])
+    delta = TextDelta(
+        base=base_dir,
+        base_sha256=hashlib.sha256(base).hexdigest(),
+        sha256=hashlib.sha256(content).hexdigest(),
+        size=len(content),
+        depth=base_depth + 1,
+        ops=ops,
+    )
+    if len(delta.to_bytes()) * 2 > len(content):
+        return None
+    if delta.depth >= keyframe_interval:
+        return delta._replace(depth=0)
+    return delta
+
+
+def reconstruct(base: bytes, chain: list[TextDelta]) -> bytes:
+    # chain runs from the requested version back towards `base`, the nearest whole copy.
+    lines = base.splitlines(keepends=True)
+    for delta in reversed(chain):
+        lines = delta.apply(lines)
+    content = b"".join(lines)
+    if chain and hashlib.sha256(content).hexdigest() != chain[0].sha256:
+        raise ValueError("Reconstructed artifact does not match its recorded sha256")
+    return content
+
+
+def delta_path(path: str | Path) -> Path:
+    path = Path(path)
+    return path.with_name(path.name + DELTA_SUFFIX)
+
+
+def _decode(line: bytes) -> str:
+    return line.decode("utf-8", "surrogateescape")
+
+
+def _encode(line: str) -> bytes:
+    return line.encode("utf-8", "surrogateescape")
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import re
+import zipfile
+from typing import BinaryIO, Iterator
+from xml.etree.ElementTree import Element, iterparse
+
+
+W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+PARAGRAPH = f"{W}p"
+TABLE = f"{W}tbl"
+ROW = f"{W}tr"
+CELL = f"{W}tc"
+TEXT = f"{W}t"
+BLOCKS = frozenset({PARAGRAPH, ROW, TABLE})
+BREAKS = frozenset({f"{W}tab", f"{W}br", f"{W}cr"})
+SUPPLEMENTARY_PART_RE = re.compile(r"word/(?P<kind>header|footer|footnotes|endnotes)\d*\.xml")
+SUPPLEMENTARY_ORDER = ("header", "footer", "footnotes", "endnotes")
+
+
+def iter_docx_text(body: BinaryIO) -> Iterator[str]:
+    # Yields one line per paragraph and per table row (cells tab-separated): the main document
+    # first, then headers, footers, footnotes and endnotes.
+    with zipfile.ZipFile(body) as zf:
+        names = zf.namelist()
+        supplementary = sorted(
+            (SUPPLEMENTARY_ORDER.index(match.group("kind")), name)
+            for name in names
+            if (match := SUPPLEMENTARY_PART_RE.fullmatch(name))
+        )
+        parts = ["word/document.xml"] + [name for _, name in supplementary]
+        for part in parts:
+            if part not in names:
+                continue
+            with zf.open(part) as stream:
+                yield from iter_part_text(stream)
+
+
+def iter_part_text(stream: BinaryIO) -> Iterator[str]:
+    stack: list[Element] = []
+    runs: list[str] = []
+    # One entry per open table: its current row's cells, each a list of paragraph texts.
+    tables: list[list[list[str]]] = []
+    for event, elem in iterparse(stream, events=("start", "end")):
+        if event == "start":
+            stack.append(elem)
+            if elem.tag == TABLE:
+                tables.append([])
+            elif elem.tag == ROW and tables:
+                tables[-1] = []
+            elif elem.tag == CELL and tables:
+                tables[-1].append([])
+            continue
+
+        stack.pop()
+        tag = elem.tag
+        if tag == TEXT:
+            if elem.text:
+                runs.append(elem.text)
+        elif tag in BREAKS:
+            runs.append(" ")
+        elif tag == PARAGRAPH:
+            text = " ".join("".join(runs).split())
+            runs.clear()
+            if text:
+                if tables and tables[-1]:
+                    tables[-1][-1].append(text)
+                else:
+                    yield text
+        elif tag == ROW and tables:
+            line = "\t".join(" ".join(cell) for cell in tables[-1])
+            tables[-1] = []
+            if line.strip():
+                if len(tables) > 1 and tables[-2]:
+                    # A nested table's rows become text of the enclosing cell.
+                    tables[-2][-1].append(line.replace("\t", " "))
+                else:
+                    yield line
+        elif tag == TABLE and tables:
+            tables.pop()
+
+        if tag in BLOCKS and stack:
+            _detach(stack[-1], elem)
+
+
+def _detach(parent: Element, elem: Element) -> None:
+    # A finished paragraph/row/table and everything before it in document order has been read, so
+    # it is dropped from the tree to keep memory bounded by the block being parsed. The parser may
+    # already have appended later siblings, so the element is not necessarily the last child.
+    for index, child in enumerate(parent):
+        if child is elem:
+            del parent[: index + 1]
+            return
@@ -1,17 +1,37 @@
 from __future__ import annotations
 
+import heapq
+import json
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from datetime import datetime, timezone
+from functools import partial
 from typing import Iterable
+from urllib.parse import urlparse
 
 from rfmo_ingest_pipeline.connectors import AdapterRegistry, RFMOAdapter
+from rfmo_ingest_pipeline.deltas import KEYFRAME_INTERVAL, Hunk
 from rfmo_ingest_pipeline.models import (
     DocumentRecord,
+    DocumentRef,
     DocumentVersionRecord,
     IngestionRunResult,
+    ParsedDocument,
     ProcessingStatus,
+    QuarantineRecord,
+    RawDocument,
+    RetentionPolicy,
     RunMetrics,
     SourceHealth,
 )
+from rfmo_ingest_pipeline.ocr import OcrBackend, PdfOcr, TesseractBackend
+from rfmo_ingest_pipeline.pdf_text import PdfBudget
+from rfmo_ingest_pipeline.retention import RetentionJob, RetentionStats
+from rfmo_ingest_pipeline.robots import RobotsCache
+from rfmo_ingest_pipeline.sandbox import ParseFailure, ParseSandbox
+from rfmo_ingest_pipeline.segments import SegmentStorage
 from rfmo_ingest_pipeline.services import (
     ArtifactStorage,
     ChangeDetectionService,
@@ -30,15 +50,43 @@ class IngestionEngine:
         db_path: str = "./rfmo_ingestion.db",
         storage_root: str = "./rfmo",
         adapters: AdapterRegistry | None = None,
+        max_workers: int = 1,
+        parse_workers: int = 0,
+        pdf_budget: PdfBudget | None = None,
+        parse_timeout_seconds: float = 120.0,
+        parse_memory_limit_mb: int | None = 1024,
+        ocr_backend: OcrBackend | None = None,
+        ocr_workers: int = 2,
+        storage_compression: str | None = None,
+        storage_backend: str = "directory",
+        keyframe_interval: int = KEYFRAME_INTERVAL,
     ) -> None:
         self.store = SQLiteStore(db_path=db_path)
-        self.storage = ArtifactStorage(storage_root)
+        if storage_backend == "segments":
+            self.storage: ArtifactStorage | SegmentStorage = SegmentStorage(
+                storage_root, compression=storage_compression, keyframe_interval=keyframe_interval
+            )
+        elif storage_backend == "directory":
+            self.storage = ArtifactStorage(storage_root, compression=storage_compression, keyframe_interval=keyframe_interval)
+        else:
+            raise ValueError(f"Unknown storage backend {storage_backend!r}; expected directory or segments")
         self.adapters = adapters or AdapterRegistry()
         self.fetcher = FetchService()
-        self.parser = ParseService()
+        self.parse_workers = parse_workers
+        self.parse_pool: ParseSandbox | None = None
+        if parse_workers > 0:
+            self.parse_pool = ParseSandbox(
+                max_workers=parse_workers,
+                timeout_seconds=parse_timeout_seconds,
+                memory_limit_mb=parse_memory_limit_mb,
+            )
+        self.ocr = PdfOcr(ocr_backend or TesseractBackend(), cache=self.store, max_workers=ocr_workers)
+        self.parser = ParseService(executor=self.parse_pool, pdf_budget=pdf_budget, ocr=self.ocr)
         self.change_detector = ChangeDetectionService()
         self.metrics = MetricsRegistry()
         self.metrics_server = MetricsServer(self.metrics)
+        self.max_workers = max_workers
+        self._metrics_lock = threading.Lock()
 
     def start_metrics_server(self, host: str = "0.0.0.0", port: int = 9108) -> None:
         self.metrics_server.host = host
@@ -48,21 +96,68 @@ class IngestionEngine:
     def stop_metrics_server(self) -> None:
         self.metrics_server.stop()
 
+    def close(self) -> None:
+        self.ocr.close()
+        self.storage.close()
+        if self.parse_pool is not None:
+            self.parse_pool.shutdown(wait=True)
+            self.parse_pool = None
+
     def run_once(self, adapter_names: list[str] | None = None) -> IngestionRunResult:
         metrics = RunMetrics()
         health_updates: list[SourceHealth] = []
         errors: list[str] = []
+        jobs: list[tuple[RFMOAdapter, DocumentRef]] = []
+        adapters = self._select_adapters(adapter_names)
+        self._prepare_run(adapters)
+
+        if self.max_workers > 1 or self.parse_pool is not None:
+            health_updates = self._run_concurrent(adapters, metrics, errors)
+            for health in health_updates:
+                self.store.upsert_source_health(health)
+        else:
+            for adapter in adapters:
+                refs, failure = self._discover(adapter, metrics, errors)
+                health = failure or self._healthy_source(adapter)
+                health_updates.append(health)
+                self.store.upsert_source_health(health)
+                jobs.extend((adapter, ref) for ref in refs)
+            self._run_inline(jobs, metrics, errors)
+
+        return self._finish_run(metrics, health_updates, errors)
 
+    def _select_adapters(self, adapter_names: list[str] | None) -> list[RFMOAdapter]:
         if adapter_names:
             adapters = [self.adapters.get(name) for name in adapter_names]
         else:
             adapters = self.adapters.all()
+        return adapters
 
+    def _prepare_run(self, adapters: list[RFMOAdapter]) -> None:
+        prefetch: dict[int, tuple[RobotsCache, list[str]]] = {}
         for adapter in adapters:
-            health = self._run_adapter(adapter, metrics, errors)
-            health_updates.append(health)
-            self.store.upsert_source_health(health)
-
+            binder = getattr(adapter, "bind_index_cache", None)
+            if binder is not None:
+                binder(self.store)
+            robots_cache = getattr(adapter, "robots_cache", None)
+            if robots_cache is None:
+                continue
+            robots_cache.bind_store(self.store)
+            if getattr(adapter, "respect_robots", False):
+                hosts = prefetch.setdefault(id(robots_cache), (robots_cache, []))[1]
+                hosts.extend(adapter.known_hosts())
+        for robots_cache, hosts in prefetch.values():
+            robots_cache.prefetch(hosts)
+
+    def _robots_caches(self) -> list[RobotsCache]:
+        caches: dict[int, RobotsCache] = {}
+        for adapter in self.adapters.all():
+            robots_cache = getattr(adapter, "robots_cache", None)
+            if robots_cache is not None:
+                caches[id(robots_cache)] = robots_cache
+        return list(caches.values())
+
+    def _finish_run(self, metrics: RunMetrics, health_updates: list[SourceHealth], errors: list[str]) -> IngestionRunResult:
         metrics.finished_at = datetime.now(timezone.utc)
         metrics.duration_seconds = (metrics.finished_at - metrics.started_at).total_seconds()
         self._record_metrics(metrics)
@@ -71,35 +166,109 @@ class IngestionEngine:
         self.store.save_run_result(result)
         return result
 
-    def _run_adapter(self, adapter: RFMOAdapter, metrics: RunMetrics, errors: list[str]) -> SourceHealth:
+    def _run_inline(self, jobs: list[tuple[RFMOAdapter, DocumentRef]], metrics: RunMetrics, errors: list[str]) -> None:
+        # Sequential mode keeps the same ready-time heap as _dispatch: a backed-off document waits
+        # behind every document that is ready now, and the run only sleeps when nothing else is.
+        pending = [(0.0, seq, adapter, ref, 1) for seq, (adapter, ref) in enumerate(jobs)]
+        seq = len(pending)
+        while pending:
+            ready_at, _, adapter, ref, attempt = heapq.heappop(pending)
+            time.sleep(max(0.0, ready_at - time.monotonic()))
+            delay = self._attempt_document_ref(adapter, ref, attempt, metrics, errors)
+            if delay is not None:
+                heapq.heappush(pending, (time.monotonic() + delay, seq, adapter, ref, attempt + 1))
+                seq += 1
+
+    def _run_concurrent(self, adapters: list[RFMOAdapter], metrics: RunMetrics, errors: list[str]) -> list[SourceHealth]:
+        # Threads waiting on the parse pool release the GIL, so one extra thread per parse worker
+        # keeps fetching going while documents are being parsed.
+        workers = max(self.max_workers, self.parse_workers + 1) if self.parse_pool is not None else self.max_workers
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="rfmo-ingest") as pool:
+            discovered = list(pool.map(lambda adapter: self._discover(adapter, metrics, errors), adapters))
+            jobs = [(adapter, ref) for adapter, (refs, _) in zip(adapters, discovered) for ref in refs]
+            self._dispatch(pool, self._interleave_by_host(jobs), metrics, errors)
+
+        return [failure or self._healthy_source(adapter) for adapter, (_, failure) in zip(adapters, discovered)]
+
+    def _dispatch(
+        self,
+        pool: ThreadPoolExecutor,
+        jobs: list[tuple[RFMOAdapter, DocumentRef]],
+        metrics: RunMetrics,
+        errors: list[str],
+    ) -> None:
+        # Retries wait in a ready-time heap rather than sleeping in a worker, so a backed-off
+        # host never holds a thread that other documents could use.
+        pending = [(0.0, seq, adapter, ref, 1) for seq, (adapter, ref) in enumerate(jobs)]
+        seq = len(pending)
+        in_flight: dict[Future[float | None], tuple[RFMOAdapter, DocumentRef, int]] = {}
+        while pending or in_flight:
+            now = time.monotonic()
+            while pending and pending[0][0] <= now:
+                _, _, adapter, ref, attempt = heapq.heappop(pending)
+                future = pool.submit(self._attempt_document_ref, adapter, ref, attempt, metrics, errors)
+                in_flight[future] = (adapter, ref, attempt)
+            timeout = max(0.0, pending[0][0] - now) if pending else None
+            if not in_flight:
+                time.sleep(timeout or 0.0)
+                continue
+            done, _ = wait(in_flight, timeout=timeout, return_when=FIRST_COMPLETED)
+            for future in done:
+                adapter, ref, attempt = in_flight.pop(future)
+                delay = future.result()
+                if delay is not None:
+                    heapq.heappush(pending, (time.monotonic() + delay, seq, adapter, ref, attempt + 1))
+                    seq += 1
+
+    def _discover(
+        self, adapter: RFMOAdapter, metrics: RunMetrics, errors: list[str]
+    ) -> tuple[list[DocumentRef], SourceHealth | None]:
         try:
             refs = adapter.list_documents()
-            metrics.documents_discovered += len(refs)
-            self.metrics.add("rfmo_documents_discovered_total", float(len(refs)))
-            filtered_out = self._adapter_filtered_count(adapter)
-            metrics.documents_filtered_out += filtered_out
-            self.metrics.add("rfmo_documents_filtered_out_total", float(filtered_out))
         except Exception as exc:  # noqa: BLE001
-            metrics.failures += 1
-            self.metrics.add("rfmo_failures_total", 1.0)
-            err = f"{adapter.name}: list_documents failed: {exc}"
-            errors.append(err)
-            previous = self._source_health(adapter)
-            return SourceHealth(
-                rfmo=adapter.rfmo,
-                adapter_name=adapter.name,
-                last_success_at=previous.last_success_at,
-                consecutive_failures=previous.consecutive_failures + 1,
-                last_error=err,
-            )
+            return [], self._discovery_failed(adapter, exc, metrics, errors)
+        return self._accept_discovered(adapter, refs, metrics), None
+
+    def _accept_discovered(self, adapter: RFMOAdapter, refs: list[DocumentRef], metrics: RunMetrics) -> list[DocumentRef]:
+        self._count(metrics, "documents_discovered", "rfmo_documents_discovered_total", len(refs))
+        filtered_out = self._adapter_filtered_count(adapter)
+        self._count(metrics, "documents_filtered_out", "rfmo_documents_filtered_out_total", filtered_out)
+        unchanged = self._adapter_index_stats(adapter).get("indexes_unchanged", 0)
+        self._count(metrics, "index_pages_unchanged", "rfmo_index_pages_unchanged_total", unchanged)
 
+        unique: list[DocumentRef] = []
         seen: set[str] = set()
         for ref in refs:
             if ref.source_url in seen:
                 continue
             seen.add(ref.source_url)
-            self._process_document_ref(adapter, ref, metrics, errors)
+            unique.append(ref)
+
+        # Refs replayed from an unchanged index page are not fetched again once their document is stored;
+        # only those still without a version (e.g. after an earlier fetch failure) go on to be processed.
+        replayed = [ref for ref in unique if ref.from_cache]
+        stored = self.store.versioned_source_urls(replayed) if replayed else set()
+        if stored:
+            self._count(metrics, "index_refs_skipped", "rfmo_index_refs_skipped_total", len(stored))
+            unique = [ref for ref in unique if not (ref.from_cache and ref.source_url in stored)]
+        return unique
+
+    def _discovery_failed(
+        self, adapter: RFMOAdapter, exc: Exception, metrics: RunMetrics, errors: list[str]
+    ) -> SourceHealth:
+        self._count(metrics, "failures", "rfmo_failures_total")
+        err = f"{adapter.name}: list_documents failed: {exc}"
+        self._record_error(errors, err)
+        previous = self._source_health(adapter)
+        return SourceHealth(
+            rfmo=adapter.rfmo,
+            adapter_name=adapter.name,
+            last_success_at=previous.last_success_at,
+            consecutive_failures=previous.consecutive_failures + 1,
+            last_error=err,
+        )
 
+    def _healthy_source(self, adapter: RFMOAdapter) -> SourceHealth:
         return SourceHealth(
             rfmo=adapter.rfmo,
             adapter_name=adapter.name,
@@ -108,73 +277,203 @@ class IngestionEngine:
             last_error=None,
         )
 
-    def _process_document_ref(self, adapter: RFMOAdapter, ref, metrics: RunMetrics, errors: list[str]) -> None:
+    def _interleave_by_host(
+        self, jobs: list[tuple[RFMOAdapter, DocumentRef]]
+    ) -> list[tuple[RFMOAdapter, DocumentRef]]:
+        by_host: dict[str, deque[tuple[RFMOAdapter, DocumentRef]]] = {}
+        for job in jobs:
+            by_host.setdefault(urlparse(job[1].source_url).netloc.lower(), deque()).append(job)
+
+        ordered: list[tuple[RFMOAdapter, DocumentRef]] = []
+        queues = list(by_host.values())
+        while queues:
+            for queue in queues:
+                ordered.append(queue.popleft())
+            queues = [queue for queue in queues if queue]
+        return ordered
+
+    def _count(self, metrics: RunMetrics, field: str, registry_key: str, amount: float = 1) -> None:
+        with self._metrics_lock:
+            setattr(metrics, field, getattr(metrics, field) + amount)
+        self.metrics.add(registry_key, float(amount))
+
+    def _count_parse_cpu(self, metrics: RunMetrics, parser: str, seconds: float) -> None:
+        with self._metrics_lock:
+            metrics.parse_cpu_seconds[parser] = metrics.parse_cpu_seconds.get(parser, 0.0) + seconds
+        self.metrics.add(f"rfmo_parse_cpu_seconds_{parser}_total", seconds)
+
+    def _record_error(self, errors: list[str], message: str) -> None:
+        with self._metrics_lock:
+            errors.append(message)
+
+    def _attempt_document_ref(
+        self, adapter: RFMOAdapter, ref: DocumentRef, attempt: int, metrics: RunMetrics, errors: list[str]
+    ) -> float | None:
         document = self.store.upsert_document_discovered(ref)
+        raw: RawDocument | None = None
 
         try:
-            raw = self.fetcher.fetch_with_retries(adapter.fetch_document, ref)
-            metrics.documents_fetched += 1
-            self.metrics.add("rfmo_documents_fetched_total", 1.0)
-
-            base_meta = adapter.extract_metadata(raw, ref)
-            parsed = self.parser.parse(raw, base_meta)
+            latest = self.store.get_latest_version(document.id)
+            try:
+                raw = adapter.fetch_document(self._conditional_ref(ref, latest))
+            except Exception as exc:  # noqa: BLE001
+                delay = self.fetcher.retry_policy.next_delay(exc, ref, attempt)
+                self._count(metrics, "fetch_retries", "rfmo_fetch_retries_total")
+                return delay
+            self._complete_document(adapter, ref, document, latest, raw, metrics)
+        except Exception as exc:  # noqa: BLE001
+            self._document_failed(adapter, ref, document, exc, metrics, errors)
+        finally:
+            if raw is not None:
+                raw.release_body()
+        return None
 
-            file_hash = sha256_hex(raw.body)
-            content_hash = sha256_hex(parsed.extracted_text)
-            metadata_payload = self._metadata_payload(document, ref, raw, parsed, file_hash)
-            metadata_hash = sha256_hex(str(self._stable_metadata_signature(ref, raw, parsed)))
+    def _document_failed(
+        self,
+        adapter: RFMOAdapter,
+        ref: DocumentRef,
+        document: DocumentRecord,
+        exc: Exception,
+        metrics: RunMetrics,
+        errors: list[str],
+    ) -> None:
+        self.store.mark_document_status(document.id, ProcessingStatus.failed)
+        self._count(metrics, "failures", "rfmo_failures_total")
+        if isinstance(exc, ParseFailure):
+            self._count(metrics, "parse_failures", "rfmo_parse_failures_total")
+        self._record_error(errors, f"{adapter.name}: {ref.source_url}: {exc}")
 
-            latest = self.store.get_latest_version(document.id)
+    def _complete_document(
+        self,
+        adapter: RFMOAdapter,
+        ref: DocumentRef,
+        document: DocumentRecord,
+        latest: DocumentVersionRecord | None,
+        raw: RawDocument,
+        metrics: RunMetrics,
+    ) -> None:
+        if raw.status_code == 304:
+            if latest is None:
+                raise RuntimeError(f"Unexpected 304 Not Modified without a stored version: {ref.source_url}")
+            self.store.mark_document_status(document.id, ProcessingStatus.skipped)
+            self._count(metrics, "documents_not_modified", "rfmo_documents_not_modified_total")
+            self._count(metrics, "documents_skipped", "rfmo_documents_skipped_total")
+            return
+
+        self._count(metrics, "documents_fetched", "rfmo_documents_fetched_total")
+
+        file_hash = raw.body_sha256()
+        etag = raw.headers.get("ETag") or raw.headers.get("Etag")
+        last_modified = raw.headers.get("Last-Modified")
+        base_meta = adapter.extract_metadata(raw, ref)
+        metadata_hash = sha256_hex(str(self._stable_metadata_signature(ref, raw, base_meta)))
+
+        if latest is not None and latest.file_hash == file_hash:
+            # Identical bytes extract to the stored text, so the change decision needs no parse.
             decision = self.change_detector.evaluate(
                 document=document,
                 latest_version=latest,
                 file_hash=file_hash,
                 metadata_hash=metadata_hash,
-                content_hash=content_hash,
-                etag=raw.headers.get("ETag") or raw.headers.get("Etag"),
-                last_modified=raw.headers.get("Last-Modified"),
+                content_hash=latest.content_hash,
+                etag=etag,
+                last_modified=last_modified,
             )
-
             if not decision.should_ingest:
                 self.store.mark_document_status(document.id, ProcessingStatus.skipped)
-                metrics.documents_skipped += 1
-                self.metrics.add("rfmo_documents_skipped_total", 1.0)
+                self._count(metrics, "documents_unchanged_unparsed", "rfmo_documents_unchanged_unparsed_total")
+                self._count(metrics, "documents_skipped", "rfmo_documents_skipped_total")
                 return
 
-            raw_path, extracted_path, snapshot_path, metadata_path, bytes_written = self.storage.persist(
-                document=document,
-                version_number=decision.next_version_number,
-                raw=raw,
-                parsed=parsed,
-                metadata=metadata_payload,
-            )
+        if self.store.get_quarantine(file_hash) is not None:
+            self.store.mark_document_status(document.id, ProcessingStatus.skipped)
+            self._count(metrics, "documents_quarantined", "rfmo_documents_quarantined_total")
+            self._count(metrics, "documents_skipped", "rfmo_documents_skipped_total")
+            return
 
-            document.status = ProcessingStatus.ingested
-            version = DocumentVersionRecord(
-                document_id=document.id,
-                version_number=decision.next_version_number,
-                file_hash=file_hash,
-                etag=raw.headers.get("ETag") or raw.headers.get("Etag"),
-                last_modified=raw.headers.get("Last-Modified"),
-                metadata_hash=metadata_hash,
-                content_hash=content_hash,
-                status=ProcessingStatus.ingested,
-                stored_path=raw_path,
-                extracted_text_path=extracted_path,
-                snapshot_html_path=snapshot_path,
-                metadata_path=metadata_path,
-            )
-            self.store.create_version(version, document)
+        try:
+            same_bytes = latest is not None and latest.file_hash == file_hash
+            stored = partial(self._stored_parse, latest) if same_bytes else None
+            parsed = self.parser.parse(raw, base_meta, file_hash=file_hash, stored=stored)
+        except ParseFailure as exc:
+            # Skipped on later runs until the body (and so its hash) changes.
+            self.store.save_quarantine(QuarantineRecord(file_hash=file_hash, source_url=ref.source_url, reason=str(exc)))
+            raise
+        # The parsed document now holds everything later stages read from the decoded body.
+        raw.buffer.release()
+        if parsed.parse_cache_hit:
+            self._count(metrics, "parse_cache_hits", "rfmo_parse_cache_hits_total")
+        else:
+            self._count_parse_cpu(metrics, str(parsed.parser_info.get("parser", "unknown")), parsed.parse_cpu_seconds)
+
+        content_hash = sha256_hex(parsed.extracted_text)
+        metadata_payload = self._metadata_payload(document, ref, raw, parsed, file_hash)
+
+        decision = self.change_detector.evaluate(
+            document=document,
+            latest_version=latest,
+            file_hash=file_hash,
+            metadata_hash=metadata_hash,
+            content_hash=content_hash,
+            etag=etag,
+            last_modified=last_modified,
+        )
 
-            metrics.documents_ingested += 1
-            metrics.storage_bytes_written += bytes_written
-            self.metrics.add("rfmo_documents_ingested_total", 1.0)
-            self.metrics.add("rfmo_storage_bytes_total", float(bytes_written))
-        except Exception as exc:  # noqa: BLE001
-            self.store.mark_document_status(document.id, ProcessingStatus.failed)
-            metrics.failures += 1
-            self.metrics.add("rfmo_failures_total", 1.0)
-            errors.append(f"{adapter.name}: {ref.source_url}: {exc}")
+        if not decision.should_ingest:
+            self.store.mark_document_status(document.id, ProcessingStatus.skipped)
+            self._count(metrics, "documents_skipped", "rfmo_documents_skipped_total")
+            return
+
+        stored = self.storage.persist(
+            document=document,
+            version_number=decision.next_version_number,
+            raw=raw,
+            parsed=parsed,
+            metadata=metadata_payload,
+            previous=latest,
+        )
+        raw.release_body()
+
+        document.status = ProcessingStatus.ingested
+        version = DocumentVersionRecord(
+            document_id=document.id,
+            version_number=decision.next_version_number,
+            file_hash=file_hash,
+            etag=etag,
+            last_modified=last_modified,
+            metadata_hash=metadata_hash,
+            content_hash=content_hash,
+            status=ProcessingStatus.ingested,
+            stored_path=stored.raw_path,
+            extracted_text_path=stored.extracted_path,
+            snapshot_html_path=stored.snapshot_path,
+            metadata_path=stored.metadata_path,
+        )
+        self.store.create_version(version, document)
+
+        self._count(metrics, "documents_ingested", "rfmo_documents_ingested_total")
+        self._count(metrics, "storage_bytes_written", "rfmo_storage_bytes_total", stored.logical_bytes)
+        self._count(
+            metrics, "storage_physical_bytes_written", "rfmo_storage_physical_bytes_total", stored.physical_bytes
+        )
+
+    def _conditional_ref(self, ref: DocumentRef, latest: DocumentVersionRecord | None) -> DocumentRef:
+        if latest is None or not (latest.etag or latest.last_modified):
+            return ref
+        return ref.model_copy(update={"if_none_match": latest.etag, "if_modified_since": latest.last_modified})
+
+    def _stored_parse(self, version: DocumentVersionRecord) -> ParsedDocument | None:
+        # The extraction persisted with an earlier version; missing or unreadable artifacts mean a re-parse.
+        reader = self.storage.reader()
+        try:
+            metadata = json.loads(reader.read_text(version.metadata_path))
+            return ParsedDocument(
+                extracted_text=reader.read_text(version.extracted_text_path),
+                snapshot_html=reader.read_text(version.snapshot_html_path) if version.snapshot_html_path else None,
+                parser_info=metadata.get("parser_info") or {},
+            )
+        except (OSError, ValueError):
+            return None
 
     def _metadata_payload(self, document: DocumentRecord, ref, raw, parsed, file_hash: str) -> dict:
         return {
@@ -196,16 +495,16 @@ class IngestionEngine:
             "adapter_metadata": ref.metadata,
         }
 
-    def _stable_metadata_signature(self, ref, raw, parsed) -> dict:
+    def _stable_metadata_signature(self, ref, raw, meta: ParsedDocument) -> dict:
         return {
             "source_url": ref.source_url,
             "rfmo": ref.rfmo,
             "document_type": ref.document_type.value,
-            "published_date": parsed.publication_date.isoformat() if parsed.publication_date else None,
-            "title": parsed.title,
-            "document_number": parsed.document_number,
-            "meeting_reference": parsed.meeting_reference,
-            "rfmo_region": parsed.rfmo_region,
+            "published_date": meta.publication_date.isoformat() if meta.publication_date else None,
+            "title": meta.title,
+            "document_number": meta.document_number,
+            "meeting_reference": meta.meeting_reference,
+            "rfmo_region": meta.rfmo_region,
             "etag": raw.headers.get("ETag") or raw.headers.get("Etag"),
             "last_modified": raw.headers.get("Last-Modified"),
             "content_type": raw.content_type,
@@ -214,8 +513,25 @@ class IngestionEngine:
     def _record_metrics(self, metrics: RunMetrics) -> None:
         if metrics.duration_seconds is not None:
             self.metrics.add("rfmo_processing_seconds_total", metrics.duration_seconds)
-        if metrics.parse_failures:
-            self.metrics.add("rfmo_parse_failures_total", float(metrics.parse_failures))
+        for key, value in self.ocr.stats().items():
+            self.metrics.set(f"rfmo_ocr_{key}_total", float(value))
+        if self.parse_pool is not None:
+            for key, value in self.parse_pool.stats().items():
+                self.metrics.set(f"rfmo_parse_sandbox_{key}_total", float(value))
+        transport = getattr(self.adapters, "transport", None)
+        if transport is not None:
+            for key, value in transport.stats().items():
+                self.metrics.set(f"rfmo_http_{key}_total", float(value))
+        rate_limiter = getattr(self.adapters, "rate_limiter", None)
+        if rate_limiter is not None:
+            for key, value in rate_limiter.stats().items():
+                self.metrics.set(f"rfmo_rate_limiter_{key}_total", float(value))
+        robots_totals: dict[str, int] = {}
+        for robots_cache in self._robots_caches():
+            for key, value in robots_cache.stats().items():
+                robots_totals[key] = robots_totals.get(key, 0) + value
+        for key, value in robots_totals.items():
+            self.metrics.set(f"rfmo_robots_cache_{key}_total", float(value))
 
     def _source_health(self, adapter: RFMOAdapter) -> SourceHealth:
         for row in self.store.list_source_health():
@@ -228,11 +544,19 @@ class IngestionEngine:
         if getter is None:
             return 0
         try:
-            _, filtered = getter()
-            return int(filtered)
+            return int(getter()[1])
         except Exception:  # noqa: BLE001
             return 0
 
+    def _adapter_index_stats(self, adapter: RFMOAdapter) -> dict[str, int]:
+        getter = getattr(adapter, "last_index_stats", None)
+        if getter is None:
+            return {}
+        try:
+            return dict(getter())
+        except Exception:  # noqa: BLE001
+            return {}
+
     def run_adapter(self, adapter_name: str) -> IngestionRunResult:
         return self.run_once(adapter_names=[adapter_name])
 
@@ -245,6 +569,24 @@ class IngestionEngine:
             versions.extend(self.store.list_document_versions(doc.id))
         return versions
 
+    def text_changes(self, document_id: str, version_number: int) -> list[Hunk] | None:
+        # Extracted-text lines removed and added since the previous version, recorded at ingest time.
+        for version in self.store.list_document_versions(document_id):
+            if version.version_number == version_number:
+                return self.storage.reader().changes(version.extracted_text_path)
+        return None
+
+    def apply_retention(
+        self,
+        policy: RetentionPolicy,
+        max_documents: int | None = None,
+        workers: int = 4,
+        dry_run: bool = False,
+    ) -> RetentionStats:
+        # Run between ingestion runs: pruning a blob races a concurrent persist linking to it.
+        job = RetentionJob(self.store, self.storage, policy, workers=workers, metrics=self.metrics)
+        return job.run(max_documents=max_documents, dry_run=dry_run)
+
     def list_storage_paths(self, rfmo: str | None = None) -> list[str]:
         paths: list[str] = []
         for version in self.list_versions(rfmo=rfmo):
@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from datetime import date
+from functools import lru_cache
+from typing import Any, Iterable, Iterator
+
+
+MONTHS = {
+    name: number
+    for number, name in enumerate(
+        (
+            "january", "february", "march", "april", "may", "june", "july", "august", "september",
+            "october", "november", "december",
+        ),
+        start=1,
+    )
+}
+KINDS = frozenset({"date", "due_date", "document_number", "policy_id", "meeting_reference"})
+# Each alternative is one named group; an entity kind pulls in the alternatives it needs.
+ALTERNATIVES = {
+    "iso_date": r"(?P<iso_date>20\d{2}-\d{2}-\d{2})",
+    "dmy_date": r"(?P<dmy_date>[0-3]?\d/[0-1]?\d/20\d{2})",
+    "long_date": rf"(?P<long_date>[0-3]?\d\s+(?:{'|'.join(MONTHS)})\s+20\d{{2}})",
+    "policy": (
+        r"\b(?P<policy>(?P<policy_prefix>CMM|REC|RES|Recommendation|Resolution|Circular)\s*[-:]?\s*"
+        r"(?P<policy_number>\d{4}[-/]\d{1,3}|[A-Z]{1,4}-\d{2,4})\b)"
+    ),
+    "meeting": r"\b(?P<meeting>(?:COM|WCPFC|IOTC)[-_ ]?(?:\d{1,2}|20\d{2})\b)",
+    "deadline_cue": r"\b(?P<deadline_cue>deadline|due(?:\s+date)?|submit(?:\s+\w+){0,4}\s+by)",
+}
+# First characters each alternative can start with; the fused pattern is guarded by their union so
+# the engine skips other positions without trying every branch.
+ALTERNATIVE_LEADS = {
+    "iso_date": r"\d",
+    "dmy_date": r"\d",
+    "long_date": r"\d",
+    "policy": "cr",
+    "meeting": "cwi",
+    "deadline_cue": "ds",
+}
+KIND_ALTERNATIVES = {
+    "date": ("iso_date", "dmy_date", "long_date"),
+    "due_date": ("iso_date", "dmy_date", "deadline_cue"),
+    "document_number": ("policy",),
+    "policy_id": ("policy",),
+    "meeting_reference": ("meeting",),
+}
+# Date formats rank ISO > d/m/Y > "d Month Y", the order the per-format scans used to be tried in,
+# so the chosen publication date (and with it the stored metadata hash) is unchanged.
+DATE_CONFIDENCE = {"iso_date": 0.95, "dmy_date": 0.85, "long_date": 0.8}
+DEADLINE_GAP_CHARS = 16
+DOCUMENT_NUMBER_RE = re.compile(r"\d{4}[-/]\d{1,3}")
+
+
+@dataclass(frozen=True)
+class Entity:
+    kind: str
+    text: str
+    value: Any
+    start: int
+    end: int
+    confidence: float
+
+
+def iter_entities(text: str, kinds: Iterable[str] | None = None) -> Iterator[Entity]:
+    # One scan over the text with a fused pattern for the requested kinds; entities come out in text
+    # order. Different kinds may overlap, so the scan resumes one character after each match start.
+    wanted = frozenset(kinds) if kinds is not None else KINDS
+    pattern, cue_pattern = _fused_patterns(wanted)
+    last_end: dict[str, int] = {}
+    cue_end = -DEADLINE_GAP_CHARS - 1
+    pos = 0
+    while True:
+        # Outside a deadline cue's window, dates only matter as publication dates; without the
+        # "date" kind the scan jumps straight to the next cue (or other wanted entity).
+        active = pattern if pos <= cue_end + DEADLINE_GAP_CHARS else cue_pattern
+        match = active.search(text, pos)
+        if match is None:
+            break
+        pos = match.start() + 1
+        group = match.lastgroup
+        if group is None:
+            continue
+        start, end = match.span(group)
+        # A later start inside an earlier match of the same alternative is a suffix of it
+        # (e.g. "2/03/2026" inside "12/03/2026"), not a new candidate.
+        if start < last_end.get(group, -1):
+            continue
+        last_end[group] = end
+        raw = match.group(group)
+
+        if group == "deadline_cue":
+            cue_end = end
+            continue
+        if group in DATE_CONFIDENCE:
+            value = parse_date(group, raw)
+            if value is None:
+                continue
+            confidence = DATE_CONFIDENCE[group]
+            if "date" in wanted and group in KIND_ALTERNATIVES["date"]:
+                yield Entity("date", raw, value, start, end, confidence)
+            if (
+                "due_date" in wanted
+                and group in KIND_ALTERNATIVES["due_date"]
+                and 0 <= start - cue_end <= DEADLINE_GAP_CHARS
+                and not any(char.isdigit() for char in text[cue_end:start])
+            ):
+                yield Entity("due_date", raw, value, start, end, confidence)
+        elif group == "policy":
+            prefix, number = match.group("policy_prefix", "policy_number")
+            numeric = DOCUMENT_NUMBER_RE.fullmatch(number) is not None
+            if "policy_id" in wanted:
+                yield Entity("policy_id", raw, raw, start, end, 0.9 if numeric else 0.7)
+            if "document_number" in wanted and numeric and prefix.lower() != "circular":
+                yield Entity("document_number", raw, number, start, end, 0.9)
+        elif group == "meeting":
+            yield Entity("meeting_reference", raw, raw, start, end, 0.8 if raw[-4:].isdigit() else 0.6)
+
+
+def extract_entities(text: str, kinds: Iterable[str] | None = None) -> list[Entity]:
+    return list(iter_entities(text, kinds))
+
+
+def best_entity(
+    entities: Iterable[Entity], kind: str, min_start: int = 0, good_enough: float | None = None
+) -> Entity | None:
+    # Highest confidence wins, the earliest on ties; with `good_enough` a lazy scan stops at the
+    # first candidate that reaches it.
+    best: Entity | None = None
+    for entity in entities:
+        if entity.kind != kind or entity.start < min_start:
+            continue
+        if best is None or entity.confidence > best.confidence:
+            best = entity
+            if good_enough is not None and best.confidence >= good_enough:
+                break
+    return best
+
+
+def first_entity(entities: Iterable[Entity], kind: str) -> Entity | None:
+    return next((entity for entity in entities if entity.kind == kind), None)
+
+
+def entity_value(entity: Entity | None) -> Any:
+    return entity.value if entity is not None else None
+
+
+def parse_date(group: str, raw: str) -> date | None:
+    try:
+        if group == "iso_date":
+            return date.fromisoformat(raw)
+        if group == "dmy_date":
+            day, month, year = raw.split("/")
+            return date(int(year), int(month), int(day))
+        day, month_name, year = raw.split()
+        return date(int(year), MONTHS[month_name.lower()], int(day))
+    except (ValueError, KeyError):
+        return None
+
+
+@lru_cache(maxsize=None)
+def _fused_patterns(kinds: frozenset[str]) -> tuple[re.Pattern[str], re.Pattern[str]]:
+    unknown = kinds - KINDS
+    if unknown:
+        raise ValueError(f"Unknown entity kinds: {sorted(unknown)}")
+    groups = tuple(dict.fromkeys(group for kind in sorted(kinds) for group in KIND_ALTERNATIVES[kind]))
+    needed = set(group for kind in kinds - {"due_date"} for group in KIND_ALTERNATIVES[kind])
+    if "due_date" in kinds:
+        needed.add("deadline_cue")
+    return _compile(groups), _compile(tuple(group for group in groups if group in needed))
+
+
+def _compile(groups: tuple[str, ...]) -> re.Pattern[str]:
+    leads = "".join(dict.fromkeys(ALTERNATIVE_LEADS[group] for group in groups))
+    return re.compile(f"(?=[{leads}])(?:{'|'.join(ALTERNATIVES[group] for group in groups)})", re.IGNORECASE)
@@ -0,0 +1,243 @@
+from __future__ import annotations
+
+import re
+from bisect import bisect_right
+from dataclasses import dataclass
+from html import unescape
+
+
+SKIP_ELEMENTS = frozenset({"script", "style", "nav", "header", "footer", "noscript", "template"})
+RAW_TEXT_ELEMENTS = frozenset({"script", "style"})
+BLOCK_ELEMENTS = frozenset(
+    {
+        "address", "article", "aside", "blockquote", "br", "dd", "div", "dl", "dt", "figcaption",
+        "figure", "form", "h1", "h2", "h3", "h4", "h5", "h6", "hr", "li", "main", "ol", "p", "pre",
+        "section", "table", "tbody", "tfoot", "thead", "tr", "ul",
+    }
+)
+TOKEN_RE = re.compile(
+    r"<(?:(?P<close>/)?(?P<name>[A-Za-z][A-Za-z0-9:-]*)(?P<attrs>[^>]*)>|!--.*?(?:-->|\Z)|[!?][^>]*>)",
+    re.DOTALL,
+)
+ANCHOR_TOKEN_RE = re.compile(
+    r"<(?:(?P<close>/)?(?P<name>a|script|style)(?=[\s/>])(?P<attrs>[^>]*)>|!--.*?(?:-->|\Z))",
+    re.IGNORECASE | re.DOTALL,
+)
+MARKUP_RE = re.compile(r"<[^>]*>")
+HREF_RE = re.compile(r"""\bhref\s*=\s*(?:"(?P<dq>[^"]*)"|'(?P<sq>[^']*)'|(?P<bare>[^\s>]+))""", re.IGNORECASE)
+TITLE_RE = re.compile(r"""\btitle\s*=\s*(?:"(?P<dq>[^"]*)"|'(?P<sq>[^']*)')""", re.IGNORECASE)
+CONTEXT_CHARS = 240
+_RAW_TEXT_END = {name: re.compile(rf"</{name}\s*>", re.IGNORECASE) for name in RAW_TEXT_ELEMENTS}
+
+
+def visible_text(html: str) -> str:
+    lines: list[str] = []
+    line: list[str] = []
+    skipping: list[str] = []
+    pos = 0
+
+    matches = TOKEN_RE.finditer(html)
+    while (match := next(matches, None)) is not None:
+        start = match.start()
+        if start > pos and not skipping:
+            line.append(html[pos:start])
+        pos = match.end()
+
+        close, name, attrs = match.group("close", "name", "attrs")
+        if name is None:
+            continue
+        name = name.lower()
+
+        if close:
+            if skipping:
+                if name in skipping:
+                    # Closing an outer skipped element also closes any unclosed ones inside it.
+                    del skipping[len(skipping) - 1 - skipping[::-1].index(name):]
+                elif name in {"body", "html"}:
+                    skipping.clear()
+            else:
+                _boundary(lines, line, name)
+            continue
+
+        if name in RAW_TEXT_ELEMENTS:
+            # Script/style bodies are never tokenized, so markup-like strings inside them cannot leak.
+            end = _RAW_TEXT_END[name].search(html, pos)
+            pos = end.end() if end else len(html)
+            matches = TOKEN_RE.finditer(html, pos)
+            continue
+        if skipping or name in SKIP_ELEMENTS:
+            if name in SKIP_ELEMENTS and not attrs.endswith("/"):
+                skipping.append(name)
+            continue
+        _boundary(lines, line, name)
+
+    if pos < len(html) and not skipping:
+        line.append(html[pos:])
+    _flush(lines, line)
+    return "\n".join(lines)
+
+
+def _boundary(lines: list[str], line: list[str], name: str) -> None:
+    if name in BLOCK_ELEMENTS:
+        _flush(lines, line)
+    else:
+        line.append(" ")
+
+
+def _flush(lines: list[str], line: list[str]) -> None:
+    if not line:
+        return
+    text = "".join(line)
+    line.clear()
+    if "&" in text:
+        text = unescape(text)
+    text = " ".join(text.split())
+    if text:
+        lines.append(text)
+
+
+@dataclass(frozen=True)
+class Anchor:
+    href: str
+    text: str
+    raw_start: int
+    raw_end: int
+    title_span: tuple[int, int] | None = None
+
+
+@dataclass
+class AnchorIndex:
+    text: str
+    anchors: list[Anchor]
+    segment_raw_starts: list[int]
+    segment_raw_ends: list[int]
+    segment_text_starts: list[int]
+    segment_text_ends: list[int]
+
+    def context(self, anchor: Anchor, chars: int = CONTEXT_CHARS) -> str:
+        # The window is measured in source characters around the anchor (as a raw-HTML slice would be)
+        # and mapped onto the cleaned page text through the segment offsets. A link's own title is left
+        # out: it describes that link's target, while sibling links (e.g. "PDF - 207 KB") rely on it.
+        lo = self._text_offset(anchor.raw_start - chars)
+        hi = self._text_offset(anchor.raw_end + chars)
+        if anchor.title_span is None:
+            return self.text[lo:hi].strip()
+        title_start, title_end = anchor.title_span
+        before = self.text[lo:title_start].strip()
+        after = self.text[title_end:hi].strip()
+        return f"{before} {after}".strip()
+
+    def _text_offset(self, raw_offset: int) -> int:
+        idx = bisect_right(self.segment_raw_ends, raw_offset)
+        if idx >= len(self.segment_raw_starts):
+            return len(self.text)
+        raw_start = self.segment_raw_starts[idx]
+        text_start = self.segment_text_starts[idx]
+        if raw_offset <= raw_start:
+            return text_start
+        # Segments include stripped markup, so positions inside one are interpolated.
+        text_len = self.segment_text_ends[idx] - text_start
+        return text_start + (raw_offset - raw_start) * text_len // (self.segment_raw_ends[idx] - raw_start)
+
+
+def index_anchors(html: str) -> AnchorIndex:
+    # One pass over the page builds the cleaned page text and an anchor table, so link text and
+    # context windows are slices of already-cleaned text instead of per-link regex cleaning. Only
+    # anchors, raw-text elements and comments are visited in Python; markup between them is
+    # stripped in bulk.
+    parts: list[str] = []
+    raw_starts: list[int] = []
+    raw_ends: list[int] = []
+    text_starts: list[int] = []
+    text_ends: list[int] = []
+    length = 0
+    anchors: list[Anchor] = []
+    open_href: str | None = None
+    open_part = 0
+    open_raw = 0
+    open_title: tuple[int, int] | None = None
+    pos = 0
+
+    def close_anchor(raw_end: int) -> None:
+        nonlocal open_href
+        if open_href is not None:
+            text = " ".join(parts[open_part + (open_title is not None) :])
+            anchors.append(Anchor(open_href, text, open_raw, raw_end, open_title))
+            open_href = None
+
+    def add_segment(segment: str, raw_start: int, raw_end: int) -> None:
+        nonlocal length
+        if length:
+            length += 1
+        raw_starts.append(raw_start)
+        raw_ends.append(raw_end)
+        text_starts.append(length)
+        parts.append(segment)
+        length += len(segment)
+        text_ends.append(length)
+
+    matches = ANCHOR_TOKEN_RE.finditer(html)
+    while True:
+        match = next(matches, None)
+        start = match.start() if match is not None else len(html)
+        if start > pos:
+            segment = _clean(MARKUP_RE.sub(" ", html[pos:start]))
+            if segment:
+                add_segment(segment, pos, start)
+        if match is None:
+            break
+        pos = match.end()
+
+        close, name, attrs = match.group("close", "name", "attrs")
+        if name is None:
+            continue
+        name = name.lower()
+        if close:
+            if name == "a":
+                close_anchor(pos)
+            continue
+        if name in RAW_TEXT_ELEMENTS:
+            end = _RAW_TEXT_END[name].search(html, pos)
+            pos = end.end() if end else len(html)
+            matches = ANCHOR_TOKEN_RE.finditer(html, pos)
+            continue
+        close_anchor(match.start())
+        value = _attribute(HREF_RE, attrs)
+        if value:
+            open_href = value
+            open_part = len(parts)
+            open_raw = match.start()
+            open_title = None
+            # Link titles often carry the full measure name when the visible text is just "Download".
+            title = TITLE_RE.search(attrs)
+            if title is not None:
+                title_text = _clean(title.group("dq") if title.group("dq") is not None else title.group("sq"))
+                if title_text:
+                    offset = match.start("attrs")
+                    add_segment(title_text, offset + title.start(), offset + title.end())
+                    open_title = (length - len(title_text), length)
+
+    close_anchor(len(html))
+    return AnchorIndex(
+        text=" ".join(parts),
+        anchors=anchors,
+        segment_raw_starts=raw_starts,
+        segment_raw_ends=raw_ends,
+        segment_text_starts=text_starts,
+        segment_text_ends=text_ends,
+    )
+
+
+def _attribute(pattern: re.Pattern[str], attrs: str) -> str | None:
+    match = pattern.search(attrs)
+    if match is None:
+        return None
+    groups = match.groupdict()
+    value = next((v for v in groups.values() if v is not None), "")
+    return unescape(value.strip())
+
+
+def _clean(value: str) -> str:
+    if "&" in value:
+        value = unescape(value)
+    return " ".join(value.split())
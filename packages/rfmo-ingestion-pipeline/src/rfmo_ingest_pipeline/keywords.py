@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+from typing import Iterable, Mapping
+
+
+class KeywordMatcher:
+    def __init__(self, rules: Mapping[str, Iterable[str]]) -> None:
+        compiled: list[tuple[str, tuple[str, ...]]] = []
+        for category, terms in rules.items():
+            unique = sorted({term.lower() for term in terms if term}, key=len)
+            # A term containing a shorter term of the same category can never change the result.
+            kept: list[str] = []
+            for term in unique:
+                if not any(shorter in term for shorter in kept):
+                    kept.append(term)
+            if not kept:
+                raise ValueError(f"keyword category {category!r} has no terms")
+            compiled.append((category, tuple(kept)))
+        self._rules = tuple(compiled)
+        self.category_names = frozenset(category for category, _ in compiled)
+
+    def categories(self, lowered: str, stop_on: Iterable[str] = ()) -> set[str]:
+        # Expects lowercased text. This is not a single pass over the text: each kept term is its own
+        # substring search (`in`), so the worst case (no match) costs one scan per term, i.e.
+        # O(len(text) * terms). Categories are checked in rule-table order and each stops at its first
+        # hit; a category in `stop_on` ends the scan as soon as it matches. A compiled alternation per
+        # table measured slower than these C substring searches on both link contexts and extracted texts.
+        found: set[str] = set()
+        for category, terms in self._rules:
+            for term in terms:
+                if term in lowered:
+                    found.add(category)
+                    break
+            else:
+                continue
+            if category in stop_on:
+                break
+        return found
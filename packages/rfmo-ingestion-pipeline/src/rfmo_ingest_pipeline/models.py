@@ -1,11 +1,16 @@
 from __future__ import annotations
 
+import hashlib
 from datetime import date, datetime, timezone
 from enum import Enum
-from typing import Any, Optional
+from io import BytesIO
+from typing import Any, BinaryIO, Optional
 from uuid import uuid4
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
+
+from rfmo_ingest_pipeline.buffer import DocumentBuffer
+from rfmo_ingest_pipeline.spool import SpooledBody
 
 
 class DocumentCategory(str, Enum):
@@ -43,17 +48,83 @@ class DocumentRef(BaseModel):
     meeting_reference: Optional[str] = None
     rfmo_region: Optional[str] = None
     language: Optional[str] = None
+    if_none_match: Optional[str] = None
+    if_modified_since: Optional[str] = None
     discovered_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
     metadata: dict[str, Any] = Field(default_factory=dict)
+    # Replayed from an unchanged index page rather than found by a fresh link scan.
+    from_cache: bool = Field(default=False, exclude=True)
+
+
+class IndexPageRecord(BaseModel):
+    adapter_name: str
+    category: DocumentCategory
+    index_url: str
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    content_hash: str
+    refs: list[DocumentRef] = Field(default_factory=list)
+    fetched_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+
+
+class RobotsEntry(BaseModel):
+    host: str
+    status_code: int
+    body: str = ""
+    fetched_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    expires_at: datetime
+
+
+class QuarantineRecord(BaseModel):
+    file_hash: str
+    source_url: str
+    reason: str
+    quarantined_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
 
 
 class RawDocument(BaseModel):
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
     source_url: str
     status_code: int
     headers: dict[str, str] = Field(default_factory=dict)
     content_type: Optional[str] = None
-    body: bytes
+    body: bytes = b""
+    spool: Optional[SpooledBody] = Field(default=None, exclude=True)
     fetched_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    _buffer: Optional[DocumentBuffer] = PrivateAttr(default=None)
+
+    @property
+    def body_size(self) -> int:
+        return self.spool.size if self.spool is not None else len(self.body)
+
+    def body_sha256(self) -> str:
+        if self.spool is not None:
+            return self.spool.sha256
+        return hashlib.sha256(self.body).hexdigest()
+
+    def read_body(self, limit: int = -1) -> bytes:
+        if self.spool is not None:
+            return self.spool.read_bytes(limit)
+        return self.body if limit < 0 else self.body[:limit]
+
+    def open_body(self) -> BinaryIO:
+        if self.spool is not None:
+            return self.spool.open()
+        return BytesIO(self.body)
+
+    @property
+    def buffer(self) -> DocumentBuffer:
+        if self._buffer is None:
+            self._buffer = DocumentBuffer(self)
+        return self._buffer
+
+    def release_body(self) -> None:
+        self._buffer = None
+        if self.spool is not None:
+            self.spool.close()
+            self.spool = None
+        self.body = b""
 
 
 class ParsedDocument(BaseModel):
@@ -66,6 +137,8 @@ class ParsedDocument(BaseModel):
     extracted_text: str = ""
     snapshot_html: Optional[str] = None
     parser_info: dict[str, Any] = Field(default_factory=dict)
+    parse_cpu_seconds: float = Field(default=0.0, exclude=True)
+    parse_cache_hit: bool = Field(default=False, exclude=True)
 
 
 class ChangeDecision(BaseModel):
@@ -105,6 +178,12 @@ class DocumentVersionRecord(BaseModel):
     created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
 
 
+class RetentionPolicy(BaseModel):
+    # Both rules apply; the latest version of a document is always kept.
+    keep_last: Optional[int] = Field(default=None, ge=1)
+    metadata_only_max_age_days: Optional[int] = Field(default=None, ge=0)
+
+
 class RunMetrics(BaseModel):
     started_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
     finished_at: Optional[datetime] = None
@@ -114,9 +193,18 @@ class RunMetrics(BaseModel):
     documents_fetched: int = 0
     documents_ingested: int = 0
     documents_skipped: int = 0
+    documents_not_modified: int = 0
+    documents_unchanged_unparsed: int = 0
+    documents_quarantined: int = 0
+    parse_cache_hits: int = 0
+    fetch_retries: int = 0
+    index_pages_unchanged: int = 0
+    index_refs_skipped: int = 0
     failures: int = 0
     parse_failures: int = 0
+    parse_cpu_seconds: dict[str, float] = Field(default_factory=dict)
     storage_bytes_written: int = 0
+    storage_physical_bytes_written: int = 0
 
 
 class SourceHealth(BaseModel):
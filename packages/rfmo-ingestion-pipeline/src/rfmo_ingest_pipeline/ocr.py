@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+import hashlib
+import shutil
+import subprocess
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from itertools import islice
+from pathlib import Path
+from typing import Any, Iterator, Protocol
+
+from rfmo_ingest_pipeline.models import RawDocument
+
+
+class OcrBackend(Protocol):
+    name: str
+
+    def available(self) -> bool:
+        ...
+
+    def ocr_page(self, pdf_path: str, page_number: int) -> str:
+        ...
+
+
+class OcrPageCache(Protocol):
+    def get_ocr_pages(self, backend: str, page_hashes: list[str]) -> dict[str, str]:
+        ...
+
+    def save_ocr_pages(self, backend: str, texts: dict[str, str]) -> None:
+        ...
+
+
+class TesseractBackend:
+    name = "tesseract"
+
+    def __init__(self, dpi: int = 300, language: str = "eng", timeout_seconds: float = 120.0) -> None:
+        self.dpi = dpi
+        self.language = language
+        self.timeout_seconds = timeout_seconds
+        self._available: bool | None = None
+
+    def available(self) -> bool:
+        # Probed once per backend instead of spawning `tesseract --version` for every scanned PDF.
+        if self._available is None:
+            self._available = shutil.which("tesseract") is not None and shutil.which("pdftoppm") is not None
+        return self._available
+
+    def ocr_page(self, pdf_path: str, page_number: int) -> str:
+        with tempfile.TemporaryDirectory(prefix="rfmo-ocr-") as tmp:
+            image_root = str(Path(tmp) / "page")
+            subprocess.run(
+                [
+                    "pdftoppm",
+                    "-f", str(page_number),
+                    "-l", str(page_number),
+                    "-r", str(self.dpi),
+                    "-png",
+                    "-singlefile",
+                    pdf_path,
+                    image_root,
+                ],
+                capture_output=True,
+                check=True,
+                timeout=self.timeout_seconds,
+            )
+            result = subprocess.run(
+                ["tesseract", f"{image_root}.png", "stdout", "-l", self.language],
+                capture_output=True,
+                check=True,
+                timeout=self.timeout_seconds,
+            )
+        return result.stdout.decode("utf-8", errors="replace")
+
+
+class PdfOcr:
+    def __init__(
+        self,
+        backend: OcrBackend,
+        cache: OcrPageCache | None = None,
+        max_workers: int = 2,
+        max_pages: int = 50,
+    ) -> None:
+        self.backend = backend
+        self.cache = cache
+        self.max_pages = max_pages
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="ocr")
+        self._lock = threading.Lock()
+        self._stats = {"pages_ocr": 0, "pages_cached": 0, "page_errors": 0}
+
+    def extract(self, raw: RawDocument) -> tuple[str, dict[str, Any]]:
+        if not self.backend.available():
+            return "", {"ocr_attempted": False, "ocr_used": False, "ocr_available": False}
+
+        with _pdf_path(raw) as path:
+            try:
+                page_hashes = page_content_hashes(path, self.max_pages)
+            except Exception as exc:  # noqa: BLE001
+                return "", {"ocr_attempted": True, "ocr_used": False, "ocr_error": str(exc)}
+            texts = self.cache.get_ocr_pages(self.backend.name, page_hashes) if self.cache is not None else {}
+            cached_pages = sum(1 for page_hash in page_hashes if page_hash in texts)
+            # A page hash repeated within the document (e.g. a blank separator page) is OCRed once.
+            pending = {page_hash: number for number, page_hash in enumerate(page_hashes, start=1) if page_hash not in texts}
+            futures = {
+                page_hash: self._pool.submit(self.backend.ocr_page, path, number) for page_hash, number in pending.items()
+            }
+            fresh: dict[str, str] = {}
+            errors = 0
+            for page_hash, future in futures.items():
+                try:
+                    fresh[page_hash] = " ".join(future.result().split())
+                except Exception:  # noqa: BLE001
+                    errors += 1
+        if fresh and self.cache is not None:
+            self.cache.save_ocr_pages(self.backend.name, fresh)
+        texts.update(fresh)
+
+        with self._lock:
+            self._stats["pages_ocr"] += len(fresh)
+            self._stats["pages_cached"] += cached_pages
+            self._stats["page_errors"] += errors
+        text = " ".join(texts[page_hash] for page_hash in page_hashes if texts.get(page_hash))
+        return text, {
+            "ocr_attempted": True,
+            "ocr_used": bool(text),
+            "ocr_backend": self.backend.name,
+            "ocr_pages": len(page_hashes),
+            "ocr_pages_cached": cached_pages,
+            "ocr_page_errors": errors,
+        }
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return dict(self._stats)
+
+    def close(self) -> None:
+        self._pool.shutdown(wait=True)
+
+
+def page_content_hashes(pdf_path: str, max_pages: int | None = None) -> list[str]:
+    # A page is identified by its content stream plus the streams it draws (the scanned image), so an
+    # unchanged page keeps its hash when other pages of the document change. Streams are hashed as
+    # stored: decoding them would inflate every full-resolution scan just to fingerprint it.
+    from pypdf import PdfReader
+
+    hashes: list[str] = []
+    for page in islice(PdfReader(pdf_path).pages, max_pages):
+        digest = hashlib.sha256()
+        contents = page.get("/Contents")
+        contents = contents.get_object() if contents is not None else []
+        for stream in contents if isinstance(contents, list) else [contents]:
+            digest.update(_stored_bytes(stream))
+        resources = page.get("/Resources")
+        xobjects = resources.get_object().get("/XObject") if resources is not None else None
+        if xobjects is not None:
+            xobjects = xobjects.get_object()
+            for name in sorted(xobjects):
+                digest.update(name.encode())
+                digest.update(_stored_bytes(xobjects[name]))
+        hashes.append(digest.hexdigest())
+    return hashes
+
+
+def _stored_bytes(stream: Any) -> bytes:
+    # pypdf keeps a stream's bytes exactly as read from the file (still compressed) in _data.
+    return stream.get_object()._data
+
+
+@contextmanager
+def _pdf_path(raw: RawDocument) -> Iterator[str]:
+    if raw.spool is not None and raw.spool.path:
+        yield raw.spool.path
+        return
+    with tempfile.NamedTemporaryFile(prefix="rfmo-ocr-", suffix=".pdf") as handle:
+        handle.write(raw.read_body())
+        handle.flush()
+        yield handle.name
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from typing import Any, BinaryIO, Iterator
+
+
+@dataclass(frozen=True)
+class PdfBudget:
+    max_pages: int | None = None
+    max_chars: int = 2_000_000
+    max_seconds: float | None = None
+
+
+@dataclass
+class PdfTextStats:
+    pages_total: int = 0
+    pages_extracted: int = 0
+    chars: int = 0
+    truncated_by: str | None = None
+
+    def parser_info(self) -> dict[str, Any]:
+        return {
+            "pages_total": self.pages_total,
+            "pages_extracted": self.pages_extracted,
+            "truncated": self.truncated_by is not None,
+            "truncated_by": self.truncated_by,
+        }
+
+
+def iter_pdf_text(
+    body: BinaryIO, budget: PdfBudget | None = None, stats: PdfTextStats | None = None
+) -> Iterator[str]:
+    # Yields whitespace-normalized page text one piece at a time; "".join() of the pieces is the
+    # document text (pages separated by one space), so nothing larger than a page is held here.
+    from pypdf import PdfReader
+
+    budget = budget or PdfBudget()
+    stats = stats if stats is not None else PdfTextStats()
+    deadline = time.monotonic() + budget.max_seconds if budget.max_seconds is not None else None
+
+    reader = PdfReader(body)
+    pages = reader.pages
+    stats.pages_total = len(pages)
+    for index, page in enumerate(pages):
+        if budget.max_pages is not None and index >= budget.max_pages:
+            stats.truncated_by = "max_pages"
+            return
+        # Checked between pages; a single slow page is not interrupted.
+        if deadline is not None and time.monotonic() >= deadline:
+            stats.truncated_by = "max_seconds"
+            return
+
+        text = " ".join((page.extract_text() or "").split())
+        stats.pages_extracted += 1
+        if not text:
+            continue
+        if stats.chars:
+            text = " " + text
+        remaining = budget.max_chars - stats.chars
+        if len(text) > remaining:
+            stats.truncated_by = "max_chars"
+            text = text[:remaining]
+        if text:
+            stats.chars += len(text)
+            yield text
+        if stats.truncated_by is not None:
+            return
@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import NamedTuple, Protocol
+
+from rfmo_ingest_pipeline.blobs import ArtifactReader
+from rfmo_ingest_pipeline.models import DocumentVersionRecord, RetentionPolicy
+from rfmo_ingest_pipeline.services import MetricsRegistry, delta_artifact_paths
+from rfmo_ingest_pipeline.store import SQLiteStore
+
+
+class RetentionStats(NamedTuple):
+    documents_scanned: int
+    versions_deleted: int
+    versions_rebased: int
+    bytes_reclaimed: int
+    bytes_rewritten: int
+    completed: bool
+
+
+class _DocumentOutcome(NamedTuple):
+    deleted: int
+    rebased: int
+    freed: int
+    rewritten: int
+
+
+class VersionStorage(Protocol):
+    def reader(self) -> ArtifactReader:
+        ...
+
+    def rebase_version(self, version: DocumentVersionRecord, previous: DocumentVersionRecord | None) -> int:
+        ...
+
+    def remove_version(self, version: DocumentVersionRecord) -> int:
+        ...
+
+    def reclaim(self) -> int:
+        ...
+
+
+def plan_retention(
+    versions: list[DocumentVersionRecord], policy: RetentionPolicy, now: datetime | None = None
+) -> list[DocumentVersionRecord]:
+    # Versions of one document the policy removes. A metadata-only version is one whose extracted text
+    # matches the version before it (header or markup churn); the latest version is always kept.
+    ordered = sorted(versions, key=lambda version: version.version_number)
+    if len(ordered) < 2:
+        return []
+    doomed: dict[int, DocumentVersionRecord] = {}
+    if policy.keep_last is not None:
+        doomed.update((version.version_number, version) for version in ordered[: -policy.keep_last])
+    if policy.metadata_only_max_age_days is not None:
+        cutoff = (now or datetime.now(timezone.utc)) - timedelta(days=policy.metadata_only_max_age_days)
+        for previous, version in zip(ordered, ordered[1:-1]):
+            if version.content_hash == previous.content_hash and version.created_at < cutoff:
+                doomed[version.version_number] = version
+    return [doomed[number] for number in sorted(doomed)]
+
+
+class RetentionJob:
+    # Applies a RetentionPolicy a batch of documents at a time (resuming from a cursor kept in the
+    # store), with documents processed in parallel. Per document: versions that keep a delta against a
+    # doomed version are rebased first, then the doomed rows are deleted in one transaction, then their
+    # artifacts. A crash between the last two steps leaves unreferenced files, never dangling rows.
+    def __init__(
+        self,
+        store: SQLiteStore,
+        storage: VersionStorage,
+        policy: RetentionPolicy,
+        workers: int = 4,
+        metrics: MetricsRegistry | None = None,
+        job: str = "default",
+    ) -> None:
+        self.store = store
+        self.storage = storage
+        self.policy = policy
+        self.workers = max(1, workers)
+        self.metrics = metrics
+        self.job = job
+
+    def run(self, max_documents: int | None = None, dry_run: bool = False, now: datetime | None = None) -> RetentionStats:
+        now = now or datetime.now(timezone.utc)
+        cursor = self.store.get_retention_cursor(self.job) or ""
+        document_ids = self.store.list_document_ids(after=cursor, limit=max_documents)
+        apply = self._plan_only if dry_run else self._apply
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            outcomes = list(pool.map(lambda document_id: apply(document_id, now), document_ids))
+
+        completed = max_documents is None or len(document_ids) < max_documents
+        freed = sum(outcome.freed for outcome in outcomes)
+        if not dry_run:
+            self.store.save_retention_cursor(self.job, "" if completed else document_ids[-1])
+            freed += self.storage.reclaim()
+        stats = RetentionStats(
+            documents_scanned=len(document_ids),
+            versions_deleted=sum(outcome.deleted for outcome in outcomes),
+            versions_rebased=sum(outcome.rebased for outcome in outcomes),
+            bytes_reclaimed=freed,
+            bytes_rewritten=sum(outcome.rewritten for outcome in outcomes),
+            completed=completed,
+        )
+        if self.metrics is not None and not dry_run:
+            self.metrics.add("rfmo_retention_versions_deleted_total", stats.versions_deleted)
+            self.metrics.add("rfmo_retention_bytes_reclaimed_total", stats.bytes_reclaimed)
+            self.metrics.add("rfmo_retention_bytes_rewritten_total", stats.bytes_rewritten)
+        return stats
+
+    def _plan_only(self, document_id: str, now: datetime) -> _DocumentOutcome:
+        doomed = plan_retention(self.store.list_document_versions(document_id), self.policy, now)
+        return _DocumentOutcome(len(doomed), 0, 0, 0)
+
+    def _apply(self, document_id: str, now: datetime) -> _DocumentOutcome:
+        versions = self.store.list_document_versions(document_id)
+        doomed = plan_retention(versions, self.policy, now)
+        if not doomed:
+            return _DocumentOutcome(0, 0, 0, 0)
+        doomed_numbers = {version.version_number for version in doomed}
+        doomed_dirs = {_version_dir(version) for version in doomed}
+
+        reader = self.storage.reader()
+        rebased = rewritten = 0
+        previous: DocumentVersionRecord | None = None
+        for version in versions:
+            if version.version_number in doomed_numbers:
+                continue
+            if any(_based_on(reader, path, doomed_dirs) for path in delta_artifact_paths(version)):
+                rewritten += self.storage.rebase_version(version, previous)
+                rebased += 1
+            previous = version
+
+        deleted = self.store.delete_versions(document_id, sorted(doomed_numbers))
+        freed = sum(self.storage.remove_version(version) for version in doomed)
+        return _DocumentOutcome(deleted, rebased, freed, rewritten)
+
+
+def _version_dir(version: DocumentVersionRecord) -> Path:
+    return Path(os.path.normpath(Path(version.metadata_path).parent))
+
+
+def _based_on(reader: ArtifactReader, path: Path, version_dirs: set[Path]) -> bool:
+    delta = reader.delta(path)
+    return delta is not None and delta.base_path(path).parent in version_dirs
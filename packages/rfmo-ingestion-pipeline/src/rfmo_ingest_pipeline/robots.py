@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from typing import TYPE_CHECKING, Iterable, Protocol
+from urllib.parse import urlparse
+from urllib.robotparser import RobotFileParser
+
+from rfmo_ingest_pipeline.models import RobotsEntry
+from rfmo_ingest_pipeline.transport import HttpTransport, TransportError
+
+if TYPE_CHECKING:
+    from rfmo_ingest_pipeline.connectors import HostRateLimiter
+
+
+MAX_AGE_RE = re.compile(r"(?:^|,)\s*(?:s-maxage|max-age)\s*=\s*(\d+)", re.IGNORECASE)
+
+
+class RobotsEntryStore(Protocol):
+    def get_robots_entry(self, host: str) -> RobotsEntry | None:
+        ...
+
+    def save_robots_entry(self, entry: RobotsEntry) -> None:
+        ...
+
+
+class RobotsCache:
+    def __init__(
+        self,
+        transport: HttpTransport | None = None,
+        user_agent: str = "ocean-watch-rfmo-ingestion/1.0",
+        rate_limiter: HostRateLimiter | None = None,
+        store: RobotsEntryStore | None = None,
+        default_ttl_seconds: int = 24 * 3600,
+        min_ttl_seconds: int = 300,
+        max_ttl_seconds: int = 24 * 3600,
+        error_ttl_seconds: int = 600,
+        timeout_seconds: float = 30.0,
+    ) -> None:
+        self.transport = transport or HttpTransport(timeout_seconds=timeout_seconds)
+        self.user_agent = user_agent
+        self.rate_limiter = rate_limiter
+        self.store = store
+        self.default_ttl_seconds = default_ttl_seconds
+        self.min_ttl_seconds = min_ttl_seconds
+        self.max_ttl_seconds = max_ttl_seconds
+        self.error_ttl_seconds = error_ttl_seconds
+        self.timeout_seconds = timeout_seconds
+        self._lock = threading.Lock()
+        self._host_locks: dict[str, threading.Lock] = {}
+        self._parsers: dict[str, tuple[RobotsEntry, RobotFileParser]] = {}
+        self._stats = {"hits": 0, "misses": 0, "fetch_errors": 0}
+
+    def bind_store(self, store: RobotsEntryStore | None) -> None:
+        self.store = store
+
+    def can_fetch(self, url: str, user_agent: str | None = None) -> bool:
+        parser = self._parser_for(self._host_of(url))
+        return parser.can_fetch(user_agent or self.user_agent, url)
+
+    def prefetch(self, urls: Iterable[str], max_workers: int = 8) -> None:
+        hosts = sorted({self._host_of(url) for url in urls})
+        if not hosts:
+            return
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(hosts)), thread_name_prefix="rfmo-robots") as pool:
+            list(pool.map(self._parser_for, hosts))
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return dict(self._stats)
+
+    def _parser_for(self, host: str) -> RobotFileParser:
+        now = datetime.now(timezone.utc)
+        with self._lock:
+            cached = self._parsers.get(host)
+            if cached is not None and cached[0].expires_at > now:
+                self._stats["hits"] += 1
+                return cached[1]
+            host_lock = self._host_locks.setdefault(host, threading.Lock())
+
+        with host_lock:
+            with self._lock:
+                cached = self._parsers.get(host)
+            if cached is not None and cached[0].expires_at > now:
+                self._bump("hits")
+                return cached[1]
+
+            entry = self.store.get_robots_entry(host) if self.store is not None else None
+            if entry is not None and entry.expires_at > now:
+                self._bump("hits")
+            else:
+                self._bump("misses")
+                entry = self._fetch_entry(host)
+                if self.store is not None:
+                    self.store.save_robots_entry(entry)
+
+            parser = self._build_parser(entry)
+            with self._lock:
+                self._parsers[host] = (entry, parser)
+            return parser
+
+    def _fetch_entry(self, host: str) -> RobotsEntry:
+        robots_url = f"{host}/robots.txt"
+        now = datetime.now(timezone.utc)
+        if self.rate_limiter is not None:
+            self.rate_limiter.wait(robots_url)
+        try:
+            resp = self.transport.request(
+                robots_url,
+                headers={"User-Agent": self.user_agent},
+                timeout=self.timeout_seconds,
+            )
+        except TransportError:
+            self._bump("fetch_errors")
+            return RobotsEntry(
+                host=host,
+                status_code=0,
+                fetched_at=now,
+                expires_at=now + timedelta(seconds=self.error_ttl_seconds),
+            )
+
+        if resp.status >= 500:
+            self._bump("fetch_errors")
+            ttl = self.error_ttl_seconds
+        else:
+            ttl = self._ttl_from_headers(resp.headers, now)
+        return RobotsEntry(
+            host=host,
+            status_code=resp.status,
+            body=resp.body.decode("utf-8", errors="replace") if resp.status < 400 else "",
+            fetched_at=now,
+            expires_at=now + timedelta(seconds=ttl),
+        )
+
+    def _ttl_from_headers(self, headers: dict[str, str], now: datetime) -> int:
+        lowered = {k.lower(): v for k, v in headers.items()}
+        cache_control = lowered.get("cache-control", "")
+        ttl: float = self.default_ttl_seconds
+        match = MAX_AGE_RE.search(cache_control)
+        if "no-store" in cache_control.lower() or "no-cache" in cache_control.lower():
+            ttl = 0
+        elif match:
+            ttl = int(match.group(1))
+        elif lowered.get("expires"):
+            try:
+                ttl = (parsedate_to_datetime(lowered["expires"]) - now).total_seconds()
+            except (TypeError, ValueError):
+                ttl = self.default_ttl_seconds
+        return int(min(self.max_ttl_seconds, max(self.min_ttl_seconds, ttl)))
+
+    def _build_parser(self, entry: RobotsEntry) -> RobotFileParser:
+        parser = RobotFileParser(f"{entry.host}/robots.txt")
+        if entry.status_code in (401, 403):
+            parser.disallow_all = True
+        elif 400 <= entry.status_code < 500:
+            parser.allow_all = True
+        elif 200 <= entry.status_code < 400:
+            parser.parse(entry.body.splitlines())
+        # Unreachable hosts and 5xx responses stay unparsed, which RobotFileParser treats as disallow-all
+        # until the short error TTL expires and the file is fetched again.
+        return parser
+
+    def _bump(self, key: str) -> None:
+        with self._lock:
+            self._stats[key] += 1
+
+    def _host_of(self, url: str) -> str:
+        parsed = urlparse(url)
+        return f"{parsed.scheme}://{parsed.netloc}".lower()
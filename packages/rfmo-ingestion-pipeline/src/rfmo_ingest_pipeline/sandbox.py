@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import multiprocessing
+import queue
+import threading
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from multiprocessing.connection import Connection
+from typing import Any, Callable
+
+
+class ParseFailure(RuntimeError):
+    pass
+
+
+class ParseTimeoutError(ParseFailure):
+    pass
+
+
+class ParseWorkerCrashed(ParseFailure):
+    pass
+
+
+class _Worker:
+    def __init__(self, context: Any, memory_limit_bytes: int | None) -> None:
+        self.conn, child_conn = context.Pipe()
+        self.process = context.Process(target=_worker_main, args=(child_conn, memory_limit_bytes), daemon=True)
+        self.process.start()
+        child_conn.close()
+
+    def kill(self) -> None:
+        if self.process.is_alive():
+            self.process.kill()
+        self.process.join()
+        self.conn.close()
+
+    def stop(self) -> None:
+        try:
+            self.conn.send(None)
+        except (OSError, ValueError):
+            pass
+        self.process.join(timeout=5)
+        if self.process.is_alive():
+            self.process.kill()
+            self.process.join()
+        self.conn.close()
+
+
+class ParseSandbox(Executor):
+    def __init__(
+        self,
+        max_workers: int = 1,
+        timeout_seconds: float = 120.0,
+        memory_limit_mb: int | None = 1024,
+    ) -> None:
+        self.max_workers = max_workers
+        self.timeout_seconds = timeout_seconds
+        self.memory_limit_bytes = memory_limit_mb * 1024 * 1024 if memory_limit_mb else None
+        # spawn keeps the worker processes free of the engine's threads, locks and SQLite handle.
+        self._context = multiprocessing.get_context("spawn")
+        self._supervisors = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="parse-sandbox")
+        self._idle: queue.SimpleQueue[_Worker] = queue.SimpleQueue()
+        self._workers: set[_Worker] = set()
+        self._lock = threading.Lock()
+        self._stats = {"tasks": 0, "timeouts": 0, "crashes": 0, "restarts": 0}
+
+    def submit(self, fn: Callable[..., Any], /, *args: Any, **kwargs: Any) -> Future:
+        return self._supervisors.submit(self._run, fn, args, kwargs)
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+        self._supervisors.shutdown(wait=wait, cancel_futures=cancel_futures)
+        with self._lock:
+            workers = list(self._workers)
+            self._workers.clear()
+        for worker in workers:
+            worker.stop()
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return dict(self._stats)
+
+    def _run(self, fn: Callable[..., Any], args: tuple[Any, ...], kwargs: dict[str, Any]) -> Any:
+        worker = self._acquire()
+        with self._lock:
+            self._stats["tasks"] += 1
+        try:
+            worker.conn.send((fn, args, kwargs))
+            # poll() also returns when the worker dies, in which case recv() raises EOFError.
+            if not worker.conn.poll(self.timeout_seconds):
+                self._discard(worker, "timeouts")
+                raise ParseTimeoutError(f"Parser exceeded {self.timeout_seconds:g}s and was killed")
+            try:
+                ok, value = worker.conn.recv()
+            except (EOFError, OSError):
+                self._discard(worker, "crashes")
+                raise ParseWorkerCrashed(f"Parser process died (exit code {worker.process.exitcode})") from None
+        except ParseFailure:
+            raise
+        except BaseException:
+            self._discard(worker, None)
+            raise
+        self._idle.put(worker)
+        if not ok:
+            raise value
+        return value
+
+    def _acquire(self) -> _Worker:
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        worker = _Worker(self._context, self.memory_limit_bytes)
+        with self._lock:
+            self._workers.add(worker)
+        return worker
+
+    def _discard(self, worker: _Worker, reason: str | None) -> None:
+        worker.kill()
+        with self._lock:
+            self._workers.discard(worker)
+            if reason is not None:
+                self._stats[reason] += 1
+                self._stats["restarts"] += 1
+
+
+def _worker_main(conn: Connection, memory_limit_bytes: int | None) -> None:
+    if memory_limit_bytes:
+        _limit_memory(memory_limit_bytes)
+    while True:
+        try:
+            task = conn.recv()
+        except (EOFError, OSError):
+            return
+        if task is None:
+            return
+        fn, args, kwargs = task
+        try:
+            result = (True, fn(*args, **kwargs))
+        except MemoryError:
+            # Address-space limit hit: exit so the supervisor records a crash and starts a fresh worker.
+            raise SystemExit(1) from None
+        except Exception as exc:  # noqa: BLE001
+            result = (False, RuntimeError(f"{type(exc).__name__}: {exc}"))
+        conn.send(result)
+
+
+def _limit_memory(limit_bytes: int) -> None:
+    try:
+        import resource
+    except ImportError:
+        return
+    try:
+        _, hard = resource.getrlimit(resource.RLIMIT_AS)
+        if hard != resource.RLIM_INFINITY:
+            limit_bytes = min(limit_bytes, hard)
+        resource.setrlimit(resource.RLIMIT_AS, (limit_bytes, hard))
+    except (ValueError, OSError):
+        pass
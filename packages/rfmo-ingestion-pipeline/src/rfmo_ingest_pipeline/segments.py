@@ -0,0 +1,528 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, BinaryIO, Callable, Iterable, NamedTuple
+
+from rfmo_ingest_pipeline.blobs import ArtifactReader, write_artifact
+from rfmo_ingest_pipeline.compression import decompressed_stream, open_compressed_writer, resolve_compression
+from rfmo_ingest_pipeline.deltas import DELTA_SUFFIX, KEYFRAME_INTERVAL
+from rfmo_ingest_pipeline.models import DocumentRecord, DocumentVersionRecord, ParsedDocument, RawDocument
+from rfmo_ingest_pipeline.services import (
+    StoredArtifacts,
+    delta_artifact_paths,
+    encoded_chunks,
+    previous_artifact_paths,
+    raw_extension,
+    sha256_hex,
+    version_delta,
+)
+
+
+SEGMENT_DIR = "segments"
+INDEX_NAME = "index.db"
+
+
+class PackedBlob(NamedTuple):
+    digest: str
+    segment: int
+    offset: int
+    length: int
+    size: int
+    compression: str | None
+
+
+class CompactionStats(NamedTuple):
+    segments_compacted: int
+    blobs_moved: int
+    bytes_reclaimed: int
+
+
+class SegmentIndex:
+    # Sidecar SQLite index of a segment directory: which pack, offset and length hold each blob
+    # (keyed by the sha256 of its uncompressed content), and which blob each logical artifact path
+    # of each version points to. Also an ArtifactLocator, so ArtifactReader resolves packed paths.
+    def __init__(self, storage_root: str | Path) -> None:
+        self.storage_root = Path(storage_root)
+        self.segment_dir = self.storage_root / SEGMENT_DIR
+        self.segment_dir.mkdir(parents=True, exist_ok=True)
+        self._root = self.storage_root.resolve()
+        self._lock = threading.Lock()
+        # Held across a row lookup and the open of its pack, and by compaction across repointing rows
+        # and unlinking the old pack, so a reader never opens a pack that was deleted under it. A pack
+        # already opened stays readable after the unlink.
+        self.open_lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.segment_dir / INDEX_NAME), check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._init_schema()
+
+    def _init_schema(self) -> None:
+        with self._lock:
+            self._conn.executescript(
+                """
+                PRAGMA journal_mode=WAL;
+
+                CREATE TABLE IF NOT EXISTS segment_blobs (
+                    digest TEXT PRIMARY KEY,
+                    segment INTEGER NOT NULL,
+                    offset INTEGER NOT NULL,
+                    length INTEGER NOT NULL,
+                    size INTEGER NOT NULL,
+                    compression TEXT
+                );
+
+                CREATE TABLE IF NOT EXISTS segment_entries (
+                    path TEXT PRIMARY KEY,
+                    document_id TEXT NOT NULL,
+                    version_number INTEGER NOT NULL,
+                    name TEXT NOT NULL,
+                    digest TEXT NOT NULL
+                );
+
+                CREATE INDEX IF NOT EXISTS idx_segment_blobs_segment ON segment_blobs(segment);
+                CREATE INDEX IF NOT EXISTS idx_segment_entries_version ON segment_entries(document_id, version_number);
+                CREATE INDEX IF NOT EXISTS idx_segment_entries_digest ON segment_entries(digest);
+                CREATE INDEX IF NOT EXISTS idx_segment_entries_name ON segment_entries(name);
+                """
+            )
+            self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def segment_path(self, segment: int) -> Path:
+        return self.segment_dir / f"segment-{segment:06d}.pack"
+
+    def relative(self, path: str | Path) -> str | None:
+        try:
+            return Path(path).resolve().relative_to(self._root).as_posix()
+        except ValueError:
+            return None
+
+    def get_blob(self, digest: str) -> sqlite3.Row | None:
+        with self._lock:
+            return self._conn.execute("SELECT * FROM segment_blobs WHERE digest = ?", (digest,)).fetchone()
+
+    def get_entry(self, path: str | Path) -> sqlite3.Row | None:
+        rel = self.relative(path)
+        if rel is None:
+            return None
+        with self._lock:
+            return self._conn.execute(
+                """
+                SELECT e.path, e.name, b.*
+                FROM segment_entries e JOIN segment_blobs b ON b.digest = e.digest
+                WHERE e.path = ?
+                """,
+                (rel,),
+            ).fetchone()
+
+    def version_entries(self, document_id: str, version_number: int) -> list[sqlite3.Row]:
+        with self._lock:
+            return self._conn.execute(
+                """
+                SELECT e.path, e.name, b.*
+                FROM segment_entries e JOIN segment_blobs b ON b.digest = e.digest
+                WHERE e.document_id = ? AND e.version_number = ?
+                ORDER BY e.name
+                """,
+                (document_id, version_number),
+            ).fetchall()
+
+    def all_entries(self) -> list[sqlite3.Row]:
+        with self._lock:
+            return self._conn.execute(
+                "SELECT e.path, e.name, b.* FROM segment_entries e JOIN segment_blobs b ON b.digest = e.digest ORDER BY e.path"
+            ).fetchall()
+
+    def save(self, blobs: Iterable[PackedBlob], entries: Iterable[tuple[str, str, int, str, str]]) -> None:
+        with self._lock:
+            self._conn.executemany(
+                """
+                INSERT INTO segment_blobs (digest, segment, offset, length, size, compression)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT(digest) DO UPDATE SET
+                    segment = excluded.segment, offset = excluded.offset, length = excluded.length,
+                    size = excluded.size, compression = excluded.compression
+                """,
+                list(blobs),
+            )
+            self._conn.executemany(
+                """
+                INSERT INTO segment_entries (path, document_id, version_number, name, digest)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(path) DO UPDATE SET digest = excluded.digest
+                """,
+                list(entries),
+            )
+            self._conn.commit()
+
+    def delete_version(self, document_id: str, version_number: int) -> int:
+        with self._lock:
+            cur = self._conn.execute(
+                "DELETE FROM segment_entries WHERE document_id = ? AND version_number = ?", (document_id, version_number)
+            )
+            self._conn.commit()
+            return cur.rowcount
+
+    def delete_entries(self, paths: Iterable[Path]) -> int:
+        relative = [(rel,) for rel in (self.relative(path) for path in paths) if rel is not None]
+        with self._lock:
+            cur = self._conn.executemany("DELETE FROM segment_entries WHERE path = ?", relative)
+            self._conn.commit()
+            return cur.rowcount
+
+    def drop_unreferenced_blobs(self) -> int:
+        with self._lock:
+            cur = self._conn.execute(
+                "DELETE FROM segment_blobs WHERE digest NOT IN (SELECT DISTINCT digest FROM segment_entries)"
+            )
+            self._conn.commit()
+            return cur.rowcount
+
+    def segment_usage(self) -> dict[int, int]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT segment, SUM(length) AS live FROM segment_blobs GROUP BY segment"
+            ).fetchall()
+        return {int(row["segment"]): int(row["live"]) for row in rows}
+
+    def segment_blobs(self, segment: int) -> list[sqlite3.Row]:
+        with self._lock:
+            return self._conn.execute(
+                "SELECT * FROM segment_blobs WHERE segment = ? ORDER BY offset", (segment,)
+            ).fetchall()
+
+    def open_blob(self, row: sqlite3.Row) -> BinaryIO:
+        handle = self.segment_path(int(row["segment"])).open("rb")
+        handle.seek(int(row["offset"]))
+        return decompressed_stream(_Slice(handle, int(row["length"])), row["compression"])  # type: ignore[arg-type]
+
+    def open(self, path: Path) -> BinaryIO | None:
+        with self.open_lock:
+            row = self.get_entry(path)
+            return self.open_blob(row) if row is not None else None
+
+    def contains(self, path: Path) -> bool:
+        return self.get_entry(path) is not None
+
+    def find(self, name: str) -> list[Path]:
+        with self._lock:
+            rows = self._conn.execute("SELECT path FROM segment_entries WHERE name = ?", (name,)).fetchall()
+        return [self.storage_root / row["path"] for row in rows]
+
+
+class SegmentStorage:
+    # Drop-in alternative to ArtifactStorage: every artifact of every version is appended to large
+    # append-only pack files instead of a directory of small files. Recorded paths keep the directory
+    # layout ({rfmo}/{year}/{document_id}/v{n}/{name}) as logical names resolved through the index.
+    def __init__(
+        self,
+        root_dir: str = "./rfmo",
+        compression: str | None = None,
+        max_segment_bytes: int = 256 * 1024 * 1024,
+        keyframe_interval: int = KEYFRAME_INTERVAL,
+    ) -> None:
+        self.root = Path(root_dir)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.compression = resolve_compression(compression)
+        self.max_segment_bytes = max_segment_bytes
+        self.keyframe_interval = keyframe_interval
+        self.index = SegmentIndex(self.root)
+        self._lock = threading.Lock()
+        self._active: BinaryIO | None = None
+        self._active_segment = self._last_segment()
+
+    def persist(
+        self,
+        document: DocumentRecord,
+        version_number: int,
+        raw: RawDocument,
+        parsed: ParsedDocument,
+        metadata: dict[str, Any],
+        previous: DocumentVersionRecord | None = None,
+    ) -> StoredArtifacts:
+        year = (parsed.publication_date.year if parsed.publication_date else datetime.now().year)
+        version_root = Path(document.rfmo.lower()) / str(year) / document.id / f"v{version_number}"
+        raw_name = f"raw{raw_extension(raw)}"
+        extracted_text = parsed.extracted_text or ""
+        snapshot_html = parsed.snapshot_html or ""
+
+        contents: list[tuple[str, Iterable[bytes | memoryview], str | None, int, Callable[[], bytes]]] = [
+            (
+                raw_name,
+                raw.spool.iter_chunks() if raw.spool is not None else [memoryview(raw.body)],
+                raw.body_sha256(),
+                raw.body_size,
+                raw.read_body,
+            ),
+            (
+                "extracted.txt",
+                encoded_chunks(extracted_text),
+                sha256_hex(extracted_text),
+                len(extracted_text),
+                lambda: extracted_text.encode("utf-8"),
+            ),
+        ]
+        if snapshot_html:
+            contents.append(
+                (
+                    "snapshot.html",
+                    encoded_chunks(snapshot_html),
+                    sha256_hex(snapshot_html),
+                    len(snapshot_html),
+                    lambda: snapshot_html.encode("utf-8"),
+                )
+            )
+        reader = self.reader()
+        previous_paths = previous_artifact_paths(previous)
+        # (name, chunks, known digest, logical size when the chunks are a delta rather than the content)
+        artifacts: list[tuple[str, Iterable[bytes | memoryview], str | None, int | None]] = []
+        for name, chunks, digest, size, content in contents:
+            delta = version_delta(reader, self.root / version_root / name, previous_paths, size, content, self.keyframe_interval)
+            if delta is not None:
+                artifacts.append((f"{name}{DELTA_SUFFIX}", [delta.to_bytes()], None, 0 if delta.depth == 0 else delta.size))
+            if delta is None or delta.depth == 0:
+                artifacts.append((name, chunks, digest, None))
+        artifacts.append(("metadata.json", [json.dumps(metadata, ensure_ascii=True, indent=2).encode("utf-8")], None, None))
+
+        logical, physical = self._pack(version_root, document.id, version_number, artifacts)
+
+        paths = {name: str(self.root / version_root / name) for name, *_ in contents}
+        return StoredArtifacts(
+            raw_path=paths[raw_name],
+            extracted_path=paths["extracted.txt"],
+            snapshot_path=paths.get("snapshot.html"),
+            metadata_path=str(self.root / version_root / "metadata.json"),
+            logical_bytes=logical,
+            physical_bytes=physical,
+        )
+
+    def rebase_version(self, version: DocumentVersionRecord, previous: DocumentVersionRecord | None) -> int:
+        # Packs the version's delta-encoded artifacts whole again, with their change record re-taken
+        # against `previous`, so the version stays readable once its old delta bases are removed.
+        reader = self.reader()
+        previous_paths = previous_artifact_paths(previous)
+        artifacts: list[tuple[str, Iterable[bytes | memoryview], str | None, int | None]] = []
+        stale: list[Path] = []
+        for path in delta_artifact_paths(version):
+            if reader.delta(path) is None:
+                continue
+            content = reader.read_bytes(path)
+            delta = version_delta(reader, path, previous_paths, len(content), lambda: content, keyframe_interval=1)
+            if delta is None:
+                stale.append(path.with_name(f"{path.name}{DELTA_SUFFIX}"))
+            else:
+                artifacts.append((f"{path.name}{DELTA_SUFFIX}", [delta.to_bytes()], None, 0))
+            artifacts.append((path.name, [content], None, None))
+        if not artifacts:
+            return 0
+        version_root = Path(self.index.relative(Path(version.metadata_path).parent) or "")
+        _, physical = self._pack(version_root, version.document_id, version.version_number, artifacts)
+        self.index.delete_entries(stale)
+        return physical
+
+    def remove_version(self, version: DocumentVersionRecord) -> int:
+        # Only drops the index entries; packed bytes are freed by reclaim() (compact()).
+        self.index.delete_version(version.document_id, version.version_number)
+        return 0
+
+    def reclaim(self) -> int:
+        return self.compact().bytes_reclaimed
+
+    def open_version_artifact(self, document_id: str, version_number: int, name: str) -> BinaryIO:
+        with self.index.open_lock:
+            for row in self.index.version_entries(document_id, version_number):
+                if row["name"] == name:
+                    return self.index.open_blob(row)
+        raise FileNotFoundError(f"{document_id} v{version_number} {name}")
+
+    def version_artifacts(self, document_id: str, version_number: int) -> list[str]:
+        return [row["name"] for row in self.index.version_entries(document_id, version_number)]
+
+    def compact(self, min_live_ratio: float = 0.5) -> CompactionStats:
+        # Sealed segments whose live share dropped below min_live_ratio have their live blobs copied
+        # (still encoded) to the active segment; the old pack is deleted once the index points away from it.
+        with self._lock:
+            self.index.drop_unreferenced_blobs()
+            usage = self.index.segment_usage()
+            compacted = moved = reclaimed = 0
+            for segment in self._segments():
+                if segment == self._active_segment:
+                    continue
+                path = self.index.segment_path(segment)
+                size = path.stat().st_size
+                live = usage.get(segment, 0)
+                if size and live / size >= min_live_ratio:
+                    continue
+                rows = self.index.segment_blobs(segment)
+                relocated = []
+                with path.open("rb") as source:
+                    for row in rows:
+                        source.seek(int(row["offset"]))
+                        segment_no, offset = self._append_raw(source, int(row["length"]))
+                        relocated.append(
+                            PackedBlob(row["digest"], segment_no, offset, int(row["length"]), int(row["size"]), row["compression"])
+                        )
+                self._sync()
+                with self.index.open_lock:
+                    self.index.save(relocated, [])
+                    path.unlink()
+                compacted += 1
+                moved += len(rows)
+                reclaimed += size - live
+            return CompactionStats(compacted, moved, reclaimed)
+
+    def export(self, target_root: str | Path, compression: str | None = None) -> int:
+        # Writes every packed artifact back to the directory layout (plain or compressed files).
+        target = Path(target_root)
+        count = 0
+        for row in self.index.all_entries():
+            handle = self.index.open(self.root / row["path"])
+            if handle is None:
+                continue
+            path = target / row["path"]
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with handle:
+                write_artifact(path, iter(lambda: handle.read(1024 * 1024), b""), resolve_compression(compression))
+            count += 1
+        return count
+
+    def reader(self) -> ArtifactReader:
+        return ArtifactReader(locators=[self.index])
+
+    def close(self) -> None:
+        with self._lock:
+            if self._active is not None:
+                self._active.close()
+                self._active = None
+        self.index.close()
+
+    def _pack(
+        self,
+        version_root: Path,
+        document_id: str,
+        version_number: int,
+        artifacts: list[tuple[str, Iterable[bytes | memoryview], str | None, int | None]],
+    ) -> tuple[int, int]:
+        logical = physical = 0
+        packed: dict[str, PackedBlob] = {}
+        entries: list[tuple[str, str, int, str, str]] = []
+        with self._lock:
+            for name, chunks, digest, logical_size in artifacts:
+                if digest is None:
+                    # Small in-memory artifacts (deltas, metadata) are hashed before anything is written,
+                    # so a duplicate never reaches a segment.
+                    chunks = list(chunks)
+                    digest = _digest(chunks)
+                if digest in packed:
+                    size = packed[digest].size
+                elif (existing := self.index.get_blob(digest)) is not None:
+                    size = int(existing["size"])
+                else:
+                    blob = self._append(chunks, digest)
+                    packed[digest] = blob
+                    physical += blob.length
+                    size = blob.size
+                logical += size if logical_size is None else logical_size
+                entries.append(((version_root / name).as_posix(), document_id, version_number, name, digest))
+            self._sync()
+            self.index.save(packed.values(), entries)
+        return logical, physical
+
+    def _segments(self) -> list[int]:
+        return sorted(int(path.stem.split("-")[1]) for path in self.index.segment_dir.glob("segment-*.pack"))
+
+    def _last_segment(self) -> int:
+        segments = self._segments()
+        return segments[-1] if segments else 1
+
+    def _handle(self) -> BinaryIO:
+        if self._active is not None and self._active.tell() >= self.max_segment_bytes:
+            # Rows the caller is about to commit may point into the outgoing pack, and _sync() only covers the active one.
+            self._sync()
+            self._active.close()
+            self._active = None
+            self._active_segment += 1
+        if self._active is None:
+            self._active = self.index.segment_path(self._active_segment).open("ab")
+            if self._active.tell() >= self.max_segment_bytes:
+                self._active.close()
+                self._active_segment += 1
+                self._active = self.index.segment_path(self._active_segment).open("ab")
+        return self._active
+
+    def _append(self, chunks: Iterable[bytes | memoryview], digest: str) -> PackedBlob:
+        handle = self._handle()
+        offset = handle.tell()
+        size = 0
+        with open_compressed_writer(handle, self.compression) as writer:
+            for chunk in chunks:
+                writer.write(chunk)
+                size += len(chunk)
+        handle.flush()
+        return PackedBlob(digest, self._active_segment, offset, handle.tell() - offset, size, self.compression)
+
+    def _append_raw(self, source: BinaryIO, length: int) -> tuple[int, int]:
+        handle = self._handle()
+        offset = handle.tell()
+        remaining = length
+        while remaining:
+            chunk = source.read(min(remaining, 1024 * 1024))
+            if not chunk:
+                raise OSError("segment ended before the indexed blob did")
+            handle.write(chunk)
+            remaining -= len(chunk)
+        return self._active_segment, offset
+
+    def _sync(self) -> None:
+        # Pack bytes reach disk before the index rows that point at them are committed.
+        if self._active is not None:
+            self._active.flush()
+            os.fsync(self._active.fileno())
+
+
+def segment_reader(storage_root: str | Path) -> ArtifactReader:
+    # A reader for whatever is under storage_root: directory artifacts, plus packed ones when a
+    # segment index exists there.
+    if (Path(storage_root) / SEGMENT_DIR / INDEX_NAME).exists():
+        return ArtifactReader(locators=[SegmentIndex(storage_root)])
+    return ArtifactReader()
+
+
+def _digest(chunks: list[bytes | memoryview]) -> str:
+    hasher = hashlib.sha256()
+    for chunk in chunks:
+        hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+class _Slice:
+    def __init__(self, handle: BinaryIO, length: int) -> None:
+        self._handle = handle
+        self._remaining = length
+
+    def read(self, size: int = -1) -> bytes:
+        if size < 0 or size > self._remaining:
+            size = self._remaining
+        data = self._handle.read(size)
+        self._remaining -= len(data)
+        return data
+
+    def readable(self) -> bool:
+        return True
+
+    def close(self) -> None:
+        self._handle.close()
+
+    def __enter__(self) -> _Slice:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
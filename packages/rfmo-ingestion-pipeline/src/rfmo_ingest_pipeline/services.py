@@ -2,18 +2,37 @@ from __future__ import annotations
 
 import hashlib
 import json
-import re
-import subprocess
+import os
 import threading
 import time
-import zipfile
+from collections import OrderedDict
+from concurrent.futures import Executor
 from dataclasses import dataclass
 from datetime import datetime
-from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from io import BytesIO
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
-from typing import Any
-
+from typing import Any, BinaryIO, Callable, Iterable, Iterator, NamedTuple
+
+from rfmo_ingest_pipeline.blobs import (
+    REF_SUFFIX,
+    ArtifactReader,
+    BlobStore,
+    StoredBlob,
+    stored_variants,
+    write_artifact,
+)
+from rfmo_ingest_pipeline.compression import SUFFIXES, compression_for, open_decompressed, resolve_compression
+from rfmo_ingest_pipeline.deltas import (
+    DELTA_NAMES,
+    KEYFRAME_INTERVAL,
+    MAX_DELTA_BYTES,
+    TextDelta,
+    delta_path,
+    encode_delta,
+)
+from rfmo_ingest_pipeline.docx_text import iter_docx_text
+from rfmo_ingest_pipeline.html_text import visible_text
 from rfmo_ingest_pipeline.models import (
     ChangeDecision,
     DocumentRecord,
@@ -21,15 +40,33 @@ from rfmo_ingest_pipeline.models import (
     DocumentVersionRecord,
     IngestReason,
     ParsedDocument,
-    ProcessingStatus,
     RawDocument,
 )
+from rfmo_ingest_pipeline.ocr import PdfOcr
+from rfmo_ingest_pipeline.pdf_text import PdfBudget, PdfTextStats, iter_pdf_text
+from rfmo_ingest_pipeline.transport import PermanentFetchError
+
+
+BYTES_DECODE_MAX_CHARS = 200_000
+TEXT_CHUNK_CHARS = 1024 * 1024
 
 
 @dataclass
 class RetryPolicy:
     max_attempts: int = 3
     backoff_seconds: float = 1.0
+    max_backoff_seconds: float = 300.0
+
+    def next_delay(self, exc: Exception, ref: DocumentRef, attempt: int) -> float:
+        if isinstance(exc, PermanentFetchError):
+            raise exc
+        if attempt >= self.max_attempts:
+            raise RuntimeError(f"Failed to fetch after retries: {ref.source_url}") from exc
+        delay = self.backoff_seconds * attempt
+        retry_after = getattr(exc, "retry_after_seconds", None)
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+        return min(delay, self.max_backoff_seconds)
 
 
 class FetchService:
@@ -37,39 +74,75 @@ class FetchService:
         self.retry_policy = retry_policy or RetryPolicy()
 
     def fetch_with_retries(self, fetch_fn, ref: DocumentRef) -> RawDocument:
-        last_error: Exception | None = None
-        for attempt in range(1, self.retry_policy.max_attempts + 1):
+        attempt = 1
+        while True:
             try:
                 return fetch_fn(ref)
             except Exception as exc:  # noqa: BLE001
-                last_error = exc
-                if attempt < self.retry_policy.max_attempts:
-                    time.sleep(self.retry_policy.backoff_seconds * attempt)
-        raise RuntimeError(f"Failed to fetch after retries: {ref.source_url}") from last_error
+                time.sleep(self.retry_policy.next_delay(exc, ref, attempt))
+            attempt += 1
 
 
-class ParseService:
-    def parse(self, raw: RawDocument, base: ParsedDocument) -> ParsedDocument:
-        content_type = (raw.content_type or "").lower()
-        url_lower = raw.source_url.lower()
+def parse_binary_source(
+    kind: str, source: bytes | str, pdf_budget: PdfBudget | None = None
+) -> tuple[str, dict[str, Any], float]:
+    started = time.thread_time()
+    with open(source, "rb") if isinstance(source, str) else BytesIO(source) as body:
+        text, parser_info = ParseService(pdf_budget=pdf_budget).parse_binary(kind, body)
+    return text, parser_info, time.thread_time() - started
 
-        extracted_text = ""
-        snapshot_html: str | None = None
-        parser_info: dict[str, Any] = {}
 
-        if "pdf" in content_type or url_lower.endswith(".pdf"):
-            extracted_text, parser_info = self._parse_pdf(raw.body)
-        elif "html" in content_type or url_lower.endswith((".html", ".htm")):
-            html_text = raw.body.decode("utf-8", errors="replace")
-            extracted_text = self._visible_html_text(html_text)
-            snapshot_html = html_text
-            parser_info = {"parser": "html"}
-        elif "word" in content_type or url_lower.endswith(".docx"):
-            extracted_text = self._parse_docx(raw.body)
-            parser_info = {"parser": "docx"}
-        else:
-            extracted_text = raw.body.decode("utf-8", errors="replace")[:200000]
-            parser_info = {"parser": "bytes_decode"}
+@dataclass
+class _ParseResult:
+    extracted_text: str
+    snapshot_html: str | None
+    parser_info: dict[str, Any]
+
+
+class ParseService:
+    def __init__(
+        self,
+        executor: Executor | None = None,
+        cache_max_chars: int = 8_000_000,
+        pdf_budget: PdfBudget | None = None,
+        ocr: PdfOcr | None = None,
+    ) -> None:
+        self.executor = executor
+        self.pdf_budget = pdf_budget or PdfBudget()
+        self.ocr = ocr
+        self.cache_max_chars = cache_max_chars
+        self._cache: OrderedDict[tuple[str, str], _ParseResult] = OrderedDict()
+        self._cache_chars = 0
+        self._cache_lock = threading.Lock()
+
+    def parse(
+        self,
+        raw: RawDocument,
+        base: ParsedDocument,
+        file_hash: str | None = None,
+        stored: Callable[[], ParsedDocument | None] | None = None,
+    ) -> ParsedDocument:
+        # stored loads the extraction kept with an earlier version of the same bytes (file_hash), so a
+        # restarted process does not re-parse metadata-only changes; it is only used when that
+        # extraction ran with the same parse key.
+        kind = self._parser_kind(raw)
+        parse_key = self.parse_key(raw)
+        key = (file_hash, parse_key) if file_hash else None
+        result = self._cache_get(key) if key else None
+        if result is None and key and stored is not None:
+            previous = stored()
+            if previous is not None and previous.parser_info.get("parse_key") == parse_key:
+                result = _ParseResult(previous.extracted_text, previous.snapshot_html, previous.parser_info)
+                self._cache_put(key, result)
+        cache_hit = result is not None
+        cpu_seconds = 0.0
+        if result is None:
+            started = time.thread_time()
+            result, binary_cpu = self._extract(kind, raw)
+            result.parser_info["parse_key"] = parse_key
+            cpu_seconds = binary_cpu if binary_cpu is not None else time.thread_time() - started
+            if key:
+                self._cache_put(key, result)
 
         return ParsedDocument(
             title=base.title,
@@ -78,60 +151,105 @@ class ParseService:
             document_number=base.document_number,
             meeting_reference=base.meeting_reference,
             rfmo_region=base.rfmo_region,
-            extracted_text=extracted_text,
-            snapshot_html=snapshot_html,
-            parser_info=parser_info,
+            extracted_text=result.extracted_text,
+            snapshot_html=result.snapshot_html,
+            parser_info=dict(result.parser_info),
+            parse_cpu_seconds=cpu_seconds,
+            parse_cache_hit=cache_hit,
         )
 
-    def _parse_pdf(self, body: bytes) -> tuple[str, dict[str, Any]]:
-        try:
-            from pypdf import PdfReader
-        except Exception:
-            return "", {"parser": "pdf", "error": "pypdf_not_available", "ocr_attempted": False}
-
+    def parse_key(self, raw: RawDocument) -> str:
+        # Everything besides the body bytes that decides what extraction produces.
+        kind = self._parser_kind(raw)
+        if kind == "pdf":
+            budget = self.pdf_budget
+            ocr = self.ocr.backend.name if self.ocr is not None and self.ocr.backend.available() else "none"
+            return f"pdf:{budget.max_pages}:{budget.max_chars}:{budget.max_seconds}:{ocr}"
+        if kind == "docx":
+            return kind
+        return f"{kind}:{raw.buffer.encoding}"
+
+    def _parser_kind(self, raw: RawDocument) -> str:
+        content_type = (raw.content_type or "").lower()
+        url_lower = raw.source_url.lower()
+        if "pdf" in content_type or url_lower.endswith(".pdf"):
+            return "pdf"
+        if "html" in content_type or url_lower.endswith((".html", ".htm")):
+            return "html"
+        if "word" in content_type or url_lower.endswith(".docx"):
+            return "docx"
+        return "bytes"
+
+    def _extract(self, kind: str, raw: RawDocument) -> tuple[_ParseResult, float | None]:
+        if kind in {"pdf", "docx"}:
+            extracted_text, parser_info, cpu_seconds = self._parse_binary_raw(kind, raw)
+            if kind == "pdf" and not extracted_text and "error" not in parser_info and self.ocr is not None:
+                # No text layer: most likely a scanned circular.
+                extracted_text, ocr_info = self.ocr.extract(raw)
+                parser_info.update(ocr_info)
+            return _ParseResult(extracted_text, None, parser_info), cpu_seconds
+        if kind == "html":
+            # Shares the decode metadata extraction already did; the snapshot is that same string.
+            html_text = raw.buffer.text()
+            return _ParseResult(visible_text(html_text), html_text, {"parser": "html"}), None
+        extracted_text = raw.buffer.text_prefix(BYTES_DECODE_MAX_CHARS)
+        return _ParseResult(extracted_text, None, {"parser": "bytes_decode"}), None
+
+    def _cache_get(self, key: tuple[str, str]) -> _ParseResult | None:
+        with self._cache_lock:
+            result = self._cache.get(key)
+            if result is not None:
+                self._cache.move_to_end(key)
+            return result
+
+    def _cache_put(self, key: tuple[str, str], result: _ParseResult) -> None:
+        size = len(result.extracted_text) + len(result.snapshot_html or "")
+        if size > self.cache_max_chars:
+            return
+        with self._cache_lock:
+            previous = self._cache.pop(key, None)
+            if previous is not None:
+                self._cache_chars -= len(previous.extracted_text) + len(previous.snapshot_html or "")
+            self._cache[key] = result
+            self._cache_chars += size
+            while self._cache_chars > self.cache_max_chars:
+                _, evicted = self._cache.popitem(last=False)
+                self._cache_chars -= len(evicted.extracted_text) + len(evicted.snapshot_html or "")
+
+    def parse_binary(self, kind: str, body: BinaryIO) -> tuple[str, dict[str, Any]]:
+        if kind == "pdf":
+            return self._parse_pdf(body)
+        return self._parse_docx(body), {"parser": "docx"}
+
+    def _parse_binary_raw(self, kind: str, raw: RawDocument) -> tuple[str, dict[str, Any], float]:
+        if self.executor is None:
+            started = time.thread_time()
+            text, parser_info = self.parse_binary(kind, raw.open_body())
+            return text, parser_info, time.thread_time() - started
+        # Workers receive the spool file path or the raw bytes; pydantic models never cross the process boundary.
+        source: bytes | str = raw.spool.path if raw.spool is not None and raw.spool.path else raw.read_body()
+        return self.executor.submit(parse_binary_source, kind, source, self.pdf_budget).result()
+
+    def _parse_pdf(self, body: BinaryIO) -> tuple[str, dict[str, Any]]:
+        stats = PdfTextStats()
         try:
-            reader = PdfReader(BytesIO(body))
-            pages: list[str] = []
-            for page in reader.pages:
-                text = (page.extract_text() or "").strip()
-                if text:
-                    pages.append(text)
-            merged = re.sub(r"\s+", " ", "\n".join(pages)).strip()
-            if merged:
-                return merged[:2_000_000], {"parser": "pdf", "ocr_attempted": False}
+            merged = "".join(iter_pdf_text(body, self.pdf_budget, stats))
         except Exception as exc:  # noqa: BLE001
-            return "", {"parser": "pdf", "error": str(exc), "ocr_attempted": False}
+            # pypdf is imported lazily; an ImportError raised from inside it is an ordinary parse error.
+            if isinstance(exc, ImportError) and exc.name == "pypdf":
+                return "", {"parser": "pdf", "error": "pypdf_not_available", "ocr_attempted": False}
+            return "", {"parser": "pdf", "error": str(exc), "ocr_attempted": False, **stats.parser_info()}
+        if merged:
+            return merged, {"parser": "pdf", "ocr_attempted": False, **stats.parser_info()}
 
-        ocr_available = self._command_available("tesseract")
-        return "", {"parser": "pdf", "ocr_attempted": ocr_available, "ocr_used": False}
+        return "", {"parser": "pdf", "ocr_attempted": False, "ocr_used": False, **stats.parser_info()}
 
-    def _parse_docx(self, body: bytes) -> str:
+    def _parse_docx(self, body: BinaryIO) -> str:
         try:
-            with zipfile.ZipFile(BytesIO(body)) as zf:
-                xml_data = zf.read("word/document.xml").decode("utf-8", errors="replace")
-        except Exception:
+            return "\n".join(iter_docx_text(body))
+        except Exception:  # noqa: BLE001
             return ""
 
-        text = re.sub(r"</w:p>", "\n", xml_data)
-        text = re.sub(r"<[^>]+>", " ", text)
-        return re.sub(r"\s+", " ", text).strip()
-
-    def _visible_html_text(self, html: str) -> str:
-        html = re.sub(r"<script[\s\S]*?</script>", " ", html, flags=re.IGNORECASE)
-        html = re.sub(r"<style[\s\S]*?</style>", " ", html, flags=re.IGNORECASE)
-        html = re.sub(r"<nav[\s\S]*?</nav>", " ", html, flags=re.IGNORECASE)
-        html = re.sub(r"<header[\s\S]*?</header>", " ", html, flags=re.IGNORECASE)
-        html = re.sub(r"<footer[\s\S]*?</footer>", " ", html, flags=re.IGNORECASE)
-        html = re.sub(r"<[^>]+>", " ", html)
-        return re.sub(r"\s+", " ", html).strip()
-
-    def _command_available(self, command: str) -> bool:
-        try:
-            subprocess.run([command, "--version"], capture_output=True, check=False)
-            return True
-        except FileNotFoundError:
-            return False
-
 
 class ChangeDetectionService:
     def evaluate(
@@ -174,10 +292,34 @@ class ChangeDetectionService:
         )
 
 
+class StoredArtifacts(NamedTuple):
+    raw_path: str
+    extracted_path: str
+    snapshot_path: str | None
+    metadata_path: str
+    logical_bytes: int
+    physical_bytes: int
+
+
+class MigrationStats(NamedTuple):
+    artifacts_migrated: int
+    blobs_pruned: int
+    bytes_before: int
+    bytes_after: int
+
+
 class ArtifactStorage:
-    def __init__(self, root_dir: str = "./rfmo") -> None:
+    def __init__(
+        self,
+        root_dir: str = "./rfmo",
+        compression: str | None = None,
+        keyframe_interval: int = KEYFRAME_INTERVAL,
+    ) -> None:
         self.root = Path(root_dir)
         self.root.mkdir(parents=True, exist_ok=True)
+        self.compression = resolve_compression(compression)
+        self.keyframe_interval = keyframe_interval
+        self.blobs = BlobStore(self.root / "blobs", compression=self.compression)
 
     def persist(
         self,
@@ -186,47 +328,188 @@ class ArtifactStorage:
         raw: RawDocument,
         parsed: ParsedDocument,
         metadata: dict[str, Any],
-    ) -> tuple[str, str, str | None, str, int]:
+        previous: DocumentVersionRecord | None = None,
+    ) -> StoredArtifacts:
         year = (parsed.publication_date.year if parsed.publication_date else datetime.now().year)
         doc_root = self.root / document.rfmo.lower() / str(year) / document.id / f"v{version_number}"
         doc_root.mkdir(parents=True, exist_ok=True)
 
-        raw_ext = self._guess_extension(raw)
+        raw_ext = raw_extension(raw)
         raw_path = doc_root / f"raw{raw_ext}"
         extracted_path = doc_root / "extracted.txt"
         metadata_path = doc_root / "metadata.json"
         snapshot_path = doc_root / "snapshot.html"
 
-        raw_path.write_bytes(raw.body)
-        extracted_path.write_text(parsed.extracted_text or "", encoding="utf-8")
-        metadata_path.write_text(json.dumps(metadata, ensure_ascii=True, indent=2), encoding="utf-8")
-
+        reader = self.reader()
+        previous_paths = previous_artifact_paths(previous)
+        extracted_text = parsed.extracted_text or ""
+        raw_chunks = raw.spool.iter_chunks() if raw.spool is not None else [memoryview(raw.body)]
+        blobs = [
+            self._put(
+                raw_path,
+                raw_chunks,
+                version_delta(reader, raw_path, previous_paths, raw.body_size, raw.read_body, self.keyframe_interval),
+                digest=raw.body_sha256(),
+                size=raw.body_size,
+            ),
+            self._put(
+                extracted_path,
+                encoded_chunks(extracted_text),
+                version_delta(
+                    reader,
+                    extracted_path,
+                    previous_paths,
+                    len(extracted_text),
+                    lambda: extracted_text.encode("utf-8"),
+                    self.keyframe_interval,
+                ),
+            ),
+        ]
         snapshot_value: str | None = None
         if parsed.snapshot_html:
-            snapshot_path.write_text(parsed.snapshot_html, encoding="utf-8")
+            snapshot_html = parsed.snapshot_html
+            # A UTF-8 page's snapshot encodes to the raw body, so both names share one blob (or delta).
+            blobs.append(
+                self._put(
+                    snapshot_path,
+                    encoded_chunks(snapshot_html),
+                    version_delta(
+                        reader,
+                        snapshot_path,
+                        previous_paths,
+                        len(snapshot_html),
+                        lambda: snapshot_html.encode("utf-8"),
+                        self.keyframe_interval,
+                    ),
+                )
+            )
             snapshot_value = str(snapshot_path)
+        # metadata.json differs per version (fetch headers, discovery time) and stays out of the blob store.
+        metadata_file = write_artifact(
+            metadata_path, [json.dumps(metadata, ensure_ascii=True, indent=2).encode("utf-8")], self.compression
+        )
+
+        return StoredArtifacts(
+            raw_path=str(raw_path),
+            extracted_path=str(extracted_path),
+            snapshot_path=snapshot_value,
+            metadata_path=str(metadata_path),
+            logical_bytes=sum(blob.size for blob in blobs) + metadata_file.size,
+            physical_bytes=sum(blob.physical_bytes for blob in blobs) + metadata_file.physical_bytes,
+        )
+
+    def reader(self) -> ArtifactReader:
+        return ArtifactReader()
+
+    def rebase_version(self, version: DocumentVersionRecord, previous: DocumentVersionRecord | None) -> int:
+        # Stores the version's delta-encoded artifacts whole again, with their change record re-taken
+        # against `previous`, so the version stays readable once its old delta bases are removed.
+        reader = self.reader()
+        previous_paths = previous_artifact_paths(previous)
+        physical = 0
+        for path in delta_artifact_paths(version):
+            if reader.delta(path) is None:
+                continue
+            content = reader.read_bytes(path)
+            delta = version_delta(reader, path, previous_paths, len(content), lambda: content, keyframe_interval=1)
+            for stale in stored_variants(delta_path(path)):
+                self._release(stale)
+            physical += self._put(path, [content], delta).physical_bytes
+        return physical
+
+    def remove_version(self, version: DocumentVersionRecord) -> int:
+        # Deletes the version directory plus any blobs only it linked to; returns bytes freed.
+        version_dir = Path(version.metadata_path).parent
+        if not version_dir.is_dir():
+            return 0
+        freed = 0
+        raw_name = Path(version.stored_path).name
+        for path in list(version_dir.iterdir()):
+            compression = compression_for(path.name)
+            name = path.name[: -len(SUFFIXES[compression])] if compression else path.name
+            freed += self._release(path, version.file_hash if name == raw_name else None)
+        version_dir.rmdir()
+        try:
+            version_dir.parent.rmdir()
+        except OSError:
+            pass
+        return freed
+
+    def reclaim(self) -> int:
+        # Frees blobs whose last reference was a .blob file removed by remove_version (hardlinked
+        # blobs are already released there); returns bytes freed.
+        return self.blobs.prune(self._referenced_blobs()).bytes_freed
+
+    def _release(self, path: Path, digest: str | None = None) -> int:
+        # Unlinks one stored file, and its blob when that was the blob's last link; returns bytes freed.
+        # Linked files are hashed to find their blob unless the digest is on record. Blobs reached
+        # through .blob reference files are left to reclaim().
+        stat = path.stat()
+        if stat.st_nlink == 1:
+            path.unlink()
+            return stat.st_size
+        blob = self.blobs.path_for(digest or _decoded_sha256(path), compression_for(path.name))
+        path.unlink()
+        try:
+            stat = blob.stat()
+            if stat.st_nlink == 1:
+                blob.unlink()
+                return stat.st_size
+        except FileNotFoundError:
+            pass
+        return 0
 
-        bytes_written = raw_path.stat().st_size + extracted_path.stat().st_size + metadata_path.stat().st_size
-        if snapshot_value:
-            bytes_written += snapshot_path.stat().st_size
-
-        return str(raw_path), str(extracted_path), snapshot_value, str(metadata_path), bytes_written
-
-    def _guess_extension(self, raw: RawDocument) -> str:
-        ctype = (raw.content_type or "").lower()
-        if "pdf" in ctype:
-            return ".pdf"
-        if "html" in ctype:
-            return ".html"
-        if "word" in ctype or raw.source_url.lower().endswith(".docx"):
-            return ".docx"
-        if raw.source_url.lower().endswith(".pdf"):
-            return ".pdf"
-        if raw.source_url.lower().endswith(".html"):
-            return ".html"
-        if raw.source_url.lower().endswith(".docx"):
-            return ".docx"
-        return ".bin"
+    def _put(
+        self,
+        target: Path,
+        chunks: Iterable[bytes | memoryview],
+        delta: TextDelta | None,
+        digest: str | None = None,
+        size: int | None = None,
+    ) -> StoredBlob:
+        if delta is None:
+            return self.blobs.put(target, chunks, digest=digest, size=size)
+        recorded = self.blobs.put(delta_path(target), [delta.to_bytes()])
+        if delta.depth:
+            # Only the delta is kept; readers rebuild the content from the previous version.
+            return StoredBlob(delta.sha256, delta.size, recorded.physical_bytes)
+        whole = self.blobs.put(target, chunks, digest=digest, size=size)
+        return whole._replace(physical_bytes=whole.physical_bytes + recorded.physical_bytes)
+
+    def close(self) -> None:
+        pass
+
+    def version_dirs(self) -> list[Path]:
+        # {rfmo}/{year}/{document_id}/v{n}; the blob store's two-level layout never matches.
+        return sorted(path for path in self.root.glob("*/*/*/v*") if path.is_dir())
+
+    def migrate(self, dry_run: bool = False) -> MigrationStats:
+        # Re-encodes every stored artifact under this storage's compression setting and moves raw
+        # bodies, texts and snapshots into the blob store. Recorded paths stay valid throughout.
+        reader = ArtifactReader()
+        bytes_before = _disk_bytes(self.root)
+        migrated = 0
+        for version_dir in self.version_dirs():
+            for path in _logical_artifacts(version_dir):
+                current = reader.resolve(path)
+                in_store = current.stat().st_nlink > 1 or self.blobs.root.resolve() in current.resolve().parents
+                if compression_for(current.name) == self.compression and (path.name == "metadata.json" or in_store):
+                    continue
+                migrated += 1
+                if dry_run:
+                    continue
+                if path.name == "metadata.json":
+                    write_artifact(path, reader.iter_chunks(path), self.compression)
+                else:
+                    self.blobs.put(path, reader.iter_chunks(path))
+        pruned = 0 if dry_run else self.blobs.prune(self._referenced_blobs()).blobs_removed
+        return MigrationStats(migrated, pruned, bytes_before, _disk_bytes(self.root))
+
+    def _referenced_blobs(self) -> set[Path]:
+        return {
+            (ref.parent / ref.read_text(encoding="utf-8").strip()).resolve()
+            for ref in self.root.rglob(f"*{REF_SUFFIX}")
+        }
 
 
 class MetricsRegistry:
@@ -238,10 +521,18 @@ class MetricsRegistry:
             "rfmo_documents_fetched_total": 0.0,
             "rfmo_documents_ingested_total": 0.0,
             "rfmo_documents_skipped_total": 0.0,
+            "rfmo_documents_not_modified_total": 0.0,
+            "rfmo_fetch_retries_total": 0.0,
+            "rfmo_index_pages_unchanged_total": 0.0,
+            "rfmo_index_refs_skipped_total": 0.0,
             "rfmo_failures_total": 0.0,
             "rfmo_parse_failures_total": 0.0,
             "rfmo_storage_bytes_total": 0.0,
+            "rfmo_storage_physical_bytes_total": 0.0,
             "rfmo_processing_seconds_total": 0.0,
+            "rfmo_retention_versions_deleted_total": 0.0,
+            "rfmo_retention_bytes_reclaimed_total": 0.0,
+            "rfmo_retention_bytes_rewritten_total": 0.0,
         }
 
     def add(self, key: str, value: float) -> None:
@@ -305,7 +596,103 @@ class MetricsServer:
         self._thread = None
 
 
+def raw_extension(raw: RawDocument) -> str:
+    ctype = (raw.content_type or "").lower()
+    if "pdf" in ctype:
+        return ".pdf"
+    if "html" in ctype:
+        return ".html"
+    if "word" in ctype or raw.source_url.lower().endswith(".docx"):
+        return ".docx"
+    if raw.source_url.lower().endswith(".pdf"):
+        return ".pdf"
+    if raw.source_url.lower().endswith(".html"):
+        return ".html"
+    if raw.source_url.lower().endswith(".docx"):
+        return ".docx"
+    return ".bin"
+
+
 def sha256_hex(data: bytes | str) -> str:
-    if isinstance(data, str):
-        data = data.encode("utf-8")
-    return hashlib.sha256(data).hexdigest()
+    if not isinstance(data, str):
+        return hashlib.sha256(data).hexdigest()
+    # Encoded a slice at a time so hashing a large text never holds a second, encoded copy of it.
+    digest = hashlib.sha256()
+    for chunk in encoded_chunks(data):
+        digest.update(chunk)
+    return digest.hexdigest()
+
+
+def encoded_chunks(text: str) -> Iterator[bytes]:
+    for start in range(0, len(text), TEXT_CHUNK_CHARS):
+        yield text[start : start + TEXT_CHUNK_CHARS].encode("utf-8")
+
+
+def previous_artifact_paths(previous: DocumentVersionRecord | None) -> dict[str, str]:
+    if previous is None:
+        return {}
+    paths = (previous.stored_path, previous.extracted_text_path, previous.snapshot_html_path)
+    return {Path(path).name: path for path in paths if path}
+
+
+def delta_artifact_paths(version: DocumentVersionRecord) -> list[Path]:
+    return [Path(path) for name, path in previous_artifact_paths(version).items() if name in DELTA_NAMES]
+
+
+def version_delta(
+    reader: ArtifactReader,
+    target: Path,
+    previous_paths: dict[str, str],
+    size: int,
+    content: Callable[[], bytes],
+    keyframe_interval: int = KEYFRAME_INTERVAL,
+) -> TextDelta | None:
+    # None when the artifact is stored whole with no change record: a first version, a binary
+    # artifact, content too large to diff, or a previous version that can no longer be read.
+    previous_path = previous_paths.get(target.name)
+    if target.name not in DELTA_NAMES or previous_path is None or size > MAX_DELTA_BYTES:
+        return None
+    try:
+        base = reader.read_bytes(previous_path)
+        base_delta = reader.delta(previous_path)
+    except (FileNotFoundError, ValueError):
+        return None
+    if len(base) > MAX_DELTA_BYTES:
+        return None
+    return encode_delta(
+        base,
+        content(),
+        Path(os.path.relpath(Path(previous_path).parent, target.parent)).as_posix(),
+        base_delta.depth if base_delta is not None else 0,
+        keyframe_interval,
+    )
+
+
+def _logical_artifacts(version_dir: Path) -> list[Path]:
+    names = {path.name for path in version_dir.iterdir() if path.is_file()}
+    logical: set[str] = set()
+    for name in names:
+        for suffix in (*SUFFIXES.values(), REF_SUFFIX):
+            if name.endswith(suffix):
+                name = name[: -len(suffix)]
+                break
+        logical.add(name)
+    return [version_dir / name for name in sorted(logical)]
+
+
+def _decoded_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open_decompressed(str(path)) as handle:
+        while chunk := handle.read(1024 * 1024):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _disk_bytes(root: Path) -> int:
+    # Hardlinked blobs count once.
+    seen: dict[tuple[int, int], int] = {}
+    for path in root.rglob("*"):
+        if path.is_file():
+            stat = path.stat()
+            seen[(stat.st_dev, stat.st_ino)] = stat.st_size
+    return sum(seen.values())
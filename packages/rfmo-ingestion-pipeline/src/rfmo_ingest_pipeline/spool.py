@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import hashlib
+import shutil
+import tempfile
+from dataclasses import dataclass
+from io import BytesIO
+from pathlib import Path
+from typing import BinaryIO, Iterator
+
+
+class BodyTooLargeError(RuntimeError):
+    pass
+
+
+@dataclass
+class SpoolPolicy:
+    max_body_bytes: int | None = 256 * 1024 * 1024
+    memory_threshold_bytes: int = 1024 * 1024
+    chunk_size: int = 64 * 1024
+    spool_dir: str | None = None
+
+
+class SpooledBody:
+    def __init__(self, policy: SpoolPolicy | None = None) -> None:
+        self.policy = policy or SpoolPolicy()
+        self._buffer = BytesIO()
+        self._file: BinaryIO = self._buffer
+        self._path: str | None = None
+        self._hasher = hashlib.sha256()
+        self._sha256: str | None = None
+        self.size = 0
+
+    @classmethod
+    def from_stream(cls, stream: BinaryIO, policy: SpoolPolicy | None = None) -> SpooledBody:
+        spool = cls(policy)
+        try:
+            while True:
+                chunk = stream.read(spool.policy.chunk_size)
+                if not chunk:
+                    break
+                spool.write(chunk)
+        except BaseException:
+            spool.close()
+            raise
+        return spool.finish()
+
+    def write(self, chunk: bytes) -> None:
+        if self._sha256 is not None:
+            raise ValueError("spooled body is already finished")
+        limit = self.policy.max_body_bytes
+        if limit is not None and self.size + len(chunk) > limit:
+            raise BodyTooLargeError(f"body exceeds {limit} bytes")
+        self._hasher.update(chunk)
+        if self._path is None and self.size + len(chunk) > self.policy.memory_threshold_bytes:
+            self._rollover()
+        self._file.write(chunk)
+        self.size += len(chunk)
+
+    def finish(self) -> SpooledBody:
+        if self._sha256 is None:
+            self._sha256 = self._hasher.hexdigest()
+        self._file.flush()
+        self._file.seek(0)
+        return self
+
+    @property
+    def sha256(self) -> str:
+        if self._sha256 is None:
+            self.finish()
+        return self._sha256 or ""
+
+    @property
+    def in_memory(self) -> bool:
+        return self._path is None
+
+    @property
+    def path(self) -> str | None:
+        return self._path
+
+    def open(self) -> BinaryIO:
+        self._file.seek(0)
+        return self._file
+
+    def iter_chunks(self, chunk_size: int | None = None) -> Iterator[bytes]:
+        handle = self.open()
+        size = chunk_size or self.policy.chunk_size
+        while True:
+            chunk = handle.read(size)
+            if not chunk:
+                return
+            yield chunk
+
+    def view(self) -> memoryview:
+        if self._path is not None:
+            raise ValueError("spooled body is on disk")
+        return self._buffer.getbuffer()
+
+    def read_bytes(self, limit: int = -1) -> bytes:
+        return self.open().read(limit)
+
+    def copy_to(self, path: Path) -> int:
+        with path.open("wb") as out:
+            shutil.copyfileobj(self.open(), out, self.policy.chunk_size)
+        return self.size
+
+    def close(self) -> None:
+        self._file.close()
+
+    def _rollover(self) -> None:
+        # A named file (rather than SpooledTemporaryFile's anonymous one) lets parser
+        # processes open the body by path instead of receiving it pickled.
+        rolled = tempfile.NamedTemporaryFile(prefix="rfmo-spool-", dir=self.policy.spool_dir)
+        rolled.write(self._buffer.getvalue())
+        self._buffer.close()
+        self._file = rolled  # type: ignore[assignment]
+        self._path = rolled.name
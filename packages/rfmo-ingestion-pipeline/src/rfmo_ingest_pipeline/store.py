@@ -11,8 +11,11 @@ from rfmo_ingest_pipeline.models import (
     DocumentRecord,
     DocumentRef,
     DocumentVersionRecord,
+    IndexPageRecord,
     IngestionRunResult,
     ProcessingStatus,
+    QuarantineRecord,
+    RobotsEntry,
     SourceHealth,
 )
 
@@ -73,6 +76,47 @@ class SQLiteStore:
                     last_error TEXT
                 );
 
+                CREATE TABLE IF NOT EXISTS index_pages (
+                    adapter_name TEXT NOT NULL,
+                    category TEXT NOT NULL,
+                    index_url TEXT NOT NULL,
+                    etag TEXT,
+                    last_modified TEXT,
+                    content_hash TEXT NOT NULL,
+                    refs_json TEXT NOT NULL,
+                    fetched_at TEXT NOT NULL,
+                    PRIMARY KEY(adapter_name, category, index_url)
+                );
+
+                CREATE TABLE IF NOT EXISTS robots_cache (
+                    host TEXT PRIMARY KEY,
+                    status_code INTEGER NOT NULL,
+                    body TEXT NOT NULL,
+                    fetched_at TEXT NOT NULL,
+                    expires_at TEXT NOT NULL
+                );
+
+                CREATE TABLE IF NOT EXISTS parse_quarantine (
+                    file_hash TEXT PRIMARY KEY,
+                    source_url TEXT NOT NULL,
+                    reason TEXT NOT NULL,
+                    quarantined_at TEXT NOT NULL
+                );
+
+                CREATE TABLE IF NOT EXISTS ocr_pages (
+                    backend TEXT NOT NULL,
+                    page_hash TEXT NOT NULL,
+                    text TEXT NOT NULL,
+                    created_at TEXT NOT NULL,
+                    PRIMARY KEY(backend, page_hash)
+                );
+
+                CREATE TABLE IF NOT EXISTS retention_state (
+                    job TEXT PRIMARY KEY,
+                    cursor TEXT NOT NULL,
+                    updated_at TEXT NOT NULL
+                );
+
                 CREATE TABLE IF NOT EXISTS ingestion_runs (
                     run_id TEXT PRIMARY KEY,
                     payload_json TEXT NOT NULL,
@@ -91,21 +135,40 @@ class SQLiteStore:
 
     def get_document(self, rfmo: str, source_url: str) -> DocumentRecord | None:
         with self._lock:
-            row = self._conn.execute(
-                "SELECT * FROM documents WHERE rfmo = ? AND source_url = ?",
-                (rfmo, source_url),
-            ).fetchone()
+            return self._get_document_locked(rfmo, source_url)
+
+    def _get_document_locked(self, rfmo: str, source_url: str) -> DocumentRecord | None:
+        row = self._conn.execute(
+            "SELECT * FROM documents WHERE rfmo = ? AND source_url = ?",
+            (rfmo, source_url),
+        ).fetchone()
         if row is None:
             return None
         return self._row_to_document(row)
 
+    def versioned_source_urls(self, refs: list[DocumentRef]) -> set[str]:
+        # Source URLs among refs whose document already has at least one stored version.
+        wanted = {(ref.rfmo, ref.source_url) for ref in refs}
+        urls = sorted({url for _, url in wanted})
+        found: set[str] = set()
+        with self._lock:
+            for start in range(0, len(urls), 500):
+                chunk = urls[start : start + 500]
+                rows = self._conn.execute(
+                    f"SELECT rfmo, source_url FROM documents WHERE latest_version > 0 "
+                    f"AND source_url IN ({', '.join('?' * len(chunk))})",
+                    chunk,
+                ).fetchall()
+                found.update(row["source_url"] for row in rows if (row["rfmo"], row["source_url"]) in wanted)
+        return found
+
     def upsert_document_discovered(self, ref: DocumentRef) -> DocumentRecord:
-        existing = self.get_document(ref.rfmo, ref.source_url)
         now = datetime.now(timezone.utc)
-        if existing is not None:
-            title = existing.title or ref.title_hint
-            publication_date = existing.publication_date or ref.published_date
-            with self._lock:
+        with self._lock:
+            existing = self._get_document_locked(ref.rfmo, ref.source_url)
+            if existing is not None:
+                title = existing.title or ref.title_hint
+                publication_date = existing.publication_date or ref.published_date
                 self._conn.execute(
                     """
                     UPDATE documents
@@ -121,21 +184,20 @@ class SQLiteStore:
                     ),
                 )
                 self._conn.commit()
-            existing.document_type = ref.document_type
-            existing.title = title
-            existing.publication_date = publication_date
-            existing.updated_at = now
-            return existing
-
-        created = DocumentRecord(
-            rfmo=ref.rfmo,
-            source_url=ref.source_url,
-            document_type=ref.document_type,
-            title=ref.title_hint,
-            publication_date=ref.published_date,
-            status=ProcessingStatus.discovered,
-        )
-        with self._lock:
+                existing.document_type = ref.document_type
+                existing.title = title
+                existing.publication_date = publication_date
+                existing.updated_at = now
+                return existing
+
+            created = DocumentRecord(
+                rfmo=ref.rfmo,
+                source_url=ref.source_url,
+                document_type=ref.document_type,
+                title=ref.title_hint,
+                publication_date=ref.published_date,
+                status=ProcessingStatus.discovered,
+            )
             self._conn.execute(
                 """
                 INSERT INTO documents (
@@ -221,6 +283,16 @@ class SQLiteStore:
             )
             self._conn.commit()
 
+    def delete_versions(self, document_id: str, version_numbers: list[int]) -> int:
+        # One transaction per document, so readers never see some of a retention decision applied.
+        with self._lock:
+            with self._conn:
+                cur = self._conn.executemany(
+                    "DELETE FROM document_versions WHERE document_id = ? AND version_number = ?",
+                    [(document_id, number) for number in version_numbers],
+                )
+            return cur.rowcount
+
     def mark_document_status(self, document_id: str, status: ProcessingStatus) -> None:
         with self._lock:
             self._conn.execute(
@@ -265,6 +337,161 @@ class SQLiteStore:
             for r in rows
         ]
 
+    def get_index_page(self, adapter_name: str, category: DocumentCategory, index_url: str) -> IndexPageRecord | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT * FROM index_pages WHERE adapter_name = ? AND category = ? AND index_url = ?",
+                (adapter_name, category.value, index_url),
+            ).fetchone()
+        if row is None:
+            return None
+        return IndexPageRecord(
+            adapter_name=row["adapter_name"],
+            category=DocumentCategory(row["category"]),
+            index_url=row["index_url"],
+            etag=row["etag"],
+            last_modified=row["last_modified"],
+            content_hash=row["content_hash"],
+            refs=[DocumentRef.model_validate(r) for r in json.loads(row["refs_json"])],
+            fetched_at=self._parse_dt(row["fetched_at"]) or datetime.now(timezone.utc),
+        )
+
+    def save_index_page(self, record: IndexPageRecord) -> None:
+        refs_json = json.dumps([r.model_dump(mode="json") for r in record.refs])
+        with self._lock:
+            self._conn.execute(
+                """
+                INSERT INTO index_pages (
+                    adapter_name, category, index_url, etag, last_modified, content_hash, refs_json, fetched_at
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(adapter_name, category, index_url) DO UPDATE SET
+                    etag = excluded.etag,
+                    last_modified = excluded.last_modified,
+                    content_hash = excluded.content_hash,
+                    refs_json = excluded.refs_json,
+                    fetched_at = excluded.fetched_at
+                """,
+                (
+                    record.adapter_name,
+                    record.category.value,
+                    record.index_url,
+                    record.etag,
+                    record.last_modified,
+                    record.content_hash,
+                    refs_json,
+                    record.fetched_at.isoformat(),
+                ),
+            )
+            self._conn.commit()
+
+    def get_robots_entry(self, host: str) -> RobotsEntry | None:
+        with self._lock:
+            row = self._conn.execute("SELECT * FROM robots_cache WHERE host = ?", (host,)).fetchone()
+        if row is None:
+            return None
+        return RobotsEntry(
+            host=row["host"],
+            status_code=row["status_code"],
+            body=row["body"],
+            fetched_at=self._parse_dt(row["fetched_at"]) or datetime.now(timezone.utc),
+            expires_at=self._parse_dt(row["expires_at"]) or datetime.now(timezone.utc),
+        )
+
+    def save_robots_entry(self, entry: RobotsEntry) -> None:
+        with self._lock:
+            self._conn.execute(
+                """
+                INSERT INTO robots_cache (host, status_code, body, fetched_at, expires_at)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(host) DO UPDATE SET
+                    status_code = excluded.status_code,
+                    body = excluded.body,
+                    fetched_at = excluded.fetched_at,
+                    expires_at = excluded.expires_at
+                """,
+                (
+                    entry.host,
+                    entry.status_code,
+                    entry.body,
+                    entry.fetched_at.isoformat(),
+                    entry.expires_at.isoformat(),
+                ),
+            )
+            self._conn.commit()
+
+    def get_quarantine(self, file_hash: str) -> QuarantineRecord | None:
+        with self._lock:
+            row = self._conn.execute("SELECT * FROM parse_quarantine WHERE file_hash = ?", (file_hash,)).fetchone()
+        return self._row_to_quarantine(row) if row is not None else None
+
+    def save_quarantine(self, record: QuarantineRecord) -> None:
+        with self._lock:
+            self._conn.execute(
+                """
+                INSERT INTO parse_quarantine (file_hash, source_url, reason, quarantined_at)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT(file_hash) DO UPDATE SET
+                    source_url = excluded.source_url,
+                    reason = excluded.reason,
+                    quarantined_at = excluded.quarantined_at
+                """,
+                (record.file_hash, record.source_url, record.reason, record.quarantined_at.isoformat()),
+            )
+            self._conn.commit()
+
+    def list_quarantine(self) -> list[QuarantineRecord]:
+        with self._lock:
+            rows = self._conn.execute("SELECT * FROM parse_quarantine ORDER BY quarantined_at").fetchall()
+        return [self._row_to_quarantine(row) for row in rows]
+
+    def get_ocr_pages(self, backend: str, page_hashes: list[str]) -> dict[str, str]:
+        found: dict[str, str] = {}
+        unique = list(dict.fromkeys(page_hashes))
+        with self._lock:
+            # Chunked to stay under SQLite's bound-parameter limit.
+            for start in range(0, len(unique), 500):
+                chunk = unique[start : start + 500]
+                rows = self._conn.execute(
+                    f"SELECT page_hash, text FROM ocr_pages WHERE backend = ? AND page_hash IN ({','.join('?' * len(chunk))})",
+                    (backend, *chunk),
+                ).fetchall()
+                found.update((row["page_hash"], row["text"]) for row in rows)
+        return found
+
+    def save_ocr_pages(self, backend: str, texts: dict[str, str]) -> None:
+        now = datetime.now(timezone.utc).isoformat()
+        with self._lock:
+            self._conn.executemany(
+                """
+                INSERT INTO ocr_pages (backend, page_hash, text, created_at)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT(backend, page_hash) DO UPDATE SET
+                    text = excluded.text,
+                    created_at = excluded.created_at
+                """,
+                [(backend, page_hash, text, now) for page_hash, text in texts.items()],
+            )
+            self._conn.commit()
+
+    def get_retention_cursor(self, job: str) -> str | None:
+        with self._lock:
+            row = self._conn.execute("SELECT cursor FROM retention_state WHERE job = ?", (job,)).fetchone()
+        return row["cursor"] if row is not None else None
+
+    def save_retention_cursor(self, job: str, cursor: str) -> None:
+        with self._lock:
+            self._conn.execute(
+                """
+                INSERT INTO retention_state (job, cursor, updated_at)
+                VALUES (?, ?, ?)
+                ON CONFLICT(job) DO UPDATE SET
+                    cursor = excluded.cursor,
+                    updated_at = excluded.updated_at
+                """,
+                (job, cursor, datetime.now(timezone.utc).isoformat()),
+            )
+            self._conn.commit()
+
     def save_run_result(self, result: IngestionRunResult) -> None:
         payload = result.model_dump(mode="json")
         with self._lock:
@@ -298,6 +525,14 @@ class SQLiteStore:
                 rows = self._conn.execute("SELECT * FROM documents ORDER BY updated_at DESC").fetchall()
         return [self._row_to_document(r) for r in rows]
 
+    def list_document_ids(self, after: str = "", limit: int | None = None) -> list[str]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT id FROM documents WHERE id > ? ORDER BY id LIMIT ?",
+                (after, -1 if limit is None else limit),
+            ).fetchall()
+        return [row["id"] for row in rows]
+
     def _row_to_document(self, row: sqlite3.Row) -> DocumentRecord:
         return DocumentRecord(
             id=row["id"],
@@ -331,6 +566,14 @@ class SQLiteStore:
             created_at=self._parse_dt(row["created_at"]) or datetime.now(timezone.utc),
         )
 
+    def _row_to_quarantine(self, row: sqlite3.Row) -> QuarantineRecord:
+        return QuarantineRecord(
+            file_hash=row["file_hash"],
+            source_url=row["source_url"],
+            reason=row["reason"],
+            quarantined_at=self._parse_dt(row["quarantined_at"]) or datetime.now(timezone.utc),
+        )
+
     def _parse_dt(self, value: str | None) -> datetime | None:
         if not value:
             return None
@@ -0,0 +1,306 @@
+from __future__ import annotations
+
+import http.client
+import ssl
+import threading
+import time
+import zlib
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Protocol
+from urllib.parse import urljoin, urlsplit
+
+from rfmo_ingest_pipeline.spool import BodyTooLargeError, SpooledBody, SpoolPolicy
+
+
+REDIRECT_STATUSES = {301, 302, 303, 307, 308}
+STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    http.client.BadStatusLine,
+    BrokenPipeError,
+    ConnectionResetError,
+    ConnectionAbortedError,
+)
+
+
+class TransportError(RuntimeError):
+    def __init__(self, message: str, retryable: bool = True) -> None:
+        super().__init__(message)
+        self.retryable = retryable
+
+
+class FetchError(RuntimeError):
+    retryable = True
+
+
+class RetryableFetchError(FetchError):
+    def __init__(self, message: str, retry_after_seconds: float | None = None) -> None:
+        super().__init__(message)
+        self.retry_after_seconds = retry_after_seconds
+
+
+class PermanentFetchError(FetchError):
+    retryable = False
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+class _Decoder(Protocol):
+    def decompress(self, data: bytes) -> bytes:
+        ...
+
+    def flush(self) -> bytes:
+        ...
+
+
+class _DeflateDecoder:
+    def __init__(self) -> None:
+        self._obj = zlib.decompressobj()
+        self._first = True
+
+    def decompress(self, data: bytes) -> bytes:
+        if self._first:
+            self._first = False
+            try:
+                return self._obj.decompress(data)
+            except zlib.error:
+                # Some servers send raw deflate streams without the zlib header.
+                self._obj = zlib.decompressobj(-zlib.MAX_WBITS)
+        return self._obj.decompress(data)
+
+    def flush(self) -> bytes:
+        return self._obj.flush()
+
+
+def _decoder_for(encoding: str) -> _Decoder | None:
+    if encoding in {"gzip", "x-gzip"}:
+        return zlib.decompressobj(16 + zlib.MAX_WBITS)
+    if encoding == "deflate":
+        return _DeflateDecoder()
+    return None
+
+
+class _CountingReader:
+    def __init__(self, raw: http.client.HTTPResponse, decoder: _Decoder | None = None, chunk_size: int = 64 * 1024) -> None:
+        self._raw = raw
+        self._decoder = decoder
+        self._chunk_size = chunk_size
+        self._buffer = bytearray()
+        self._eof = False
+        self.wire_bytes = 0
+        self.decoded_bytes = 0
+
+    def read(self, size: int = -1) -> bytes:
+        while not self._eof and (size < 0 or len(self._buffer) < size):
+            chunk = self._raw.read(self._chunk_size)
+            if not chunk:
+                if self._decoder is not None:
+                    self._buffer += self._decoder.flush()
+                self._eof = True
+                break
+            self.wire_bytes += len(chunk)
+            self._buffer += self._decoder.decompress(chunk) if self._decoder is not None else chunk
+        if size < 0 or size > len(self._buffer):
+            size = len(self._buffer)
+        out = bytes(self._buffer[:size])
+        del self._buffer[:size]
+        self.decoded_bytes += len(out)
+        return out
+
+
+@dataclass
+class HttpResponse:
+    url: str
+    status: int
+    headers: dict[str, str] = field(default_factory=dict)
+    body: bytes = b""
+    spool: SpooledBody | None = None
+
+
+@dataclass
+class _PooledConnection:
+    conn: http.client.HTTPConnection
+    last_used: float
+
+
+class HttpTransport:
+    def __init__(
+        self,
+        pool_size_per_host: int = 4,
+        timeout_seconds: float = 30.0,
+        idle_timeout_seconds: float = 30.0,
+        max_redirects: int = 5,
+        ssl_context: ssl.SSLContext | None = None,
+        accept_encoding: str | None = "gzip, deflate",
+    ) -> None:
+        self.pool_size_per_host = pool_size_per_host
+        self.timeout_seconds = timeout_seconds
+        self.idle_timeout_seconds = idle_timeout_seconds
+        self.max_redirects = max_redirects
+        self.ssl_context = ssl_context or ssl.create_default_context()
+        self.accept_encoding = accept_encoding
+        self._lock = threading.Lock()
+        self._pools: dict[tuple[str, str, int], deque[_PooledConnection]] = {}
+        self._stats = {
+            "requests": 0,
+            "connections_opened": 0,
+            "connections_reused": 0,
+            "bytes_received": 0,
+            "bytes_decoded": 0,
+        }
+
+    def request(
+        self,
+        url: str,
+        headers: dict[str, str] | None = None,
+        method: str = "GET",
+        timeout: float | None = None,
+        spool_policy: SpoolPolicy | None = None,
+    ) -> HttpResponse:
+        current_url = url
+        current_method = method
+        for _ in range(self.max_redirects + 1):
+            response = self._request_once(current_url, headers or {}, current_method, timeout, spool_policy)
+            location = response.headers.get("Location") or response.headers.get("location")
+            if response.status not in REDIRECT_STATUSES or not location:
+                return response
+            if response.spool is not None:
+                response.spool.close()
+            current_url = urljoin(current_url, location)
+            if response.status == 303:
+                current_method = "GET"
+        raise TransportError(f"Too many redirects: {url}", retryable=False)
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return dict(self._stats)
+
+    def close(self) -> None:
+        with self._lock:
+            pools = list(self._pools.values())
+            self._pools = {}
+        for pool in pools:
+            for pooled in pool:
+                pooled.conn.close()
+
+    def _request_once(
+        self,
+        url: str,
+        headers: dict[str, str],
+        method: str,
+        timeout: float | None,
+        spool_policy: SpoolPolicy | None = None,
+    ) -> HttpResponse:
+        parts = urlsplit(url)
+        if parts.scheme not in {"http", "https"} or not parts.hostname:
+            raise TransportError(f"Unsupported URL: {url}", retryable=False)
+        key = (parts.scheme, parts.hostname.lower(), parts.port or (443 if parts.scheme == "https" else 80))
+        path = parts.path or "/"
+        if parts.query:
+            path = f"{path}?{parts.query}"
+        request_headers = {"Connection": "keep-alive", **headers}
+        if self.accept_encoding and not any(name.lower() == "accept-encoding" for name in headers):
+            request_headers["Accept-Encoding"] = self.accept_encoding
+        effective_timeout = timeout if timeout is not None else self.timeout_seconds
+
+        conn, reused = self._acquire(key, effective_timeout)
+        try:
+            try:
+                conn.request(method, path, headers=request_headers)
+                resp = conn.getresponse()
+            except STALE_CONNECTION_ERRORS:
+                conn.close()
+                if not reused:
+                    raise
+                # The server dropped an idle keep-alive connection; retry once on a fresh one.
+                conn, reused = self._acquire(key, effective_timeout, fresh=True)
+                conn.request(method, path, headers=request_headers)
+                resp = conn.getresponse()
+            encoding = (resp.getheader("Content-Encoding") or "").strip().lower()
+            reader = _CountingReader(resp, _decoder_for(encoding))
+            body = b""
+            spool: SpooledBody | None = None
+            if spool_policy is None or resp.status >= 300:
+                body = reader.read()
+            else:
+                spool = self._read_spooled(resp, reader, spool_policy)
+        except BodyTooLargeError as exc:
+            conn.close()
+            raise TransportError(f"Response body too large: {url}: {exc}", retryable=False) from exc
+        except zlib.error as exc:
+            conn.close()
+            raise TransportError(f"Failed to decode {encoding} body: {url}: {exc}", retryable=False) from exc
+        except (OSError, http.client.HTTPException) as exc:
+            conn.close()
+            raise TransportError(f"Request failed: {url}: {exc}") from exc
+
+        with self._lock:
+            self._stats["requests"] += 1
+            self._stats["bytes_received"] += reader.wire_bytes
+            self._stats["bytes_decoded"] += reader.decoded_bytes
+        if resp.will_close:
+            conn.close()
+        else:
+            self._release(key, conn)
+        return HttpResponse(
+            url=url,
+            status=resp.status,
+            headers={k: v for k, v in resp.getheaders()},
+            body=body,
+            spool=spool,
+        )
+
+    def _read_spooled(
+        self, resp: http.client.HTTPResponse, reader: _CountingReader, policy: SpoolPolicy
+    ) -> SpooledBody:
+        declared = resp.getheader("Content-Length")
+        if policy.max_body_bytes is not None and declared and declared.isdigit() and int(declared) > policy.max_body_bytes:
+            raise BodyTooLargeError(f"declared Content-Length {declared} exceeds {policy.max_body_bytes} bytes")
+        # max_body_bytes is enforced on the decoded stream, so compressed bodies cannot expand past it.
+        return SpooledBody.from_stream(reader, policy)  # type: ignore[arg-type]
+
+    def _acquire(
+        self, key: tuple[str, str, int], timeout: float, fresh: bool = False
+    ) -> tuple[http.client.HTTPConnection, bool]:
+        now = time.monotonic()
+        with self._lock:
+            pool = self._pools.get(key)
+            while pool and not fresh:
+                pooled = pool.pop()
+                if now - pooled.last_used > self.idle_timeout_seconds:
+                    pooled.conn.close()
+                    continue
+                self._stats["connections_reused"] += 1
+                if pooled.conn.sock is not None:
+                    pooled.conn.sock.settimeout(timeout)
+                pooled.conn.timeout = timeout
+                return pooled.conn, True
+            self._stats["connections_opened"] += 1
+
+        scheme, host, port = key
+        if scheme == "https":
+            return http.client.HTTPSConnection(host, port, timeout=timeout, context=self.ssl_context), False
+        return http.client.HTTPConnection(host, port, timeout=timeout), False
+
+    def _release(self, key: tuple[str, str, int], conn: http.client.HTTPConnection) -> None:
+        with self._lock:
+            pool = self._pools.setdefault(key, deque())
+            if len(pool) < self.pool_size_per_host:
+                pool.append(_PooledConnection(conn=conn, last_used=time.monotonic()))
+                return
+        conn.close()
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import asyncio
+
+from rfmo_ingest_pipeline.async_engine import AsyncIngestionEngine, AsyncRFMOAdapter
+from rfmo_ingest_pipeline.models import DocumentCategory, DocumentRef, ParsedDocument, RawDocument
+from test_engine import _FakeAdapter
+
+
+class _AsyncAdapter(AsyncRFMOAdapter):
+    name = "async-fake"
+    rfmo = "WCPFC"
+
+    def __init__(self, count: int) -> None:
+        self._count = count
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def list_documents(self) -> list[DocumentRef]:
+        return [
+            DocumentRef(
+                rfmo=self.rfmo,
+                source_url=f"https://cmm.wcpfc.int/measures/{i}",
+                document_type=DocumentCategory.conservation_management_measures,
+            )
+            for i in range(self._count)
+        ]
+
+    async def fetch_document(self, ref: DocumentRef) -> RawDocument:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        return RawDocument(
+            source_url=ref.source_url,
+            status_code=200,
+            content_type="text/html",
+            body=f"<html><body>{ref.source_url}</body></html>".encode("utf-8"),
+        )
+
+    def extract_metadata(self, raw: RawDocument, ref: DocumentRef) -> ParsedDocument:
+        return ParsedDocument(title=ref.source_url, document_category=ref.document_type)
+
+
+class _MixedRegistry:
+    def __init__(self, adapters) -> None:
+        self._adapters = {a.name: a for a in adapters}
+
+    def all(self):
+        return list(self._adapters.values())
+
+    def get(self, name: str):
+        return self._adapters[name]
+
+
+def test_async_engine_runs_native_and_wrapped_sync_adapters(tmp_path) -> None:
+    native = _AsyncAdapter(count=5)
+    wrapped = _FakeAdapter(body=b"<html><body>sync adapter</body></html>")
+    engine = AsyncIngestionEngine(
+        db_path=str(tmp_path / "ingest.db"),
+        storage_root=str(tmp_path / "rfmo"),
+        adapters=_MixedRegistry([native, wrapped]),  # type: ignore[arg-type]
+        max_concurrency=4,
+    )
+
+    result = engine.run_once()
+
+    assert native.max_in_flight > 1
+    assert result.metrics.documents_discovered == 6
+    assert result.metrics.documents_ingested == 6
+    assert sorted(h.adapter_name for h in result.source_health) == ["async-fake", "fake"]
+    assert engine.store.latest_run()["run_id"] == result.run_id
+
+    second = engine.run_once()
+    assert second.metrics.documents_skipped == 6
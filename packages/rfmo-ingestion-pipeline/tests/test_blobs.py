@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import gzip
+import hashlib
+import os
+
+from rfmo_ingest_pipeline.blobs import ArtifactReader, BlobStore, write_artifact
+from rfmo_ingest_pipeline.services import ArtifactStorage
+
+
+def test_identical_content_is_stored_once_and_linked_into_each_version(tmp_path) -> None:
+    store = BlobStore(tmp_path / "blobs")
+    (tmp_path / "v1").mkdir()
+    (tmp_path / "v2").mkdir()
+
+    first = store.put(tmp_path / "v1" / "raw.html", [b"<html>", b"same</html>"])
+    second = store.put(tmp_path / "v2" / "raw.html", [b"<html>same</html>"])
+    known = store.put(tmp_path / "v2" / "snapshot.html", iter(()), digest=first.digest)
+
+    assert first.digest == hashlib.sha256(b"<html>same</html>").hexdigest()
+    assert (first.size, first.physical_bytes) == (17, 17)
+    assert (second.size, second.physical_bytes) == (17, 0)
+    assert (known.size, known.physical_bytes) == (17, 0)
+    inodes = {os.stat(tmp_path / name).st_ino for name in ("v1/raw.html", "v2/raw.html", "v2/snapshot.html")}
+    assert inodes == {store.path_for(first.digest).stat().st_ino}
+    assert not [name for name in os.listdir(store.root) if name.startswith("blob-")]
+
+
+def test_reference_file_is_written_where_hardlinks_fail(tmp_path, monkeypatch) -> None:
+    store = BlobStore(tmp_path / "blobs")
+    (tmp_path / "v1").mkdir()
+    real_link = os.link
+
+    def link(src, dst):
+        if "blobs" not in str(dst):
+            raise OSError("cross-device link")
+        return real_link(src, dst)
+
+    monkeypatch.setattr(os, "link", link)
+    stored = store.put(tmp_path / "v1" / "extracted.txt", ["measure text".encode()])
+
+    assert not (tmp_path / "v1" / "extracted.txt").exists()
+    reader = ArtifactReader()
+    assert reader.resolve(tmp_path / "v1" / "extracted.txt") == store.path_for(stored.digest).resolve()
+    assert reader.read_text(tmp_path / "v1" / "extracted.txt") == "measure text"
+    assert stored.physical_bytes == len("measure text") + (tmp_path / "v1" / "extracted.txt.blob").stat().st_size
+
+
+def test_compressed_blobs_are_read_back_through_the_reader(tmp_path) -> None:
+    plain = BlobStore(tmp_path / "blobs")
+    compressed = BlobStore(tmp_path / "blobs", compression="gzip")
+    for version in ("v1", "v2", "v3"):
+        (tmp_path / version).mkdir()
+    text = b"catch limit " * 1000
+
+    stored = compressed.put(tmp_path / "v1" / "extracted.txt", [text])
+    again = compressed.put(tmp_path / "v2" / "extracted.txt", [text])
+    earlier = plain.put(tmp_path / "v3" / "extracted.txt", [b"old plain blob"])
+    relinked = compressed.put(tmp_path / "v3" / "raw.html", iter(()), digest=earlier.digest, size=14)
+    write_artifact(tmp_path / "v1" / "metadata.json", [b'{"title": "x"}'], "gzip")
+
+    reader = ArtifactReader(chunk_size=100)
+    assert stored.size == len(text) and 0 < stored.physical_bytes < len(text) // 10
+    assert again.physical_bytes == 0
+    assert (tmp_path / "v1" / "extracted.txt.gz").exists() and not (tmp_path / "v1" / "extracted.txt").exists()
+    assert gzip.decompress((tmp_path / "v1" / "extracted.txt.gz").read_bytes()) == text
+    assert b"".join(reader.iter_chunks(tmp_path / "v2" / "extracted.txt")) == text
+    assert (relinked.size, relinked.physical_bytes) == (14, 0)
+    assert reader.read_bytes(tmp_path / "v3" / "raw.html") == b"old plain blob"
+    assert reader.read_text(tmp_path / "v1" / "metadata.json") == '{"title": "x"}'
+    assert reader.find(tmp_path, "metadata.json") == [tmp_path / "v1" / "metadata.json"]
+
+
+def test_migrate_moves_plain_tree_into_compressed_blobs(tmp_path) -> None:
+    version_dir = tmp_path / "iccat" / "2024" / "doc" / "v1"
+    version_dir.mkdir(parents=True)
+    html = b"<html><body>" + b"measure text " * 500 + b"</body></html>"
+    (version_dir / "raw.html").write_bytes(html)
+    (version_dir / "snapshot.html").write_bytes(html)
+    (version_dir / "extracted.txt").write_bytes(b"measure text " * 500)
+    (version_dir / "metadata.json").write_text('{"title": "CMM"}', encoding="utf-8")
+
+    storage = ArtifactStorage(str(tmp_path), compression="gzip")
+    assert storage.migrate(dry_run=True).artifacts_migrated == 4
+    stats = storage.migrate()
+
+    assert stats.artifacts_migrated == 4
+    assert stats.bytes_after < stats.bytes_before // 5
+    assert sorted(path.name for path in version_dir.iterdir()) == [
+        "extracted.txt.gz",
+        "metadata.json.gz",
+        "raw.html.gz",
+        "snapshot.html.gz",
+    ]
+    reader = ArtifactReader()
+    assert reader.read_bytes(version_dir / "snapshot.html") == html
+    assert reader.read_text(version_dir / "metadata.json") == '{"title": "CMM"}'
+    assert storage.migrate().artifacts_migrated == 0
+
+    uncompressed = ArtifactStorage(str(tmp_path)).migrate()
+    assert (uncompressed.artifacts_migrated, uncompressed.blobs_pruned) == (4, 2)
+    assert (version_dir / "raw.html").read_bytes() == html
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import pytest
+
+from rfmo_ingest_pipeline.deltas import TextDelta, encode_delta, reconstruct
+from rfmo_ingest_pipeline.models import DocumentCategory, DocumentRecord, DocumentVersionRecord, ParsedDocument, RawDocument
+from rfmo_ingest_pipeline.services import ArtifactStorage
+
+
+BASE = b"".join(b"Paragraph %d of the measure text.\n" % index for index in range(200))
+
+
+def test_delta_round_trips_bytes_that_are_not_utf8() -> None:
+    changed = BASE.replace(b"Paragraph 7 ", b"Paragraph \xe9 7 ") + b"trailing line without newline"
+
+    delta = TextDelta.from_bytes(encode_delta(BASE, changed, "../v1", base_depth=0).to_bytes())
+
+    assert delta.depth == 1
+    assert len(delta.to_bytes()) < len(changed) // 10
+    assert reconstruct(BASE, [delta]) == changed
+    assert [hunk.base_line for hunk in delta.hunks()] == [7, 200]
+    assert delta.hunks()[0].added == ["Paragraph � 7 of the measure text."]
+
+
+def test_chains_replay_in_order_and_keyframes_bound_their_length() -> None:
+    second = BASE.replace(b"Paragraph 3 ", b"Paragraph three ")
+    third = second.replace(b"Paragraph 150 ", b"")
+
+    one = encode_delta(BASE, second, "../v1", base_depth=0, keyframe_interval=3)
+    two = encode_delta(second, third, "../v2", base_depth=one.depth, keyframe_interval=3)
+
+    assert (one.depth, two.depth) == (1, 2)
+    assert reconstruct(BASE, [two, one]) == third
+    assert encode_delta(third, BASE, "../v3", base_depth=two.depth, keyframe_interval=3).depth == 0
+    assert encode_delta(BASE, b"entirely different\n", "../v1", base_depth=0) is None
+    with pytest.raises(ValueError):
+        reconstruct(BASE[: len(BASE) // 2], [two, one])
+
+
+def test_wholesale_rewrite_is_stored_whole_without_a_change_record(tmp_path) -> None:
+    storage = ArtifactStorage(str(tmp_path))
+    document = DocumentRecord(rfmo="WCPFC", source_url="https://www.wcpfc.int/cmm", document_type=DocumentCategory.other)
+    raw = RawDocument(source_url=document.source_url, status_code=200, content_type="application/pdf", body=b"%PDF")
+    stored = []
+    for number, word in enumerate(("alpha", "omega"), start=1):
+        text = "".join(f"{word} clause {index} of the rewritten measure.\n" for index in range(5000))
+        parsed = ParsedDocument(extracted_text=text)
+        previous = None
+        if stored:
+            previous = DocumentVersionRecord(
+                document_id=document.id,
+                version_number=1,
+                file_hash="x",
+                stored_path=stored[0].raw_path,
+                extracted_text_path=stored[0].extracted_path,
+                metadata_path=stored[0].metadata_path,
+            )
+        stored.append(storage.persist(document, number, raw, parsed, {}, previous=previous))
+
+    rewritten = stored[1]
+    assert rewritten.physical_bytes <= rewritten.logical_bytes
+    assert storage.reader().changes(rewritten.extracted_path) is None
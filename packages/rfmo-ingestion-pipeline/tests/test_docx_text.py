@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+from io import BytesIO
+import zipfile
+
+from rfmo_ingest_pipeline.docx_text import iter_docx_text
+
+NS = 'xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"'
+
+
+def _docx(parts: dict[str, str]) -> BytesIO:
+    buffer = BytesIO()
+    with zipfile.ZipFile(buffer, "w") as zf:
+        for name, xml in parts.items():
+            zf.writestr(name, xml)
+    buffer.seek(0)
+    return buffer
+
+
+def test_iter_docx_text_keeps_paragraphs_tables_and_supplementary_parts() -> None:
+    document = (
+        f"<w:document {NS}><w:body>"
+        "<w:p><w:r><w:t>Quo</w:t></w:r><w:r><w:t>ta table</w:t></w:r><w:r><w:tab/><w:t>2024</w:t></w:r></w:p>"
+        "<w:tbl>"
+        "<w:tr><w:tc><w:p><w:r><w:t>CPC</w:t></w:r></w:p></w:tc><w:tc><w:p><w:r><w:t>Limit (t)</w:t></w:r></w:p></w:tc></w:tr>"
+        "<w:tr><w:tc><w:p><w:r><w:t>Japan</w:t></w:r></w:p></w:tc>"
+        "<w:tc><w:p><w:r><w:t>1 200</w:t></w:r></w:p><w:p><w:r><w:delText>900</w:delText></w:r></w:p></w:tc></w:tr>"
+        "</w:tbl>"
+        "<w:p><w:r><w:instrText>PAGE</w:instrText><w:t>Entry into force</w:t></w:r></w:p>"
+        "</w:body></w:document>"
+    )
+    footnotes = f"<w:footnotes {NS}><w:footnote><w:p><w:r><w:t>See CMM 2023-01.</w:t></w:r></w:p></w:footnote></w:footnotes>"
+    header = f"<w:hdr {NS}><w:p><w:r><w:t>IOTC Circular</w:t></w:r></w:p></w:hdr>"
+
+    lines = list(
+        iter_docx_text(
+            _docx({"word/document.xml": document, "word/footnotes.xml": footnotes, "word/header1.xml": header})
+        )
+    )
+
+    assert lines == [
+        "Quota table 2024",
+        "CPC\tLimit (t)",
+        "Japan\t1 200",
+        "Entry into force",
+        "IOTC Circular",
+        "See CMM 2023-01.",
+    ]
@@ -1,20 +1,39 @@
 from __future__ import annotations
 
 from datetime import date
+import hashlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from io import BytesIO
+from pathlib import Path
+import threading
+import time
 from urllib.request import urlopen
+import zipfile
 
-from rfmo_ingest_pipeline.connectors import HtmlRFMOAdapter, RFMOAdapter
+import pytest
+
+from rfmo_ingest_pipeline import services
+from rfmo_ingest_pipeline.alerts import AlertGenerator
+from rfmo_ingest_pipeline.blobs import ArtifactReader
+from rfmo_ingest_pipeline.connectors import HostRateLimiter, HtmlRFMOAdapter, RFMOAdapter
 from rfmo_ingest_pipeline.engine import IngestionEngine
 from rfmo_ingest_pipeline.models import DocumentCategory, DocumentRef, ParsedDocument, RawDocument
+from rfmo_ingest_pipeline.segments import segment_reader
+from rfmo_ingest_pipeline.services import RetryPolicy
+from rfmo_ingest_pipeline.spool import SpooledBody, SpoolPolicy
+from rfmo_ingest_pipeline.store import SQLiteStore
+from rfmo_ingest_pipeline.transport import PermanentFetchError, RetryableFetchError
 
 
 class _FakeAdapter(RFMOAdapter):
     name = "fake"
     rfmo = "ICCAT"
 
-    def __init__(self, body: bytes, content_type: str = "text/html") -> None:
+    def __init__(self, body: bytes, content_type: str = "text/html", honor_conditional: bool = False) -> None:
         self._body = body
         self._content_type = content_type
+        self._honor_conditional = honor_conditional
+        self.conditional_requests: list[tuple[str | None, str | None]] = []
 
     def list_documents(self) -> list[DocumentRef]:
         return [
@@ -32,6 +51,9 @@ class _FakeAdapter(RFMOAdapter):
         ]
 
     def fetch_document(self, ref: DocumentRef) -> RawDocument:
+        self.conditional_requests.append((ref.if_none_match, ref.if_modified_since))
+        if self._honor_conditional and ref.if_none_match == "etag-a":
+            return RawDocument(source_url=ref.source_url, status_code=304, body=b"")
         return RawDocument(
             source_url=ref.source_url,
             status_code=200,
@@ -51,6 +73,57 @@ class _FakeAdapter(RFMOAdapter):
         )
 
 
+class _MultiHostAdapter(_FakeAdapter):
+    def __init__(self, urls: list[str]) -> None:
+        super().__init__(body=b"")
+        self._urls = urls
+        self._lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def list_documents(self) -> list[DocumentRef]:
+        return [
+            DocumentRef(rfmo=self.rfmo, source_url=url, document_type=DocumentCategory.circular_letters)
+            for url in self._urls
+        ]
+
+    def fetch_document(self, ref: DocumentRef) -> RawDocument:
+        with self._lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(0.05)
+        with self._lock:
+            self.in_flight -= 1
+        return RawDocument(
+            source_url=ref.source_url,
+            status_code=200,
+            content_type="text/html",
+            body=f"<html><body>{ref.source_url}</body></html>".encode("utf-8"),
+        )
+
+
+class _FlakyAdapter(_MultiHostAdapter):
+    def __init__(self, urls: list[str]) -> None:
+        super().__init__(urls)
+        self.attempts: dict[str, int] = {}
+
+    def fetch_document(self, ref: DocumentRef) -> RawDocument:
+        with self._lock:
+            self.attempts[ref.source_url] = self.attempts.get(ref.source_url, 0) + 1
+            attempt = self.attempts[ref.source_url]
+        if ref.source_url.endswith("/gone"):
+            raise PermanentFetchError(f"Failed to fetch URL: {ref.source_url} (HTTP 404)")
+        if ref.source_url.endswith("/busy") and attempt == 1:
+            raise RetryableFetchError(f"Failed to fetch URL: {ref.source_url} (HTTP 429)", retry_after_seconds=0.1)
+        return super().fetch_document(ref)
+
+
+class _SpooledAdapter(_FakeAdapter):
+    def fetch_document(self, ref: DocumentRef) -> RawDocument:
+        spool = SpooledBody.from_stream(BytesIO(self._body), SpoolPolicy(memory_threshold_bytes=8, chunk_size=5))
+        return RawDocument(source_url=ref.source_url, status_code=200, content_type=self._content_type, spool=spool)
+
+
 class _Registry:
     def __init__(self, adapter: RFMOAdapter) -> None:
         self._adapter = adapter
@@ -99,6 +172,57 @@ def test_second_run_is_idempotent_for_same_content(tmp_path) -> None:
     assert len(versions) == 1
 
 
+def test_unchanged_bytes_skip_parse_and_metadata_changes_reuse_parse_cache(tmp_path) -> None:
+    adapter = _FakeAdapter(body=b"<html><body>same body</body></html>")
+    engine = IngestionEngine(
+        db_path=str(tmp_path / "ingest.db"),
+        storage_root=str(tmp_path / "rfmo"),
+        adapters=_Registry(adapter),  # type: ignore[arg-type]
+    )
+    engine.run_once()
+
+    unchanged = engine.run_once()
+    assert unchanged.metrics.documents_unchanged_unparsed == 1
+    assert unchanged.metrics.parse_cpu_seconds == {}
+
+    [ref] = _FakeAdapter.list_documents(adapter)
+    adapter.list_documents = lambda: [ref.model_copy(update={"title_hint": "CMM 2024-01 (amended title)"})]
+    renamed = engine.run_once()
+
+    assert renamed.metrics.documents_ingested == 1
+    assert renamed.metrics.parse_cache_hits == 1
+    versions = engine.list_versions("ICCAT")
+    assert [v.version_number for v in versions] == [1, 2]
+    assert versions[0].content_hash == versions[1].content_hash
+
+
+def test_restarted_engine_reuses_stored_extraction_for_metadata_only_changes(tmp_path) -> None:
+    adapter = _FakeAdapter(body=b"<html><body>same body</body></html>")
+
+    def engine() -> IngestionEngine:
+        return IngestionEngine(
+            db_path=str(tmp_path / "ingest.db"),
+            storage_root=str(tmp_path / "rfmo"),
+            adapters=_Registry(adapter),  # type: ignore[arg-type]
+        )
+
+    engine().run_once()
+    [ref] = _FakeAdapter.list_documents(adapter)
+    adapter.list_documents = lambda: [ref.model_copy(update={"title_hint": "CMM 2024-01 (amended title)"})]
+    renamed = engine().run_once()
+
+    assert renamed.metrics.documents_ingested == 1
+    assert renamed.metrics.parse_cache_hits == 1
+    assert renamed.metrics.parse_cpu_seconds == {}
+
+    adapter.list_documents = lambda: [ref.model_copy(update={"title_hint": "CMM 2024-01 (latin-1 page)"})]
+    adapter._content_type = "text/html; charset=iso-8859-1"
+    recharset = engine().run_once()
+
+    assert recharset.metrics.documents_ingested == 1
+    assert recharset.metrics.parse_cache_hits == 0
+
+
 def test_creates_new_version_when_file_changes(tmp_path) -> None:
     adapter = _FakeAdapter(body=b"<html><body>v1</body></html>")
     engine = IngestionEngine(
@@ -116,6 +240,562 @@ def test_creates_new_version_when_file_changes(tmp_path) -> None:
     assert [v.version_number for v in versions] == [1, 2]
 
 
+def test_not_modified_response_skips_parse_and_storage(tmp_path) -> None:
+    adapter = _FakeAdapter(body=b"<html><body>cached</body></html>", honor_conditional=True)
+    engine = IngestionEngine(
+        db_path=str(tmp_path / "ingest.db"),
+        storage_root=str(tmp_path / "rfmo"),
+        adapters=_Registry(adapter),  # type: ignore[arg-type]
+    )
+
+    first = engine.run_once()
+    second = engine.run_once()
+
+    assert adapter.conditional_requests == [
+        (None, None),
+        ("etag-a", "Sat, 20 Jan 2024 12:00:00 GMT"),
+    ]
+    assert first.metrics.documents_ingested == 1
+    assert second.metrics.documents_not_modified == 1
+    assert second.metrics.documents_skipped == 1
+    assert second.metrics.documents_fetched == 0
+    assert engine.metrics.snapshot()["rfmo_documents_not_modified_total"] == 1.0
+    assert len(engine.list_versions("ICCAT")) == 1
+
+
+def test_html_adapter_sends_validators_and_handles_304() -> None:
+    seen: list[str | None] = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):  # noqa: N802
+            seen.append(self.headers.get("If-None-Match"))
+            if self.headers.get("If-None-Match") == '"v1"':
+                self.send_response(304)
+                self.send_header("ETag", '"v1"')
+                self.end_headers()
+                return
+            payload = b"<html><body>doc</body></html>"
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html")
+            self.send_header("ETag", '"v1"')
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, format, *args):
+            return
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        adapter = HtmlRFMOAdapter(
+            name="test",
+            rfmo="ICCAT",
+            category_indexes={},
+            user_agent="test-agent",
+            min_request_interval_seconds=0.0,
+            respect_robots=False,
+        )
+        url = f"http://127.0.0.1:{server.server_address[1]}/doc.html"
+        ref = DocumentRef(rfmo="ICCAT", source_url=url, document_type=DocumentCategory.other)
+        fresh = adapter.fetch_document(ref)
+        cached = adapter.fetch_document(ref.model_copy(update={"if_none_match": fresh.headers["ETag"]}))
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert fresh.status_code == 200
+    assert cached.status_code == 304
+    assert cached.body == b""
+    assert seen == [None, '"v1"']
+
+
+def test_spooled_body_is_hashed_and_stored_without_body_bytes(tmp_path) -> None:
+    body = b"<html><body>spooled measure text</body></html>"
+    adapter = _SpooledAdapter(body=body)
+    engine = IngestionEngine(
+        db_path=str(tmp_path / "ingest.db"),
+        storage_root=str(tmp_path / "rfmo"),
+        adapters=_Registry(adapter),  # type: ignore[arg-type]
+    )
+
+    result = engine.run_once()
+
+    assert result.metrics.documents_ingested == 1
+    (version,) = engine.list_versions("ICCAT")
+    assert version.file_hash == hashlib.sha256(body).hexdigest()
+    assert Path(version.stored_path).read_bytes() == body
+    assert "spooled measure text" in Path(version.extracted_text_path).read_text(encoding="utf-8")
+
+
+def test_html_body_is_decoded_once_with_declared_charset(tmp_path) -> None:
+    buffers = []
+
+    class _DecodingAdapter(_FakeAdapter):
+        def extract_metadata(self, raw: RawDocument, ref: DocumentRef) -> ParsedDocument:
+            buffers.append(raw.buffer)
+            assert "Pêche" in raw.buffer.text()
+            return super().extract_metadata(raw, ref)
+
+    body = "<html><body>Pêche thonière</body></html>".encode("latin-1")
+    adapter = _DecodingAdapter(body=body, content_type="text/html; charset=ISO-8859-1")
+    engine = IngestionEngine(
+        db_path=str(tmp_path / "ingest.db"),
+        storage_root=str(tmp_path / "rfmo"),
+        adapters=_Registry(adapter),  # type: ignore[arg-type]
+    )
+
+    engine.run_once()
+
+    (version,) = engine.list_versions("ICCAT")
+    assert [buffer.decodes for buffer in buffers] == [1]
+    assert Path(version.extracted_text_path).read_text(encoding="utf-8") == "Pêche thonière"
+    assert version.content_hash == hashlib.sha256("Pêche thonière".encode("utf-8")).hexdigest()
+    assert Path(version.snapshot_html_path).read_text(encoding="utf-8") == body.decode("latin-1")
+
+
+def test_identical_bodies_share_blobs_across_documents(tmp_path) -> None:
+    adapter = _MultiHostAdapter(["https://a.example.org/doc", "https://b.example.org/doc"])
+    adapter.fetch_document = lambda ref: RawDocument(  # type: ignore[method-assign]
+        source_url=ref.source_url, status_code=200, content_type="text/html", body=b"<html><body>same</body></html>"
+    )
+    engine = IngestionEngine(
+        db_path=str(tmp_path / "ingest.db"),
+        storage_root=str(tmp_path / "rfmo"),
+        adapters=_Registry(adapter),  # type: ignore[arg-type]
+    )
+
+    result = engine.run_once()
+
+    first, second = engine.list_versions("ICCAT")
+    paths = [first.stored_path, first.snapshot_html_path, second.stored_path, second.snapshot_html_path]
+    assert len({Path(path).stat().st_ino for path in paths}) == 1
+    assert Path(second.extracted_text_path).read_text(encoding="utf-8") == "same"
+    metadata_bytes = sum(Path(v.metadata_path).stat().st_size for v in (first, second))
+    assert result.metrics.storage_bytes_written == 2 * (30 + 30 + 4) + metadata_bytes
+    assert result.metrics.storage_physical_bytes_written == 30 + 4 + metadata_bytes
+
+
+def test_compressed_storage_is_transparent_to_readers(tmp_path) -> None:
+    adapter = _FakeAdapter(body=b"<html><body>Members shall submit reports by 12/03/2026.</body></html>")
+    engine = IngestionEngine(
+        db_path=str(tmp_path / "ingest.db"),
+        storage_root=str(tmp_path / "rfmo"),
+        adapters=_Registry(adapter),  # type: ignore[arg-type]
+        storage_compression="gzip",
+    )
+
+    result = engine.run_once()
+
+    (version,) = engine.list_versions("ICCAT")
+    assert not Path(version.extracted_text_path).exists()
+    assert Path(version.extracted_text_path + ".gz").exists()
+    assert ArtifactReader().read_text(version.extracted_text_path) == "Members shall submit reports by 12/03/2026."
+    assert result.metrics.storage_physical_bytes_written < result.metrics.storage_bytes_written
+    [alert] = AlertGenerator(storage_root=str(tmp_path / "rfmo")).generate(days=0)
+    assert alert["due_date"] == "2026-03-12"
+
+
+def test_segment_backend_packs_versions_without_per_version_files(tmp_path) -> None:
+    adapter = _FakeAdapter(body=b"<html><body>v1</body></html>")
+    engine = IngestionEngine(
+        db_path=str(tmp_path / "ingest.db"),
+        storage_root=str(tmp_path / "rfmo"),
+        adapters=_Registry(adapter),  # type: ignore[arg-type]
+        storage_backend="segments",
+    )
+    engine.run_once()
+    adapter._body = b"<html><body>v2</body></html>"
+    engine.run_once()
+    engine.close()
+
+    versions = engine.list_versions("ICCAT")
+    assert [v.version_number for v in versions] == [1, 2]
+    assert not any(path.is_dir() and path.name.startswith("v") for path in (tmp_path / "rfmo").rglob("*"))
+    reader = segment_reader(tmp_path / "rfmo")
+    assert [reader.read_text(v.extracted_text_path) for v in versions] == ["v1", "v2"]
+
+
+@pytest.mark.parametrize("backend", ["directory", "segments"])
+def test_changed_pages_are_stored_as_deltas_between_keyframes(tmp_path, backend) -> None:
+    clauses = "".join(f"<p>Clause {index}: vessels shall report catches monthly.</p>\n" for index in range(40))
+    page = "<html><body>\n" + clauses + "<p>Updated {day} March 2026</p>\n</body></html>"
+    adapter = _FakeAdapter(body=page.format(day=1).encode())
+    engine = IngestionEngine(
+        db_path=str(tmp_path / "ingest.db"),
+        storage_root=str(tmp_path / "rfmo"),
+        adapters=_Registry(adapter),  # type: ignore[arg-type]
+        storage_backend=backend,
+        keyframe_interval=3,
+    )
+    bodies = []
+    for day in range(1, 5):
+        adapter._body = page.format(day=day).encode()
+        bodies.append(adapter._body)
+        engine.run_once()
+    versions = engine.list_versions("ICCAT")
+    [hunk] = engine.text_changes(versions[0].document_id, 3)
+    assert engine.text_changes(versions[0].document_id, 1) is None
+    engine.close()
+
+    assert [v.version_number for v in versions] == [1, 2, 3, 4]
+    reader = segment_reader(tmp_path / "rfmo")
+    assert [reader.read_bytes(v.stored_path) for v in versions] == bodies
+    assert [reader.delta(v.extracted_text_path).depth for v in versions[1:]] == [1, 2, 0]
+    if backend == "directory":
+        assert [Path(v.extracted_text_path).exists() for v in versions] == [True, False, False, True]
+    assert "Updated 3 March 2026" in reader.read_text(versions[2].extracted_text_path)
+    assert (hunk.removed, hunk.added) == (["Updated 2 March 2026"], ["Updated 3 March 2026"])
+
+
+def test_docx_stored_with_legacy_text_gets_one_new_version_when_next_parsed(tmp_path, monkeypatch) -> None:
+    docx = BytesIO()
+    with zipfile.ZipFile(docx, "w") as zf:
+        zf.writestr(
+            "word/document.xml",
+            '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"><w:body>'
+            "<w:p><w:r><w:t>Resolution 2024/01</w:t></w:r></w:p><w:p><w:r><w:t>FAD closure in July</w:t></w:r></w:p>"
+            "</w:body></w:document>",
+        )
+    adapter = _FakeAdapter(body=docx.getvalue(), content_type="application/vnd.openxmlformats-officedocument.wordprocessingml.document")
+    engine = IngestionEngine(
+        db_path=str(tmp_path / "ingest.db"),
+        storage_root=str(tmp_path / "rfmo"),
+        adapters=_Registry(adapter),  # type: ignore[arg-type]
+    )
+    with monkeypatch.context() as legacy:
+        # The regex extractor this replaced joined all document text with single spaces.
+        legacy.setattr(services, "iter_docx_text", lambda body: iter(["Resolution 2024/01 FAD closure in July"]))
+        legacy.setattr(engine.parser, "parse_key", lambda raw: "legacy")
+        engine.run_once()
+
+    unchanged = engine.run_once()
+    [ref] = _FakeAdapter.list_documents(adapter)
+    adapter.list_documents = lambda: [ref.model_copy(update={"title_hint": "CMM 2024-01 (corrected title)"})]
+    reparsed = engine.run_once()
+    settled = engine.run_once()
+
+    # Identical bytes and metadata are skipped before parsing, so the legacy text stays current until
+    # the document is next parsed; that parse records one version with the new line-per-paragraph text.
+    assert (unchanged.metrics.documents_unchanged_unparsed, unchanged.metrics.documents_ingested) == (1, 0)
+    assert (reparsed.metrics.documents_ingested, reparsed.metrics.parse_cache_hits) == (1, 0)
+    assert settled.metrics.documents_ingested == 0
+    versions = engine.list_versions("ICCAT")
+    assert len(versions) == 2 and versions[0].content_hash != versions[1].content_hash
+    assert ArtifactReader().read_text(versions[1].extracted_text_path) == "Resolution 2024/01\nFAD closure in July"
+
+
+def test_parse_pool_parses_spooled_docx_out_of_process(tmp_path) -> None:
+    docx = BytesIO()
+    with zipfile.ZipFile(docx, "w") as zf:
+        zf.writestr(
+            "word/document.xml",
+            '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"><w:body><w:p><w:r><w:t>Resolution 2024/01 on FAD closures</w:t></w:r></w:p></w:body></w:document>',
+        )
+    adapter = _SpooledAdapter(body=docx.getvalue(), content_type="application/vnd.openxmlformats-officedocument.wordprocessingml.document")
+    engine = IngestionEngine(
+        db_path=str(tmp_path / "ingest.db"),
+        storage_root=str(tmp_path / "rfmo"),
+        adapters=_Registry(adapter),  # type: ignore[arg-type]
+        parse_workers=1,
+    )
+    try:
+        result = engine.run_once()
+    finally:
+        engine.close()
+
+    assert result.metrics.documents_ingested == 1
+    assert set(result.metrics.parse_cpu_seconds) == {"docx"}
+    versions = engine.list_versions("ICCAT")
+    assert "Resolution 2024/01 on FAD closures" in Path(versions[0].extracted_text_path or "").read_text()
+
+
+def test_parse_timeout_quarantines_document_until_bytes_change(tmp_path) -> None:
+    adapter = _SpooledAdapter(body=b"%PDF-1.4 stalls the parser", content_type="application/pdf")
+    engine = IngestionEngine(
+        db_path=str(tmp_path / "ingest.db"),
+        storage_root=str(tmp_path / "rfmo"),
+        adapters=_Registry(adapter),  # type: ignore[arg-type]
+        parse_workers=1,
+        # Shorter than a spawned worker's startup, so every parse times out.
+        parse_timeout_seconds=0.01,
+    )
+    try:
+        first = engine.run_once()
+        second = engine.run_once()
+    finally:
+        engine.close()
+
+    assert first.metrics.parse_failures == 1
+    assert first.metrics.documents_ingested == 0
+    [record] = engine.store.list_quarantine()
+    assert record.source_url == "https://example.org/doc1"
+    assert "killed" in record.reason
+    assert second.metrics.documents_quarantined == 1
+    assert second.metrics.parse_failures == 0
+
+
+def test_concurrent_mode_ingests_all_documents(tmp_path) -> None:
+    urls = [f"https://host{i % 4}.example.org/doc{i}" for i in range(12)]
+    adapter = _MultiHostAdapter(urls)
+    engine = IngestionEngine(
+        db_path=str(tmp_path / "ingest.db"),
+        storage_root=str(tmp_path / "rfmo"),
+        adapters=_Registry(adapter),  # type: ignore[arg-type]
+        max_workers=4,
+    )
+
+    result = engine.run_once()
+
+    assert adapter.max_in_flight > 1
+    assert result.metrics.documents_discovered == 12
+    assert result.metrics.documents_fetched == 12
+    assert result.metrics.documents_ingested == 12
+    assert engine.metrics.snapshot()["rfmo_documents_ingested_total"] == 12.0
+    assert len(engine.list_versions("ICCAT")) == 12
+    assert result.source_health[0].consecutive_failures == 0
+
+
+def test_host_rate_limiter_spaces_same_host_only() -> None:
+    limiter = HostRateLimiter(min_interval_seconds=0.2)
+
+    started = time.monotonic()
+    limiter.wait("https://cmm.wcpfc.int/a")
+    limiter.wait("https://circs.wcpfc.int/b")
+    different_hosts = time.monotonic() - started
+    limiter.wait("https://cmm.wcpfc.int/c")
+    same_host = time.monotonic() - started
+
+    assert different_hosts < 0.1
+    assert same_host >= 0.19
+
+
+def test_host_rate_limiter_backs_off_on_throttle_and_recovers() -> None:
+    limiter = HostRateLimiter(min_interval_seconds=0.1)
+    url = "https://cmm.wcpfc.int/a"
+
+    limiter.record_throttle(url, retry_after_seconds=2.0)
+    assert limiter.current_rate(url) == 5.0
+    assert limiter.reserve(url) >= 1.9
+    assert limiter.reserve("https://www.iotc.org/b") == 0.0
+
+    for _ in range(100):
+        limiter.record_success(url)
+    assert limiter.current_rate(url) == 20.0
+    assert limiter.stats() == {"throttled": 1}
+
+
+def test_html_adapter_classifies_fetch_errors() -> None:
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):  # noqa: N802
+            self.send_response(429 if self.path == "/busy" else 404)
+            self.send_header("Retry-After", "3")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        def log_message(self, format, *args):
+            return
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    limiter = HostRateLimiter(min_interval_seconds=0.01)
+    adapter = HtmlRFMOAdapter(
+        name="test",
+        rfmo="ICCAT",
+        category_indexes={},
+        user_agent="test-agent",
+        respect_robots=False,
+        rate_limiter=limiter,
+    )
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    try:
+        with pytest.raises(PermanentFetchError):
+            adapter.fetch_document(DocumentRef(rfmo="ICCAT", source_url=f"{base}/missing", document_type=DocumentCategory.other))
+        with pytest.raises(RetryableFetchError) as busy:
+            adapter.fetch_document(DocumentRef(rfmo="ICCAT", source_url=f"{base}/busy", document_type=DocumentCategory.other))
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert busy.value.retry_after_seconds == 3.0
+    assert limiter.reserve(f"{base}/next") > 2.0
+
+
+def test_concurrent_retries_are_scheduled_and_permanent_failures_skip_backoff(tmp_path) -> None:
+    urls = ["https://a.example.org/busy", "https://a.example.org/gone", "https://b.example.org/ok"]
+    adapter = _FlakyAdapter(urls)
+    engine = IngestionEngine(
+        db_path=str(tmp_path / "ingest.db"),
+        storage_root=str(tmp_path / "rfmo"),
+        adapters=_Registry(adapter),  # type: ignore[arg-type]
+        max_workers=2,
+    )
+    engine.fetcher.retry_policy = RetryPolicy(max_attempts=3, backoff_seconds=30.0, max_backoff_seconds=0.2)
+
+    started = time.monotonic()
+    result = engine.run_once()
+
+    assert time.monotonic() - started < 5
+    assert adapter.attempts == {urls[0]: 2, urls[1]: 1, urls[2]: 1}
+    assert result.metrics.documents_ingested == 2
+    assert result.metrics.fetch_retries == 1
+    assert result.metrics.failures == 1
+    assert any("HTTP 404" in error for error in result.errors)
+
+
+def test_sequential_retries_do_not_hold_up_other_documents(tmp_path) -> None:
+    urls = ["https://a.example.org/busy", "https://a.example.org/one", "https://b.example.org/two"]
+    adapter = _FlakyAdapter(urls)
+    fetched: list[tuple[str, float]] = []
+    fetch_document = adapter.fetch_document
+
+    def record(ref: DocumentRef) -> RawDocument:
+        fetched.append((ref.source_url, time.monotonic()))
+        return fetch_document(ref)
+
+    adapter.fetch_document = record  # type: ignore[method-assign]
+    engine = IngestionEngine(
+        db_path=str(tmp_path / "ingest.db"),
+        storage_root=str(tmp_path / "rfmo"),
+        adapters=_Registry(adapter),  # type: ignore[arg-type]
+    )
+    engine.fetcher.retry_policy = RetryPolicy(max_attempts=3, backoff_seconds=0.5, max_backoff_seconds=0.5)
+
+    started = time.monotonic()
+    result = engine.run_once()
+
+    assert [url for url, _ in fetched] == [urls[0], urls[1], urls[2], urls[0]]
+    assert fetched[2][1] - started < 0.4
+    assert fetched[3][1] - fetched[0][1] >= 0.5
+    assert result.metrics.documents_ingested == 3
+    assert result.metrics.fetch_retries == 1
+
+
+def test_unchanged_index_page_reuses_cached_refs(tmp_path) -> None:
+    requests: list[str | None] = []
+    index_html = (
+        b'<html><body><a href="/docs/CMM-2024-03.pdf">CMM 2024-03 Tropical tuna measure</a>'
+        b" shall enter into force on 2024-06-01</body></html>"
+    )
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):  # noqa: N802
+            requests.append(self.headers.get("If-None-Match"))
+            if self.headers.get("If-None-Match") == '"idx1"':
+                self.send_response(304)
+                self.end_headers()
+                return
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html")
+            self.send_header("ETag", '"idx1"')
+            self.send_header("Content-Length", str(len(index_html)))
+            self.end_headers()
+            self.wfile.write(index_html)
+
+        def log_message(self, format, *args):
+            return
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        index_url = f"http://127.0.0.1:{server.server_address[1]}/index"
+        adapter = HtmlRFMOAdapter(
+            name="test",
+            rfmo="WCPFC",
+            category_indexes={DocumentCategory.conservation_management_measures: [index_url]},
+            user_agent="test-agent",
+            min_request_interval_seconds=0.0,
+            respect_robots=False,
+        )
+        adapter.bind_index_cache(SQLiteStore(db_path=str(tmp_path / "ingest.db")))
+        first = adapter.list_documents()
+        first_counts = adapter.last_scan_counts()
+        second = adapter.list_documents()
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert requests == [None, '"idx1"']
+    assert [r.source_url for r in first] == [index_url.replace("/index", "/docs/CMM-2024-03.pdf")]
+    replayed = {"discovered_at"}
+    assert [r.model_dump(exclude=replayed) for r in second] == [r.model_dump(exclude=replayed) for r in first]
+    assert [(r.from_cache, r.discovered_at > first[0].discovered_at) for r in second] == [(True, True)]
+    assert first_counts[:2] == (1, 0)
+    assert first_counts.links_per_second > 0
+    assert adapter.last_scan_counts() == (0, 0, 0.0)
+    assert adapter.last_index_stats() == {"indexes_unchanged": 1}
+
+
+def test_refs_from_an_unchanged_index_are_only_fetched_until_stored(tmp_path) -> None:
+    fetched: list[str] = []
+    index_html = (
+        b'<html><body><a href="/docs/CMM-2024-03.pdf">CMM 2024-03 Tropical tuna measure</a>'
+        b' <a href="/docs/CMM-2024-04.pdf">CMM 2024-04 Observer coverage measure</a></body></html>'
+    )
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):  # noqa: N802
+            if self.path == "/index":
+                if self.headers.get("If-None-Match") == '"idx1"':
+                    self.send_response(304)
+                    self.end_headers()
+                    return
+                body, content_type = index_html, "text/html"
+            else:
+                fetched.append(self.path)
+                if self.path.endswith("04.pdf") and fetched.count(self.path) == 1:
+                    self.send_response(404)
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+                body, content_type = f"<html><body>{self.path}</body></html>".encode(), "text/html"
+            self.send_response(200)
+            self.send_header("Content-Type", content_type)
+            self.send_header("ETag", '"idx1"' if self.path == "/index" else f'"{self.path}"')
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            return
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        adapter = HtmlRFMOAdapter(
+            name="test",
+            rfmo="WCPFC",
+            category_indexes={
+                DocumentCategory.conservation_management_measures: [f"http://127.0.0.1:{server.server_address[1]}/index"]
+            },
+            user_agent="test-agent",
+            min_request_interval_seconds=0.0,
+            respect_robots=False,
+        )
+        engine = IngestionEngine(
+            db_path=str(tmp_path / "ingest.db"),
+            storage_root=str(tmp_path / "rfmo"),
+            adapters=_Registry(adapter),  # type: ignore[arg-type]
+        )
+        first = engine.run_once()
+        second = engine.run_once()
+        third = engine.run_once()
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert (first.metrics.documents_ingested, first.metrics.failures) == (1, 1)
+    # The stored document is not fetched again; the one that failed is retried from the cached refs.
+    assert fetched == ["/docs/CMM-2024-03.pdf", "/docs/CMM-2024-04.pdf", "/docs/CMM-2024-04.pdf"]
+    assert (second.metrics.index_pages_unchanged, second.metrics.index_refs_skipped) == (1, 1)
+    assert second.metrics.documents_ingested == 1
+    assert (third.metrics.index_refs_skipped, third.metrics.documents_fetched) == (2, 0)
+
+
 def test_metrics_endpoint_exposes_counters(tmp_path) -> None:
     adapter = _FakeAdapter(body=b"<html><body>metrics</body></html>")
     engine = IngestionEngine(
@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+from datetime import date
+
+import pytest
+
+from rfmo_ingest_pipeline.entities import best_entity, extract_entities, first_entity, iter_entities
+
+
+def test_single_scan_reports_every_kind_with_offsets() -> None:
+    text = "Resolution 2024-01 adopted at IOTC-2024 on 12 March 2024; report due 2024-06-30. See Circular CL-23."
+    entities = extract_entities(text)
+
+    assert [entity.kind for entity in entities] == [
+        "policy_id",
+        "document_number",
+        "meeting_reference",
+        "date",
+        "date",
+        "due_date",
+        "policy_id",
+    ]
+    assert first_entity(entities, "document_number").value == "2024-01"
+    assert first_entity(entities, "meeting_reference").value == "IOTC-2024"
+    due = first_entity(entities, "due_date")
+    assert due.value == date(2024, 6, 30)
+    assert text[due.start : due.end] == "2024-06-30"
+    assert [entity.confidence for entity in entities if entity.kind == "policy_id"] == [0.9, 0.7]
+
+
+def test_best_date_prefers_iso_then_day_month_year_then_long_form() -> None:
+    text = "Published 5 May 2023, revised 07/08/2023, final 2023-09-01"
+
+    assert best_entity(iter_entities(text, ("date",)), "date").value == date(2023, 9, 1)
+    assert best_entity(iter_entities(text[:40], ("date",)), "date").value == date(2023, 8, 7)
+    assert best_entity(iter_entities(text, ("date",)), "date", min_start=40).value == date(2023, 9, 1)
+    # Suffixes of a match ("2/03/2026" inside "12/03/2026") and invalid dates are not candidates.
+    assert [entity.value for entity in iter_entities("12/03/2026 31/02/2026", ("date",))] == [date(2026, 3, 12)]
+
+
+def test_due_date_needs_a_nearby_cue_without_digits_between() -> None:
+    assert first_entity(iter_entities("Please submit your reports by 12/03/2026.", ("due_date",)), "due_date").value == date(
+        2026, 3, 12
+    )
+    assert extract_entities("Deadline for the 3 annual reports 2026-03-12", ("due_date",)) == []
+    assert extract_entities("Deadline is set out in the circular attached, 2026-03-12", ("due_date",)) == []
+    assert extract_entities("Published 2026-03-12", ("due_date",)) == []
+
+
+def test_unknown_kind_is_rejected() -> None:
+    with pytest.raises(ValueError):
+        extract_entities("text", ("vessel",))
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+from rfmo_ingest_pipeline.html_text import index_anchors, visible_text
+
+
+def test_drops_boilerplate_and_keeps_block_boundaries() -> None:
+    html = """
+    <html><head><style>p { color: red }</style><script>var s = "<p>not text</p>";</script></head>
+    <body>
+      <header><h1>Site header</h1></header>
+      <nav><ul><li>Home</li><li>About</li></ul></nav>
+      <h1>CMM 2024-01</h1>
+      <p>Conservation and <b>Management</b> Measure for&nbsp;bigeye &amp; yellowfin.</p>
+      <table><tr><td>Entry</td><td>into force</td></tr></table>
+      <footer>Copyright</footer>
+    </body></html>
+    """
+
+    assert visible_text(html) == "CMM 2024-01\nConservation and Management Measure for bigeye & yellowfin.\nEntry into force"
+
+
+def test_tolerates_malformed_markup() -> None:
+    html = (
+        "<div>Quota a < b and 5 > 3<p>Unclosed paragraph"
+        "<nav>menu <span>nested<nav>inner</nav> still menu</nav>"
+        "<p attr='x'>After nav<br/>next line</div><!-- comment"
+    )
+
+    assert visible_text(html) == "Quota a < b and 5 > 3\nUnclosed paragraph\nAfter nav\nnext line"
+
+
+def test_unclosed_boilerplate_ends_at_body_close() -> None:
+    html = "<body><p>Kept</p><footer>never closed</body><p>tail</p>"
+
+    assert visible_text(html) == "Kept\ntail"
+
+
+def test_index_anchors_cleans_text_and_maps_context() -> None:
+    html = (
+        "<table><tr><td>CMM 2023-01</td><td>Bigeye &amp; yellowfin measure</td>"
+        "<td><a href='/cmm-2023-01.pdf' title='Full text'>PDF <b>207 KB</b></a></td></tr></table>"
+        "<script>document.write('<a href=\"/fake.pdf\">fake</a>');</script>"
+        "<a href=\"/next?a=1&amp;b=2\">Next</a>"
+    )
+
+    index = index_anchors(html)
+
+    assert [(anchor.href, anchor.text) for anchor in index.anchors] == [
+        ("/cmm-2023-01.pdf", "PDF 207 KB"),
+        ("/next?a=1&b=2", "Next"),
+    ]
+    first, second = index.anchors
+    assert index.context(first) == "CMM 2023-01 Bigeye & yellowfin measure PDF 207 KB Next"
+    assert "Full text" in index.context(second)
@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+from rfmo_ingest_pipeline.connectors import CANDIDATE_KEYWORDS
+from rfmo_ingest_pipeline.keywords import KeywordMatcher
+
+
+def test_matcher_reports_every_category_in_table_order() -> None:
+    matcher = KeywordMatcher(
+        {
+            "quota": ("Allocated catch limits", "catch limit", "quota"),
+            "meeting": ("meeting", "review of cmm"),
+            "reporting": ("reporting",),
+        }
+    )
+
+    assert matcher.categories("the commission meeting adopted new catch limits") == {"quota", "meeting"}
+    assert matcher.categories("nothing relevant here") == set()
+    assert matcher.categories("quota and meeting", stop_on=("quota",)) == {"quota"}
+
+
+def test_candidate_keywords_cover_link_filter_signals() -> None:
+    lowered = "https://example.org/cmm-2024-01.pdf cmm 2024-01 members shall report catch limits"
+
+    assert CANDIDATE_KEYWORDS.categories(lowered) == {"policy", "compliance", "document_extension"}
+    assert CANDIDATE_KEYWORDS.categories("press release on quota.pdf", stop_on=("exclude",)) == {"exclude"}
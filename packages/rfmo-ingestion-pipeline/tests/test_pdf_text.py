@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+import sys
+from io import BytesIO
+
+from pypdf.generic import StreamObject
+
+from rfmo_ingest_pipeline import services
+from rfmo_ingest_pipeline.pdf_text import PdfBudget, PdfTextStats, iter_pdf_text
+from rfmo_ingest_pipeline.models import ParsedDocument, RawDocument
+from rfmo_ingest_pipeline.ocr import PdfOcr
+from rfmo_ingest_pipeline.services import ParseService
+from rfmo_ingest_pipeline.store import SQLiteStore
+
+
+class _StubOcrBackend:
+    name = "stub"
+
+    def __init__(self) -> None:
+        self.calls: list[int] = []
+
+    def available(self) -> bool:
+        return True
+
+    def ocr_page(self, pdf_path: str, page_number: int) -> str:
+        self.calls.append(page_number)
+        return f"  scanned page\n{page_number} "
+
+
+def _pdf(pages: list[str]) -> bytes:
+    return _pdf_from_streams([f"BT /F1 12 Tf 72 720 Td ({text}) Tj ET".encode() for text in pages])
+
+
+def _pdf_from_streams(streams: list[bytes]) -> bytes:
+    count = len(streams)
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [" + b" ".join(f"{4 + 2 * i} 0 R".encode() for i in range(count)) + b"] /Count "
+        + str(count).encode() + b" >>",
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    for i, stream in enumerate(streams):
+        objects.append(
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] /Resources << /Font << /F1 3 0 R >> >> "
+            f"/Contents {5 + 2 * i} 0 R >>".encode()
+        )
+        objects.append(b"<< /Length " + str(len(stream)).encode() + b" >>\nstream\n" + stream + b"\nendstream")
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += f"{number} 0 obj\n".encode() + body + b"\nendobj\n"
+    xref = len(out)
+    out += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode()
+    out += b"".join(f"{offset:010d} 00000 n \n".encode() for offset in offsets)
+    out += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n".encode()
+    return bytes(out)
+
+
+def test_iter_pdf_text_streams_normalized_pages() -> None:
+    stats = PdfTextStats()
+    pieces = list(iter_pdf_text(BytesIO(_pdf(["CMM   2024-01", "Members shall report", "Annex"])), stats=stats))
+
+    assert "".join(pieces) == "CMM 2024-01 Members shall report Annex"
+    assert len(pieces) == 3
+    assert stats.parser_info() == {"pages_total": 3, "pages_extracted": 3, "truncated": False, "truncated_by": None}
+
+
+def test_pdf_budgets_truncate_and_are_reported() -> None:
+    body = _pdf([f"Page {i} text" for i in range(1, 6)])
+
+    text, info = ParseService(pdf_budget=PdfBudget(max_pages=2)).parse_binary("pdf", BytesIO(body))
+    assert text == "Page 1 text Page 2 text"
+    assert info["pages_total"] == 5
+    assert info["pages_extracted"] == 2
+    assert info["truncated_by"] == "max_pages"
+
+    text, info = ParseService(pdf_budget=PdfBudget(max_chars=15)).parse_binary("pdf", BytesIO(body))
+    assert text == "Page 1 text Pag"
+    assert info["truncated_by"] == "max_chars"
+
+    text, info = ParseService(pdf_budget=PdfBudget(max_seconds=0)).parse_binary("pdf", BytesIO(body))
+    assert info["pages_extracted"] == 0
+    assert info["truncated_by"] == "max_seconds"
+
+
+def test_pdf_without_text_layer_is_ocred_and_cached_per_page(tmp_path) -> None:
+    store = SQLiteStore(str(tmp_path / "ocr.db"))
+    # Line drawings stand in for scanned page images: no text layer, distinct page content.
+    scan = _pdf_from_streams([f"0 0 m {10 * i} 10 l S".encode() for i in range(1, 4)])
+    raw = RawDocument(source_url="https://example.org/circular.pdf", status_code=200, content_type="application/pdf", body=scan)
+
+    first_backend = _StubOcrBackend()
+    parsed = ParseService(ocr=PdfOcr(first_backend, cache=store)).parse(raw, ParsedDocument())
+    assert parsed.extracted_text == "scanned page 1 scanned page 2 scanned page 3"
+    assert parsed.parser_info["ocr_used"] is True
+    assert sorted(first_backend.calls) == [1, 2, 3]
+
+    # A re-issued scan with one changed page only OCRs that page.
+    rescan = _pdf_from_streams([f"0 0 m {10 * i} 10 l S".encode() for i in (1, 2, 9)])
+    raw = raw.model_copy(update={"body": rescan})
+    second_backend = _StubOcrBackend()
+    parsed = ParseService(ocr=PdfOcr(second_backend, cache=store)).parse(raw, ParsedDocument())
+    assert second_backend.calls == [3]
+    assert parsed.parser_info["ocr_pages_cached"] == 2
+
+
+def test_ocr_hashes_stored_page_streams_and_stops_at_max_pages(monkeypatch) -> None:
+    scan = _pdf_from_streams([f"0 0 m {10 * i} 10 l S".encode() for i in range(1, 6)])
+    raw = RawDocument(source_url="https://example.org/scan.pdf", status_code=200, content_type="application/pdf", body=scan)
+
+    def decode(self):
+        raise AssertionError("page streams must not be decoded to be hashed")
+
+    monkeypatch.setattr(StreamObject, "get_data", decode)
+    backend = _StubOcrBackend()
+    text, info = PdfOcr(backend, max_pages=2).extract(raw)
+
+    assert text == "scanned page 1 scanned page 2"
+    assert info["ocr_pages"] == 2
+    assert sorted(backend.calls) == [1, 2]
+
+
+def test_missing_pypdf_is_reported_without_masking_other_import_errors(monkeypatch) -> None:
+    body = _pdf(["Page 1 text"])
+
+    def broken(*args, **kwargs):
+        raise ImportError("cannot import name 'decompress'", name="pypdf.filters")
+        yield
+
+    with monkeypatch.context() as patched:
+        patched.setattr(services, "iter_pdf_text", broken)
+        _, info = ParseService().parse_binary("pdf", BytesIO(body))
+    assert info["error"] == "cannot import name 'decompress'"
+
+    monkeypatch.setitem(sys.modules, "pypdf", None)
+    text, info = ParseService().parse_binary("pdf", BytesIO(body))
+    assert (text, info["error"]) == ("", "pypdf_not_available")
+
+
+def test_stored_extraction_is_reused_only_under_the_same_pdf_budget() -> None:
+    body = _pdf([f"Page {i} text" for i in range(1, 4)])
+    raw = RawDocument(source_url="https://example.org/cmm.pdf", status_code=200, content_type="application/pdf", body=body)
+    stored = ParseService().parse(raw, ParsedDocument(), file_hash=raw.body_sha256())
+
+    reused = ParseService().parse(raw, ParsedDocument(), file_hash=raw.body_sha256(), stored=lambda: stored)
+    budgeted = ParseService(pdf_budget=PdfBudget(max_pages=1)).parse(
+        raw, ParsedDocument(), file_hash=raw.body_sha256(), stored=lambda: stored
+    )
+
+    assert reused.parse_cache_hit and reused.extracted_text == stored.extracted_text
+    assert not budgeted.parse_cache_hit
+    assert budgeted.extracted_text == "Page 1 text"
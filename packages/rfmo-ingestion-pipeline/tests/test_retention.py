@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+import os
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+
+from rfmo_ingest_pipeline.models import (
+    DocumentCategory,
+    DocumentRecord,
+    DocumentRef,
+    DocumentVersionRecord,
+    ParsedDocument,
+    RawDocument,
+    RetentionPolicy,
+)
+from rfmo_ingest_pipeline.retention import RetentionJob, plan_retention
+from rfmo_ingest_pipeline.segments import SegmentStorage
+from rfmo_ingest_pipeline.services import ArtifactStorage, MetricsRegistry, sha256_hex
+from rfmo_ingest_pipeline.store import SQLiteStore
+
+
+NOW = datetime(2026, 6, 1, tzinfo=timezone.utc)
+CLAUSES = "".join(f"Clause {index}: vessels shall report catches monthly.\n" for index in range(40))
+
+
+def _storage(backend: str, root: Path) -> ArtifactStorage | SegmentStorage:
+    if backend == "segments":
+        return SegmentStorage(str(root), max_segment_bytes=1)
+    return ArtifactStorage(str(root))
+
+
+def _ingest(store, storage, document: DocumentRecord, texts: list[tuple[str, str, int]]) -> list[DocumentVersionRecord]:
+    # texts: (extracted text, page footer, age in days) per version; the footer only changes the raw page.
+    versions: list[DocumentVersionRecord] = []
+    for number, (text, footer, age) in enumerate(texts, start=1):
+        body = f"<html><body>{text}<footer>{footer}</footer></body></html>".encode()
+        raw = RawDocument(source_url=document.source_url, status_code=200, content_type="text/html", body=body)
+        parsed = ParsedDocument(publication_date=date(2026, 1, 1), extracted_text=text, snapshot_html=body.decode())
+        previous = versions[-1] if versions else None
+        stored = storage.persist(document, number, raw, parsed, {"version": number}, previous=previous)
+        version = DocumentVersionRecord(
+            document_id=document.id,
+            version_number=number,
+            file_hash=raw.body_sha256(),
+            content_hash=sha256_hex(text),
+            stored_path=stored.raw_path,
+            extracted_text_path=stored.extracted_path,
+            snapshot_html_path=stored.snapshot_path,
+            metadata_path=stored.metadata_path,
+            created_at=NOW - timedelta(days=age),
+        )
+        store.create_version(version, document)
+        versions.append(version)
+    return versions
+
+
+def _document(store: SQLiteStore, url: str) -> DocumentRecord:
+    return store.upsert_document_discovered(
+        DocumentRef(rfmo="WCPFC", source_url=url, document_type=DocumentCategory.conservation_management_measures)
+    )
+
+
+def test_plan_collapses_old_metadata_only_versions_and_keeps_last() -> None:
+    def version(number: int, content: str, age: int) -> DocumentVersionRecord:
+        return DocumentVersionRecord(
+            document_id="d",
+            version_number=number,
+            file_hash=f"f{number}",
+            content_hash=content,
+            stored_path="raw.html",
+            extracted_text_path="extracted.txt",
+            metadata_path="metadata.json",
+            created_at=NOW - timedelta(days=age),
+        )
+
+    versions = [version(1, "a", 90), version(2, "a", 80), version(3, "b", 70), version(4, "b", 5), version(5, "b", 60)]
+
+    collapse = RetentionPolicy(metadata_only_max_age_days=30)
+    assert [v.version_number for v in plan_retention(versions, collapse, NOW)] == [2]
+    assert [v.version_number for v in plan_retention(versions, RetentionPolicy(keep_last=2), NOW)] == [1, 2, 3]
+    assert plan_retention(versions[:1], RetentionPolicy(keep_last=1), NOW) == []
+
+
+@pytest.mark.parametrize("backend", ["directory", "segments"])
+def test_retention_deletes_rows_and_artifacts_and_keeps_deltas_readable(tmp_path, backend) -> None:
+    store = SQLiteStore(str(tmp_path / "ingest.db"))
+    storage = _storage(backend, tmp_path / "rfmo")
+    document = _document(store, "https://www.wcpfc.int/cmm-2024-01")
+    texts = [
+        (CLAUSES + "Catch limit 100 t\n", "Updated 1 May", 90),
+        (CLAUSES + "Catch limit 100 t\n", "Updated 2 May", 80),
+        (CLAUSES + "Catch limit 120 t\n", "Updated 3 May", 70),
+        (CLAUSES + "Catch limit 120 t\n", "Updated 4 May", 5),
+        (CLAUSES + "Catch limit 150 t\n", "Updated 5 May", 1),
+    ]
+    versions = _ingest(store, storage, document, texts)
+    reader = storage.reader()
+    assert reader.delta(versions[2].extracted_text_path).depth == 2
+    bodies = [reader.read_bytes(v.stored_path) for v in versions]
+    metrics = MetricsRegistry()
+
+    job = RetentionJob(store, storage, RetentionPolicy(metadata_only_max_age_days=30), workers=2, metrics=metrics)
+    collapsed = job.run(now=NOW)
+
+    assert (collapsed.versions_deleted, collapsed.versions_rebased, collapsed.completed) == (1, 1, True)
+    assert collapsed.bytes_reclaimed > 0
+    assert [v.version_number for v in store.list_document_versions(document.id)] == [1, 3, 4, 5]
+    assert not reader.exists(versions[1].extracted_text_path)
+    [hunk] = reader.changes(versions[2].extracted_text_path)
+    assert (hunk.removed, hunk.added) == (["Catch limit 100 t"], ["Catch limit 120 t"])
+    assert [reader.read_bytes(versions[i].stored_path) for i in (0, 2, 3, 4)] == [bodies[i] for i in (0, 2, 3, 4)]
+
+    trimmed = RetentionJob(store, storage, RetentionPolicy(keep_last=2), metrics=metrics).run(now=NOW)
+
+    assert trimmed.versions_deleted == 2
+    assert [v.version_number for v in store.list_document_versions(document.id)] == [4, 5]
+    assert reader.read_text(versions[3].extracted_text_path) == texts[3][0]
+    assert reader.read_text(versions[4].extracted_text_path) == texts[4][0]
+    assert reader.changes(versions[3].extracted_text_path) is None
+    snapshot = metrics.snapshot()
+    assert snapshot["rfmo_retention_versions_deleted_total"] == 3
+    assert snapshot["rfmo_retention_bytes_reclaimed_total"] == collapsed.bytes_reclaimed + trimmed.bytes_reclaimed
+    if backend == "directory":
+        assert sorted(p.name for p in Path(versions[4].metadata_path).parents[1].iterdir()) == ["v4", "v5"]
+        blobs = [path for path in (tmp_path / "rfmo" / "blobs").rglob("*") if path.is_file()]
+        assert blobs and all(path.stat().st_nlink > 1 for path in blobs)
+    storage.close()
+
+
+def test_retention_runs_incrementally_from_a_cursor(tmp_path) -> None:
+    store = SQLiteStore(str(tmp_path / "ingest.db"))
+    storage = ArtifactStorage(str(tmp_path / "rfmo"))
+    for url in ("https://a.example.org/doc", "https://b.example.org/doc", "https://c.example.org/doc"):
+        _ingest(store, storage, _document(store, url), [("one\n", "x", 10), ("two\n", "y", 5)])
+    job = RetentionJob(store, storage, RetentionPolicy(keep_last=1))
+
+    first = job.run(max_documents=2, now=NOW)
+    second = job.run(max_documents=2, now=NOW)
+
+    assert (first.documents_scanned, first.versions_deleted, first.completed) == (2, 2, False)
+    assert (second.documents_scanned, second.versions_deleted, second.completed) == (1, 1, True)
+    assert job.run(dry_run=True, now=NOW).versions_deleted == 0
+
+
+def test_retention_prunes_blobs_held_through_reference_files(tmp_path, monkeypatch) -> None:
+    blob_root = tmp_path / "rfmo" / "blobs"
+    real_link = os.link
+
+    def link(src, dst):
+        if blob_root not in Path(dst).parents:
+            raise OSError("cross-device link")
+        return real_link(src, dst)
+
+    monkeypatch.setattr(os, "link", link)
+    store = SQLiteStore(str(tmp_path / "ingest.db"))
+    storage = ArtifactStorage(str(tmp_path / "rfmo"))
+    document = _document(store, "https://www.wcpfc.int/cmm-2024-02")
+    versions = _ingest(store, storage, document, [("Catch limit 100 t\n", "a", 10), ("Quota table withdrawn\n", "b", 5)])
+    assert not any(blob_root.parent.rglob("raw.html"))
+    blobs_before = {path: path.stat().st_size for path in blob_root.rglob("*") if path.is_file()}
+
+    stats = RetentionJob(store, storage, RetentionPolicy(keep_last=1)).run(now=NOW)
+
+    blobs_after = {path for path in blob_root.rglob("*") if path.is_file()}
+    freed_blobs = sum(size for path, size in blobs_before.items() if path not in blobs_after)
+    assert freed_blobs > 0
+    assert stats.bytes_reclaimed > freed_blobs
+    assert storage.reader().read_text(versions[1].extracted_text_path) == "Quota table withdrawn\n"
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import threading
+
+import pytest
+
+from rfmo_ingest_pipeline.robots import RobotsCache
+from rfmo_ingest_pipeline.store import SQLiteStore
+
+
+class _RobotsHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    robots_requests = 0
+
+    def do_GET(self):  # noqa: N802
+        if self.path != "/robots.txt":
+            self.send_response(404)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        type(self).robots_requests += 1
+        payload = b"User-agent: *\nDisallow: /private/\n"
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain")
+        self.send_header("Cache-Control", "max-age=3600")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        return
+
+
+@pytest.fixture
+def base_url():
+    _RobotsHandler.robots_requests = 0
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _RobotsHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_robots_cache_persists_across_instances(tmp_path, base_url) -> None:
+    store = SQLiteStore(str(tmp_path / "robots.db"))
+
+    first = RobotsCache(store=store)
+    first.prefetch([f"{base_url}/docs/a.pdf"])
+    assert first.can_fetch(f"{base_url}/docs/a.pdf")
+    assert not first.can_fetch(f"{base_url}/private/b.pdf")
+    assert first.stats() == {"hits": 2, "misses": 1, "fetch_errors": 0}
+
+    second = RobotsCache(store=store)
+    assert second.can_fetch(f"{base_url}/docs/c.pdf")
+    assert second.stats()["misses"] == 0
+    assert _RobotsHandler.robots_requests == 1
+
+    entry = store.get_robots_entry(base_url)
+    assert entry is not None
+    assert entry.expires_at - entry.fetched_at == timedelta(seconds=3600)
+
+
+def test_robots_cache_refetches_expired_entries(tmp_path, base_url) -> None:
+    store = SQLiteStore(str(tmp_path / "robots.db"))
+    RobotsCache(store=store).can_fetch(f"{base_url}/docs/a.pdf")
+
+    entry = store.get_robots_entry(base_url)
+    assert entry is not None
+    store.save_robots_entry(entry.model_copy(update={"expires_at": datetime.now(timezone.utc) - timedelta(seconds=1)}))
+
+    cache = RobotsCache(store=store)
+    assert cache.can_fetch(f"{base_url}/docs/a.pdf")
+    assert cache.stats()["misses"] == 1
+    assert _RobotsHandler.robots_requests == 2
@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+import os
+import time
+
+import pytest
+
+from rfmo_ingest_pipeline.sandbox import ParseSandbox, ParseTimeoutError, ParseWorkerCrashed
+
+
+def test_sandbox_kills_hung_and_crashed_workers_and_keeps_serving() -> None:
+    sandbox = ParseSandbox(max_workers=1, timeout_seconds=2.0)
+    try:
+        assert sandbox.submit(pow, 2, 10).result() == 1024
+
+        started = time.monotonic()
+        sandbox.timeout_seconds = 0.5
+        with pytest.raises(ParseTimeoutError):
+            sandbox.submit(time.sleep, 30).result()
+        assert time.monotonic() - started < 10
+
+        sandbox.timeout_seconds = 5.0
+        with pytest.raises(ParseWorkerCrashed):
+            sandbox.submit(os._exit, 3).result()
+        with pytest.raises(RuntimeError, match="ValueError"):
+            sandbox.submit(int, "not a number").result()
+
+        assert sandbox.submit(pow, 3, 3).result() == 27
+        assert sandbox.stats() == {"tasks": 5, "timeouts": 1, "crashes": 1, "restarts": 2}
+    finally:
+        sandbox.shutdown()
@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import threading
+from datetime import date
+
+from rfmo_ingest_pipeline.alerts import AlertGenerator
+from rfmo_ingest_pipeline.models import (
+    DocumentCategory,
+    DocumentRecord,
+    DocumentVersionRecord,
+    ParsedDocument,
+    RawDocument,
+)
+from rfmo_ingest_pipeline.segments import SegmentStorage, segment_reader
+from rfmo_ingest_pipeline.services import StoredArtifacts
+
+
+def _persist(storage: SegmentStorage, document: DocumentRecord, version: int, body: bytes, text: str):
+    raw = RawDocument(source_url=document.source_url, status_code=200, content_type="text/html", body=body)
+    parsed = ParsedDocument(
+        publication_date=date(2026, 2, 10),
+        extracted_text=text,
+        snapshot_html=body.decode("utf-8"),
+    )
+    metadata = {
+        "rfmo": document.rfmo,
+        "document_type": document.document_type.value,
+        "title": "Mandatory reporting notice",
+        "published_date": "2026-02-10",
+        "source_url": document.source_url,
+        "version": version,
+    }
+    return storage.persist(document, version, raw, parsed, metadata)
+
+
+def _version(document: DocumentRecord, stored: StoredArtifacts) -> DocumentVersionRecord:
+    return DocumentVersionRecord(
+        document_id=document.id,
+        version_number=1,
+        file_hash="",
+        stored_path=stored.raw_path,
+        extracted_text_path=stored.extracted_path,
+        metadata_path=stored.metadata_path,
+    )
+
+
+def _document(url: str) -> DocumentRecord:
+    return DocumentRecord(rfmo="IOTC", source_url=url, document_type=DocumentCategory.circular_letters)
+
+
+def test_versions_are_packed_deduplicated_and_readable_by_path_or_version(tmp_path) -> None:
+    storage = SegmentStorage(str(tmp_path), compression="gzip")
+    first, second = _document("https://iotc.org/a"), _document("https://iotc.org/b")
+    body = b"<html><body>" + b"Members shall submit reports by 12/03/2026. " * 50 + b"</body></html>"
+    text = "Members shall submit reports by 12/03/2026. " * 50
+
+    one = _persist(storage, first, 1, body, text)
+    two = _persist(storage, second, 1, body, text)
+    storage.close()
+
+    assert sorted(path.name for path in tmp_path.rglob("*") if path.is_file()) == [
+        "index.db",
+        "segment-000001.pack",
+    ]
+    assert two.logical_bytes == one.logical_bytes
+    assert 0 < two.physical_bytes < one.physical_bytes < one.logical_bytes // 5
+
+    reader = segment_reader(tmp_path)
+    assert reader.read_bytes(one.raw_path) == body
+    assert reader.read_bytes(two.snapshot_path) == body
+    assert reader.read_text(two.extracted_path) == text
+    reopened = SegmentStorage(str(tmp_path))
+    assert reopened.version_artifacts(first.id, 1) == ["extracted.txt", "metadata.json", "raw.html", "snapshot.html"]
+    with reopened.open_version_artifact(first.id, 1, "extracted.txt") as handle:
+        assert handle.read().decode("utf-8") == text
+    alerts = AlertGenerator(storage_root=str(tmp_path)).generate(days=0)
+    assert [alert["due_date"] for alert in alerts] == ["2026-03-12", "2026-03-12"]
+
+
+def test_compaction_rewrites_sparse_segments_and_export_restores_directories(tmp_path) -> None:
+    storage = SegmentStorage(str(tmp_path / "packed"), max_segment_bytes=1)
+    documents = [_document(f"https://iotc.org/{index}") for index in range(3)]
+    stored = [
+        _persist(storage, document, 1, f"<html>body {index}</html>".encode(), f"text {index}")
+        for index, document in enumerate(documents)
+    ]
+    segment_dir = tmp_path / "packed" / "segments"
+    segments_before = sorted(path.name for path in segment_dir.glob("*.pack"))
+
+    assert storage.remove_version(_version(documents[0], stored[0])) == 0
+    assert storage.version_artifacts(documents[0].id, 1) == []
+    stats = storage.compact()
+
+    assert len(segments_before) > 1
+    assert stats.segments_compacted >= 1
+    assert stats.bytes_reclaimed > 0
+    reader = storage.reader()
+    assert not reader.exists(stored[0].raw_path)
+    assert reader.read_text(stored[2].extracted_path) == "text 2"
+    assert storage.export(tmp_path / "exported") == 8
+    exported = tmp_path / "exported" / "iotc" / "2026" / documents[1].id / "v1"
+    assert (exported / "raw.html").read_bytes() == b"<html>body 1</html>"
+    assert (exported / "extracted.txt").read_text(encoding="utf-8") == "text 1"
+    storage.close()
+
+
+def test_duplicates_are_never_written_across_a_segment_rollover(tmp_path) -> None:
+    storage = SegmentStorage(str(tmp_path), max_segment_bytes=100)
+    body = b"<html><body>" + b"Vessel list amended. " * 10 + b"</body></html>"
+    first = _persist(storage, _document("https://iotc.org/small"), 1, b"<html>" + b"x" * 40 + b"</html>", "x")
+    second = _persist(storage, _document("https://iotc.org/large"), 1, body, "Vessel list amended.")
+    storage.close()
+
+    packs = sorted((tmp_path / "segments").glob("*.pack"))
+    assert sum(path.stat().st_size for path in packs) == first.physical_bytes + second.physical_bytes
+    assert all(b"\x00" not in path.read_bytes() for path in packs)
+    reader = segment_reader(tmp_path)
+    assert reader.read_bytes(second.raw_path) == body
+    assert reader.read_bytes(second.snapshot_path) == body
+
+
+def test_compaction_waits_for_readers_between_lookup_and_open(tmp_path) -> None:
+    storage = SegmentStorage(str(tmp_path), max_segment_bytes=1)
+    documents = [_document(f"https://iotc.org/{index}") for index in range(2)]
+    stored = [
+        _persist(storage, document, 1, f"<html>body {index}</html>".encode(), f"text {index}")
+        for index, document in enumerate(documents)
+    ]
+    storage.remove_version(_version(documents[0], stored[0]))
+    first_pack = tmp_path / "segments" / "segment-000001.pack"
+
+    with storage.index.open_lock:
+        # A reader that has looked up a row but not yet opened its pack.
+        compaction = threading.Thread(target=storage.compact)
+        compaction.start()
+        compaction.join(timeout=0.2)
+        assert compaction.is_alive() and first_pack.exists()
+    compaction.join()
+
+    assert not first_pack.exists()
+    with storage.open_version_artifact(documents[1].id, 1, "extracted.txt") as handle:
+        assert handle.read() == b"text 1"
+    storage.close()
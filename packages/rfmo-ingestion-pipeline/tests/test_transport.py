@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import gzip
+import hashlib
+import threading
+import zlib
+
+import pytest
+
+from rfmo_ingest_pipeline.spool import SpoolPolicy
+from rfmo_ingest_pipeline.transport import HttpTransport, TransportError
+
+
+class _KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):  # noqa: N802
+        if self.path == "/old":
+            self.send_response(301)
+            self.send_header("Location", "/doc")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        payload = f"body for {self.path}".encode("utf-8")
+        if self.path.startswith("/compressed"):
+            payload = payload * 200
+            accepted = self.headers.get("Accept-Encoding", "")
+            encoding = "gzip" if "gzip" in accepted else None
+            if self.path.endswith("/deflate") and "deflate" in accepted:
+                encoding = "deflate"
+            if encoding == "gzip":
+                payload = gzip.compress(payload)
+            elif encoding == "deflate":
+                payload = zlib.compress(payload)
+            self.send_response(200)
+            if encoding:
+                self.send_header("Content-Encoding", encoding)
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        return
+
+
+@pytest.fixture
+def base_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _KeepAliveHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_reuses_keep_alive_connections(base_url) -> None:
+    transport = HttpTransport()
+    try:
+        bodies = [transport.request(f"{base_url}/doc{i}").body for i in range(3)]
+    finally:
+        transport.close()
+
+    assert bodies == [b"body for /doc0", b"body for /doc1", b"body for /doc2"]
+    stats = transport.stats()
+    assert stats["requests"] == 3
+    assert stats["connections_opened"] == 1
+    assert stats["connections_reused"] == 2
+
+
+def test_follows_redirects(base_url) -> None:
+    transport = HttpTransport()
+    try:
+        resp = transport.request(f"{base_url}/old")
+    finally:
+        transport.close()
+
+    assert resp.status == 200
+    assert resp.body == b"body for /doc"
+
+
+def test_streams_body_to_spool_with_incremental_hash(base_url) -> None:
+    transport = HttpTransport()
+    try:
+        resp = transport.request(f"{base_url}/large", spool_policy=SpoolPolicy(memory_threshold_bytes=4, chunk_size=3))
+    finally:
+        transport.close()
+
+    assert resp.body == b""
+    assert resp.spool is not None
+    assert not resp.spool.in_memory
+    assert resp.spool.read_bytes() == b"body for /large"
+    assert resp.spool.sha256 == hashlib.sha256(b"body for /large").hexdigest()
+    resp.spool.close()
+
+
+def test_rejects_bodies_over_max_size(base_url) -> None:
+    transport = HttpTransport()
+    try:
+        with pytest.raises(TransportError):
+            transport.request(f"{base_url}/large", spool_policy=SpoolPolicy(max_body_bytes=4))
+    finally:
+        transport.close()
+
+
+def test_decodes_compressed_bodies_and_counts_bytes(base_url) -> None:
+    expected_gzip = b"body for /compressed" * 200
+    expected_deflate = b"body for /compressed/deflate" * 200
+    transport = HttpTransport()
+    try:
+        plain = transport.request(f"{base_url}/compressed")
+        spooled = transport.request(f"{base_url}/compressed/deflate", spool_policy=SpoolPolicy(chunk_size=7))
+    finally:
+        transport.close()
+
+    assert plain.body == expected_gzip
+    assert spooled.spool is not None
+    assert spooled.spool.read_bytes() == expected_deflate
+    assert spooled.spool.sha256 == hashlib.sha256(expected_deflate).hexdigest()
+    spooled.spool.close()
+
+    stats = transport.stats()
+    assert stats["connections_reused"] == 1
+    assert stats["bytes_decoded"] == len(expected_gzip) + len(expected_deflate)
+    assert stats["bytes_received"] < stats["bytes_decoded"] // 10
+
+
+def test_max_size_applies_to_decoded_body(base_url) -> None:
+    transport = HttpTransport()
+    try:
+        with pytest.raises(TransportError):
+            transport.request(f"{base_url}/compressed", spool_policy=SpoolPolicy(max_body_bytes=1024))
+    finally:
+        transport.close()